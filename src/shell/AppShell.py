@@ -1,5 +1,5 @@
 from typing import Callable, List
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtWidgets import (QStackedWidget, QFrame, QWidget)
 from PyQt6.QtWidgets import (QVBoxLayout, QApplication)
 
@@ -7,6 +7,14 @@ from src.shell.app_descriptor import AppDescriptor
 from src.shell.ui.Header import Header
 from src.shell.FolderLauncher import FolderLauncher, FolderConfig
 from src.shell.shell_config import ShellConfig
+from src.shell.clock import current_clock
+from src.shell.ui.theme import install_theme
+from src.shell.ui.material.animation_governor import animation_governor
+from src.shell.ui.styles import QTA_ICON_COLOR
+
+# Icon render size of a standard MenuIcon (half its 112px edge); folder
+# previews add their own sizes, see preview_icon_render_sizes()
+PRELOAD_ICON_SIZE = QSize(56, 56)
 
 
 class AppShell(QWidget):
@@ -20,7 +28,8 @@ class AppShell(QWidget):
         app_descriptors: List[AppDescriptor],
         widget_factory: Callable[[str], QWidget],
         ui_factory=None,
-        languages: list = None
+        languages: list = None,
+        performance_mode=None
     ):
         """
         Args:
@@ -29,6 +38,8 @@ class AppShell(QWidget):
             ui_factory: Optional UIFactory for swappable UI components (defaults to MaterialUIFactory)
             languages: Optional list of (code, display_name) tuples for language selector.
                        Defaults to [("en", "English"), ("bg", "Bulgarian")].
+            performance_mode: Optional AnimationTier (or its name, e.g. "reduced") pinning
+                       every animation; None/"auto" adapts to measured frame times.
         """
         super().__init__()
 
@@ -47,10 +58,26 @@ class AppShell(QWidget):
         self.folders_page = None  # The folders page widget
         self.pending_camera_operations = False  # Track if camera operations are in progress
         self.running_widgets = {}  # app_name -> widget
+        self._icons_preloaded = False  # preload_icons() runs once, after the first frame
 
+        if performance_mode is not None:
+            self.performance_mode = performance_mode
 
         self.setup_ui()
 
+    @property
+    def performance_mode(self):
+        """Pinned AnimationTier of every animation, or None when adapting automatically"""
+        return animation_governor().performance_mode
+
+    @performance_mode.setter
+    def performance_mode(self, mode):
+        animation_governor().set_performance_mode(mode)
+
+    def animation_report(self):
+        """Return the GovernorReport: runs per animation tier and measured frame times"""
+        return animation_governor().usage_report()
+
     def on_folder_opened(self, opened_folder):
         """Handle when a folder is opened - gray out other folders"""
         # This is now handled by the FoldersPage, but we keep it for compatibility
@@ -173,13 +200,9 @@ class AppShell(QWidget):
         self.resize(1200, 800)  # Reasonable default size
         # Center the window on screen
         self.center_on_screen()
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(248, 250, 252, 1),
-                    stop:1 rgba(241, 245, 249, 1));
-            }
-        """)
+        # Shell background and all Material widgets come from one app-wide theme
+        self.setObjectName("AppShell")
+        install_theme()
 
         # Create main layout for the window
         main_layout = QVBoxLayout(self)
@@ -260,6 +283,24 @@ class AppShell(QWidget):
         # Add the folders page to the stacked widget (index 0)
         self.stacked_widget.addWidget(self.folders_page)
 
+    def preload_icons(self):
+        """Warm the icon cache so expanded views and preview rebuilds never load lazily.
+
+        App buttons and expanded views render at the standard size, folder
+        previews in QTA_ICON_COLOR at their ResponsiveMetrics sizes. Runs once
+        after the first frame; icons on that frame render in the background.
+        """
+        from src.shell.ui.icon_loader import preload
+        from src.shell.ui.material.folder_widget import preview_icon_render_sizes
+        sources = [desc.icon_str for desc in self._app_descriptors]
+        for report in (
+            preload(sources, colors=(None, QTA_ICON_COLOR), sizes=(PRELOAD_ICON_SIZE,)),
+            preload(sources, colors=(QTA_ICON_COLOR,), sizes=preview_icon_render_sizes()),
+        ):
+            print(f"[AppShell] Preloaded {report.requested} icons in {report.elapsed_ms:.1f} ms "
+                  f"({report.cached} cached, {report.from_disk} from disk, "
+                  f"{report.rendered} rendered, {report.failed} failed)")
+
     def retranslate(self):
         """Handle language change events - called automatically"""
         # Update existing folder titles instead of recreating everything
@@ -296,6 +337,13 @@ class AppShell(QWidget):
 
         return self.size() if hasattr(self, '_initialized') else self.size()
 
+    def paintEvent(self, event):
+        """Schedule the icon preload once the first frame has been painted"""
+        super().paintEvent(event)
+        if not self._icons_preloaded:
+            self._icons_preloaded = True
+            current_clock().call_later(0, self.preload_icons)
+
     def keyPressEvent(self, event):
         """Handle key press events"""
         # ESC key to close current app (for demo purposes)
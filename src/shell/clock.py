@@ -0,0 +1,166 @@
+"""
+Injectable clock and timer service
+
+All shell timing goes through one process-wide clock: the animation engine's
+frame tick, animation run timing and statistics, and the delayed steps of
+FolderController, FloatingIconManager and ExpandedFolderView.
+
+``RealClock`` (the default) reads ``time.perf_counter`` and schedules with
+QTimer. ``VirtualClock`` keeps its own time, which moves only when
+``advance()`` or ``run_until_idle()`` is called; due timers then fire
+synchronously in deadline order (ties in scheduling order). Installed with
+``use_clock()``, it runs folder flows with 300 ms animations instantly and
+with identical timings on every run.
+"""
+
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QTimer, Qt
+
+
+class TimerHandle:
+    """A scheduled single-shot call or repeating timer; ``cancel()`` stops it"""
+
+    def __init__(self, callback: Callable[[], None]):
+        self.callback = callback
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+# Pending QTimer handles of every RealClock. Kept at module level so a timer
+# stays alive until it fires or is cancelled, whatever happens to its clock.
+_live_qt_handles = set()
+
+
+class _QtTimerHandle(TimerHandle):
+    def __init__(self, callback, interval_ms, repeat):
+        super().__init__(callback)
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setSingleShot(not repeat)
+        self._timer.timeout.connect(self._fire)
+        self._timer.start(max(0, int(interval_ms)))
+        _live_qt_handles.add(self)
+
+    def _fire(self):
+        if self._timer.isSingleShot():
+            self.cancel()
+        self.callback()
+
+    def cancel(self):
+        if self.active:
+            super().cancel()
+            self._timer.stop()
+            _live_qt_handles.discard(self)
+
+
+class RealClock:
+    """Wall-clock time and QTimer scheduling"""
+
+    def now_ms(self) -> float:
+        return time.perf_counter() * 1000
+
+    def call_later(self, delay_ms: float, callback: Callable[[], None]) -> TimerHandle:
+        """Call ``callback`` once after ``delay_ms``"""
+        return _QtTimerHandle(callback, delay_ms, False)
+
+    def call_every(self, interval_ms: float, callback: Callable[[], None]) -> TimerHandle:
+        """Call ``callback`` every ``interval_ms`` until the handle is cancelled"""
+        return _QtTimerHandle(callback, interval_ms, True)
+
+
+class VirtualClock:
+    """Deterministic time that advances only on request.
+
+    Args:
+        start_ms: Initial virtual time
+    """
+
+    def __init__(self, start_ms: float = 0.0):
+        self._now = float(start_ms)
+        self._queue = []  # (deadline, sequence, handle, interval or None)
+        self._sequence = itertools.count()
+
+    def now_ms(self) -> float:
+        return self._now
+
+    def call_later(self, delay_ms: float, callback: Callable[[], None]) -> TimerHandle:
+        handle = TimerHandle(callback)
+        self._schedule(handle, max(0.0, delay_ms), None)
+        return handle
+
+    def call_every(self, interval_ms: float, callback: Callable[[], None]) -> TimerHandle:
+        handle = TimerHandle(callback)
+        self._schedule(handle, interval_ms, interval_ms)
+        return handle
+
+    def _schedule(self, handle, delay_ms, interval_ms):
+        heapq.heappush(self._queue, (self._now + delay_ms, next(self._sequence), handle, interval_ms))
+
+    @property
+    def pending(self) -> int:
+        """Active timers still scheduled"""
+        return sum(1 for entry in self._queue if entry[2].active)
+
+    def advance(self, ms: float):
+        """Move time forward by ``ms``, firing every timer due on the way"""
+        end = self._now + ms
+        while self._queue and self._queue[0][0] <= end:
+            deadline, _, handle, interval = heapq.heappop(self._queue)
+            if not handle.active:
+                continue
+            self._now = max(self._now, deadline)
+            if interval is None:
+                handle.active = False
+            else:
+                self._schedule(handle, interval, interval)
+            handle.callback()
+        self._now = end
+
+    def run_until_idle(self, limit_ms: float = 60_000.0) -> float:
+        """Fire timers until none is left; returns the virtual time that passed.
+
+        Raises:
+            RuntimeError: Timers are still pending after ``limit_ms``
+        """
+        start = self._now
+        while True:
+            while self._queue and not self._queue[0][2].active:
+                heapq.heappop(self._queue)
+            if not self._queue:
+                return self._now - start
+            deadline = self._queue[0][0]
+            if deadline - start > limit_ms:
+                raise RuntimeError(f"Timers still pending after {limit_ms} ms of virtual time")
+            self.advance(max(0.0, deadline - self._now))
+
+
+_clock = RealClock()
+
+
+def current_clock():
+    """Return the clock every shell component schedules with"""
+    return _clock
+
+
+def set_clock(clock) -> Optional[object]:
+    """Install ``clock`` (None restores a RealClock); returns the previous clock"""
+    global _clock
+    previous, _clock = _clock, clock or RealClock()
+    return previous
+
+
+@contextmanager
+def use_clock(clock):
+    """Install ``clock`` for the duration of a ``with`` block"""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
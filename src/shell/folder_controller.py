@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
-from PyQt6.QtCore import pyqtSignal, QTimer, QObject
+from PyQt6.QtCore import pyqtSignal, QObject
+from src.shell.clock import current_clock
 from src.shell.ui.styles import OVERLAY_BG, OVERLAY_LIGHT, OVERLAY_SUBTLE, OVERLAY_FAINT
 
 
@@ -139,7 +140,7 @@ class FolderController(QObject):
         self.expanded_view_manager.show_close_button()
         self.overlay_manager.set_style(f"background-color: {OVERLAY_SUBTLE};")
         self.overlay_manager.hide_overlay()
-        QTimer.singleShot(300, self.minimize_to_floating_icon)
+        current_clock().call_later(300, self.minimize_to_floating_icon)
 
     def handle_close_app(self):
         """Business logic for closing app"""
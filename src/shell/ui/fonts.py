@@ -0,0 +1,54 @@
+from PyQt6.QtGui import QFont, QFontDatabase
+
+from src.shell.ui.styles import FONT_FAMILY_FALLBACKS, TYPOGRAPHY_ROLES
+
+
+_resolved_family = None
+_font_cache = {}
+
+
+def resolve_family():
+    """Resolve the first installed family of FONT_FAMILY_FALLBACKS.
+
+    The font database is queried only on the first call; the result is
+    kept for the lifetime of the process.
+
+    Returns:
+        Family name string (the last fallback if none is installed)
+    """
+    global _resolved_family
+    if _resolved_family is None:
+        available = set(QFontDatabase.families())
+        _resolved_family = next(
+            (family for family in FONT_FAMILY_FALLBACKS if family in available),
+            FONT_FAMILY_FALLBACKS[-1],
+        )
+    return _resolved_family
+
+
+def get_font(role, point_size=None, weight=None):
+    """Return the shared QFont for a typography role.
+
+    Args:
+        role:       Key of TYPOGRAPHY_ROLES (e.g. "folder_title")
+        point_size: Optional point size overriding the role default
+        weight:     Optional numeric weight overriding the role default
+
+    Returns:
+        Cached QFont. It is shared between callers, so copy it before
+        mutating; QWidget.setFont() already stores a copy.
+    """
+    default_size, default_weight = TYPOGRAPHY_ROLES[role]
+    key = (role, point_size or default_size, weight or default_weight)
+    font = _font_cache.get(key)
+    if font is None:
+        font = QFont(resolve_family(), key[1], key[2])
+        _font_cache[key] = font
+    return font
+
+
+def clear_font_cache():
+    """Forget the resolved family and all cached fonts (e.g. after installing fonts)."""
+    global _resolved_family
+    _resolved_family = None
+    _font_cache.clear()
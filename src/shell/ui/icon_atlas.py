@@ -0,0 +1,118 @@
+"""
+Shared texture atlas for rendered icons
+
+Icons rendered at the same logical size and device pixel ratio are packed
+into a few large page pixmaps instead of one pixmap each. Because every cell
+of an atlas has the same size, packing is a plain grid; a page grows by half
+its rows at a time up to ``ATLAS_PAGE_EDGE`` device pixels, after which a new
+page is started. Painter-based widgets draw an icon with ``AtlasHandle.draw``,
+which blits the handle's sub-rectangle of its page.
+"""
+
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QRect, QRectF, QSize, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+
+
+# Maximum page edge in device pixels
+ATLAS_PAGE_EDGE = 1024
+
+# Rows a page starts with; it grows by half its rows until ATLAS_PAGE_EDGE
+ATLAS_INITIAL_ROWS = 2
+
+
+@dataclass(frozen=True)
+class AtlasHandle:
+    """Location of one packed icon: page index and source rect in device pixels"""
+    atlas: "IconAtlas"
+    page: int
+    rect: QRect
+
+    def draw(self, painter, target):
+        """Draw the icon into ``target`` (logical QRect/QRectF)"""
+        painter.drawPixmap(QRectF(target), self.atlas.pages[self.page], QRectF(self.rect))
+
+
+class IconAtlas:
+    """Grid-packed pages of icons sharing one logical size and DPR.
+
+    Args:
+        size:       Logical QSize of every icon in the atlas
+        dpr:        Device pixel ratio the icons are rendered for
+        page_edge:  Maximum page width/height in device pixels
+    """
+
+    def __init__(self, size, dpr, page_edge=ATLAS_PAGE_EDGE):
+        self.size = QSize(size)
+        self.dpr = dpr
+        self.cell = QSize(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        self.columns = max(1, page_edge // self.cell.width())
+        self.max_rows = max(1, page_edge // self.cell.height())
+        self.pages = []
+        self._rows = []         # allocated rows per page
+        self._handles = {}      # key -> AtlasHandle
+        self._next = 0          # cells used on the last page
+
+    def get(self, key):
+        """Return the handle packed for ``key``, or None"""
+        return self._handles.get(key)
+
+    def add(self, key, image):
+        """Pack a rendered QImage (``size`` x ``dpr`` pixels) and return its handle.
+
+        Adding a key that is already packed returns the existing handle.
+        """
+        handle = self._handles.get(key)
+        if handle is not None:
+            return handle
+
+        per_page = self.columns * self.max_rows
+        if not self.pages or self._next == per_page:
+            self._add_page()
+        page = len(self.pages) - 1
+        row, column = divmod(self._next, self.columns)
+        if row >= self._rows[page]:
+            self._grow(page, min(self.max_rows, self._rows[page] + max(1, self._rows[page] // 2)))
+
+        rect = QRect(column * self.cell.width(), row * self.cell.height(),
+                     self.cell.width(), self.cell.height())
+        painter = QPainter(self.pages[page])
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawImage(rect, image)
+        painter.end()
+
+        self._next += 1
+        handle = AtlasHandle(self, page, rect)
+        self._handles[key] = handle
+        return handle
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __contains__(self, key):
+        return key in self._handles
+
+    @property
+    def total_bytes(self):
+        return sum(page.width() * page.height() * 4 for page in self.pages)
+
+    def _add_page(self):
+        self.pages.append(self._blank(min(self.max_rows, ATLAS_INITIAL_ROWS)))
+        self._rows.append(min(self.max_rows, ATLAS_INITIAL_ROWS))
+        self._next = 0
+
+    def _grow(self, page, rows):
+        """Reallocate a page with more rows, keeping the cells packed so far"""
+        grown = self._blank(rows)
+        painter = QPainter(grown)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawPixmap(0, 0, self.pages[page])
+        painter.end()
+        self.pages[page] = grown
+        self._rows[page] = rows
+
+    def _blank(self, rows):
+        pixmap = QPixmap(self.columns * self.cell.width(), rows * self.cell.height())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
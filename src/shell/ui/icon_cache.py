@@ -0,0 +1,176 @@
+"""
+Bounded LRU cache for icons and rendered pixmaps
+
+Entries are evicted least-recently-used first once either the entry count or
+the estimated pixmap memory exceeds the configured capacity. Hit, miss and
+eviction counters are kept so long-running shells can report cache health.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from PyQt6.QtGui import QIcon, QImage, QPixmap
+
+
+# Estimate used for scalable icons whose render size is not known up front
+DEFAULT_ICON_EDGE = 64
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of an IconCache's counters and current usage"""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def size_key(size):
+    """Hashable (width, height) for a QSize, or None"""
+    if size is None:
+        return None
+    return (size.width(), size.height())
+
+
+def estimate_bytes(value, size=None, dpr=1.0):
+    """Estimate the pixel memory held by a cached icon, pixmap or image.
+
+    Args:
+        value: QPixmap, QImage or QIcon
+        size:  Logical QSize the value is rendered at, if known
+        dpr:   Device pixel ratio the value is rendered for
+    """
+    if isinstance(value, QImage):
+        return value.sizeInBytes()
+    if isinstance(value, QPixmap):
+        return value.width() * value.height() * max(value.depth(), 32) // 8
+
+    if size is not None:
+        width, height = size.width(), size.height()
+    else:
+        # Pixmap-backed icons hold every added size (in device pixels)
+        sizes = list(value.availableSizes()) if isinstance(value, QIcon) else []
+        if sizes:
+            return sum(s.width() * s.height() * 4 for s in sizes)
+        width = height = DEFAULT_ICON_EDGE
+    return int(width * dpr) * int(height * dpr) * 4
+
+
+class IconCache:
+    """LRU cache bounded by entry count and estimated bytes.
+
+    Supports the mapping operations the icon loader relies on (``get``,
+    ``[]=``, ``in``, ``len``, ``clear``) plus ``put`` with an explicit cost,
+    ``trim`` for memory pressure and ``stats`` for diagnostics.
+    """
+
+    def __init__(self, max_entries=512, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (value, cost)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def peek(self, key, default=None):
+        """Return the cached value without touching recency or counters"""
+        entry = self._entries.get(key)
+        return default if entry is None else entry[0]
+
+    def put(self, key, value, cost=None):
+        """Insert or replace a value, evicting older entries if over capacity"""
+        if cost is None:
+            cost = estimate_bytes(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (value, cost)
+        self._bytes += cost
+        self._evict(self.max_entries, self.max_bytes, keep=1)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        """Snapshot of the cached keys, least recently used first"""
+        return list(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    def pop(self, key, default=None):
+        """Remove an entry without counting it as an eviction"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self._bytes -= entry[1]
+        return entry[0]
+
+    def clear(self):
+        """Drop every entry; counters are kept"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def trim(self, max_entries=None, max_bytes=None):
+        """Evict least-recently-used entries down to the given limits.
+
+        Limits default to the configured capacity. Returns the number of
+        entries evicted.
+        """
+        if max_entries is None:
+            max_entries = self.max_entries
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        return self._evict(max_entries, max_bytes)
+
+    def configure(self, max_entries=None, max_bytes=None):
+        """Change the capacity, evicting immediately if it shrank"""
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self._evict(self.max_entries, self.max_bytes)
+
+    def stats(self):
+        """Return a CacheStats snapshot"""
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._entries),
+                          self._bytes, self.max_entries, self.max_bytes)
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def _evict(self, max_entries, max_bytes, keep=0):
+        evicted = 0
+        entries = self._entries
+        while len(entries) > keep and (len(entries) > max_entries or self._bytes > max_bytes):
+            _, (_, cost) = entries.popitem(last=False)
+            self._bytes -= cost
+            evicted += 1
+        self.evictions += evicted
+        return evicted
@@ -0,0 +1,167 @@
+"""
+Persistent on-disk cache of rasterized icons
+
+Rendered icons are stored as PNG files next to an ``index.json`` that maps
+each (source, color, size, device pixel ratio) to its file and a validator:
+the qtawesome version for glyph icons, or the file's mtime and size for file
+icons. Entries whose validator no longer matches, or whose PNG is missing or
+has unexpected dimensions, are ignored and re-rendered live. Malformed
+entries are dropped when the index is read.
+"""
+
+import hashlib
+import json
+import os
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QIcon, QImage, QPainter, QPixmap
+
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+
+def entry_key(source, color, size, dpr):
+    """Stable string key for one rasterized icon"""
+    return json.dumps([source, color, size.width(), size.height(), round(dpr, 3)])
+
+
+def rasterize(icon, size, dpr):
+    """Render a QIcon into a transparent QImage at ``size`` x ``dpr`` pixels"""
+    width, height = round(size.width() * dpr), round(size.height() * dpr)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    icon.paint(painter, 0, 0, width, height)
+    painter.end()
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+def _valid_entry(entry):
+    """True if an index entry has every field, with the type store() writes"""
+    if not isinstance(entry, dict):
+        return False
+    size = entry.get("size")
+    return (isinstance(entry.get("file"), str) and isinstance(entry.get("source"), str)
+            and isinstance(entry.get("validator"), str)
+            and isinstance(entry.get("dpr"), (int, float))
+            and isinstance(size, list) and len(size) == 2
+            and all(isinstance(edge, int) for edge in size))
+
+
+class IconDiskCache:
+    """PNG + JSON index store for rasterized icons.
+
+    Args:
+        directory:    Cache directory, created on demand
+        qta_version:  Version string of the installed qtawesome, used to
+                      invalidate glyph renders after an upgrade
+    """
+
+    def __init__(self, directory, qta_version=""):
+        self.directory = directory
+        self.qta_version = str(qta_version)
+        self._index = {}
+        self._dirty = False
+        self._load_index()
+
+    def validator(self, source):
+        """Current validator for a source, or None if it cannot be cached"""
+        if os.path.exists(source):
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return None
+            return f"file:{stat.st_mtime_ns}:{stat.st_size}"
+        return f"qta:{self.qta_version}"
+
+    def load(self, source, color, size, dpr):
+        """Return the cached QPixmap for a render, or None on a miss or stale entry"""
+        entry = self._index.get(entry_key(source, color, size, dpr))
+        if entry is None:
+            return None
+        try:
+            return self._read(entry, source, size, dpr)
+        except (KeyError, TypeError):
+            return None
+
+    def store(self, source, color, size, dpr, image):
+        """Write a rendered QImage and record it in the index"""
+        validator = self.validator(source)
+        if validator is None or image.isNull():
+            return False
+        key = entry_key(source, color, size, dpr)
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if not image.save(os.path.join(self.directory, name), "PNG"):
+                return False
+        except OSError:
+            return False
+        self._index[key] = {
+            "source": source, "color": color,
+            "size": [size.width(), size.height()], "dpr": dpr,
+            "file": name, "validator": validator,
+        }
+        self._dirty = True
+        return True
+
+    def hydrate(self):
+        """Load every valid entry, grouped into one QIcon per (source, color, dpr).
+
+        Returns:
+            dict mapping (source, color, dpr) to a QIcon holding all cached sizes
+        """
+        icons = {}
+        for entry in list(self._index.values()):
+            try:
+                size = QSize(*entry["size"])
+                pixmap = self._read(entry, entry["source"], size, entry["dpr"])
+            except (KeyError, TypeError):
+                continue
+            if pixmap is None:
+                continue
+            icon = icons.setdefault((entry["source"], entry["color"], entry["dpr"]), QIcon())
+            icon.addPixmap(pixmap)
+        return icons
+
+    def flush(self):
+        """Write the index if it changed; the replace keeps it atomic"""
+        if not self._dirty:
+            return
+        path = os.path.join(self.directory, INDEX_FILE)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "entries": self._index}, f)
+            os.replace(path + ".tmp", path)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(self._index)
+
+    def _read(self, entry, source, size, dpr):
+        if entry.get("validator") != self.validator(source):
+            return None
+        image = QImage(os.path.join(self.directory, entry["file"]))
+        expected = (round(size.width() * dpr), round(size.height() * dpr))
+        if image.isNull() or (image.width(), image.height()) != expected:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                # Hand-edited or truncated entries are dropped, not trusted
+                self._index = {key: entry for key, entry in entries.items() if _valid_entry(entry)}
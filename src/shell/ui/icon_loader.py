@@ -1,16 +1,64 @@
 import os
+import time
+from dataclasses import dataclass
+from importlib import metadata
 
-import qtawesome as qta
 from PyQt6.QtCore import QSize
-from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
+from PyQt6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPalette, QPixmap
 
+from src.shell.ui.icon_atlas import IconAtlas
+from src.shell.ui.icon_cache import IconCache, estimate_bytes, size_key
+from src.shell.ui.icon_disk_cache import IconDiskCache, rasterize
+from src.shell.ui.icon_rasterizer import Glyph, IconRasterizer
+from src.shell.ui.icon_tint import tint_images
 
-_icon_cache = {}
+
+# qtawesome (and the qtpy bindings it pulls in) costs a few hundred ms to
+# import, so it is loaded on the first glyph icon request; see _qtawesome()
+qta = None
+
+# Capacity of the loaded-icon cache; long-running shells evict LRU beyond this
+ICON_CACHE_MAX_ENTRIES = 512
+ICON_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Scalable file and qtawesome QIcons are keyed by (source, color). Icons built
+# from rendered pixmaps (background, preload, disk) are keyed by
+# (source, color, dpr) and hold every rendered size for that pixel ratio.
+_icon_cache = IconCache(ICON_CACHE_MAX_ENTRIES, ICON_CACHE_MAX_BYTES)
+
+# Tinted QIcon sources are rasterized, so size and DPR are part of their key
+_tint_cache = IconCache(ICON_CACHE_MAX_ENTRIES, ICON_CACHE_MAX_BYTES)
+
+# Optional persistent store of rasterized icons, see enable_disk_cache()
+_disk_cache = None
+
+# Shared atlases of loaded icons for painter-based widgets: (size, dpr) -> IconAtlas
+_atlases = {}
+
+# Failed lookups: (source, color) -> monotonic time the failure expires. A bad
+# icon string costs one stat + qtawesome lookup per TTL instead of per render.
+NEGATIVE_CACHE_TTL_S = 300.0
+_failed = {}
+# Lookups answered from _failed per (source, color); each failure is printed once
+_failure_counts = {}
+
+# Background renders in flight: (source, color, size, dpr) -> waiting on_ready callbacks
+_pending = {}
+_rasterizer = None
+
+
+
+def _device_pixel_ratio():
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
 
 
 def _tint_icon(icon, color, size):
     """Tint an existing QIcon's pixmap to the given color.
 
+    Results are memoized per (icon cacheKey, color, size, device pixel ratio)
+    in ``_tint_cache``; failures are not cached.
+
     Args:
         icon:  QIcon to tint
         color: Color string (e.g. "#FFFFFF")
@@ -19,66 +67,569 @@ def _tint_icon(icon, color, size):
     Returns:
         QIcon with tinted pixmap, or the original icon on failure
     """
+    dpr = _device_pixel_ratio()
+    try:
+        cache_key = (icon.cacheKey(), QColor(color).rgba(), size_key(size), dpr)
+    except Exception:
+        return icon
+    cached = _tint_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         pixmap = icon.pixmap(size)
         if pixmap.isNull():
             return icon
         tinted = QPixmap(pixmap.size())
+        tinted.setDevicePixelRatio(pixmap.devicePixelRatio())
         tinted.fill(QColor(color))
         painter = QPainter(tinted)
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
         painter.drawPixmap(0, 0, pixmap)
         painter.end()
-        return QIcon(tinted)
     except Exception:
         return icon
 
+    result = QIcon(tinted)
+    _tint_cache.put(cache_key, result, estimate_bytes(tinted))
+    return result
 
-def load_icon(source, color=None, size=None):
-    """Single source of truth for icon loading.
+
+def _qtawesome():
+    """Import qtawesome on first use"""
+    global qta
+    if qta is None:
+        import qtawesome
+        qta = qtawesome
+    return qta
+
+
+def _qtawesome_version():
+    """Installed qtawesome version, read without importing the package"""
+    if qta is not None:
+        return getattr(qta, "__version__", "")
+    try:
+        return metadata.version("qtawesome")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def tint_icons(icons, colors, size, desaturate=False):
+    """Recolor many QIcons in one batch, e.g. on a theme switch.
+
+    Pixmaps missing from the tint cache are recolored together (vectorized
+    when NumPy is installed) and memoized like _tint_icon() results.
 
     Args:
-        source: QIcon object, file path string, or qtawesome string (e.g. "fa5s.cog")
-        color:  Optional color string for tinting (e.g. "#FFFFFF")
-        size:   Optional QSize — required when tinting a QIcon object
+        icons:      Sequence of QIcons
+        colors:     One color for every icon, or one color (or None) per icon;
+                    None keeps the icon's own colors
+        size:       QSize for the pixmap extraction
+        desaturate: Gray out the results, e.g. for disabled states
 
     Returns:
-        QIcon (empty QIcon if loading fails)
+        List of tinted QIcons in input order; icons without a pixmap are
+        returned unchanged
     """
-    if isinstance(source, QIcon):
-        if color and size:
-            return _tint_icon(source, color, size)
-        return source
+    icons = list(icons)
+    if colors is None or isinstance(colors, (str, QColor)):
+        colors = [colors] * len(icons)
+    dpr = _device_pixel_ratio()
+    results = list(icons)
+    todo = {}   # cache key -> (indices, image, color)
+    for index, (icon, color) in enumerate(zip(icons, colors)):
+        rgba = QColor(color).rgba() if color is not None else None
+        cache_key = (icon.cacheKey(), rgba, size_key(size), dpr)
+        if desaturate:
+            cache_key += ("desaturate",)
+        cached = _tint_cache.get(cache_key)
+        if cached is not None:
+            results[index] = cached
+        elif cache_key in todo:
+            todo[cache_key][0].append(index)
+        else:
+            pixmap = icon.pixmap(size)
+            if not pixmap.isNull():
+                todo[cache_key] = ([index], pixmap.toImage(), color)
 
-    if not isinstance(source, str) or not source:
-        return QIcon()
+    entries = list(todo.items())
+    images = tint_images([image for _, (_, image, _) in entries],
+                         [color for _, (_, _, color) in entries], desaturate)
+    for (cache_key, (indices, _, _)), image in zip(entries, images):
+        pixmap = QPixmap.fromImage(image)
+        tinted = QIcon(pixmap)
+        _tint_cache.put(cache_key, tinted, estimate_bytes(pixmap))
+        for index in indices:
+            results[index] = tinted
+    return results
 
-    cache_key = (source, color)
-    cached = _icon_cache.get(cache_key)
-    if cached is not None:
-        return cached
 
-    icon = None
+def _create_icon(source, color):
+    """Build a QIcon from a file path or qtawesome string, or None.
 
+    Failures are recorded in the negative cache.
+    """
     # Try filesystem path first
     if os.path.exists(source):
         icon = QIcon(source)
-        if icon.isNull():
-            icon = None
     else:
         # Try qtawesome icon string
         try:
             if color:
-                icon = qta.icon(source, color=color)
+                icon = _qtawesome().icon(source, color=color)
             else:
-                icon = qta.icon(source)
-            if icon.isNull():
-                icon = None
+                icon = _qtawesome().icon(source)
         except Exception:
             icon = None
+    if icon is None or icon.isNull():
+        _record_failure(source, color)
+        return None
+    return icon
+
+
+def _record_failure(source, color):
+    key = (source, color)
+    _failed[key] = time.monotonic() + NEGATIVE_CACHE_TTL_S
+    if key not in _failure_counts:
+        _failure_counts[key] = 0
+        print(f"[icon_loader] Icon not found: {source!r}"
+              + (f" (color {color})" if color else ""))
+
 
+def _known_failure(source, color):
+    """True if the lookup failed within the TTL; counts the suppressed lookup"""
+    key = (source, color)
+    expires = _failed.get(key)
+    if expires is None:
+        return False
+    if time.monotonic() >= expires:
+        del _failed[key]
+        return False
+    _failure_counts[key] += 1
+    return True
+
+
+def load_icon(source, color=None, size=None, on_ready=None, dpr=None):
+    """Single source of truth for icon loading.
+
+    Args:
+        source:   QIcon object, file path string, or qtawesome string (e.g. "fa5s.cog")
+        color:    Optional color string for tinting (e.g. "#FFFFFF")
+        size:     Optional QSize — required when tinting a QIcon object
+        on_ready: Optional callable(QIcon). With a ``size``, a cache miss is
+                  rendered on a background thread: an empty QIcon is returned
+                  now and ``on_ready`` is called on the GUI thread once the
+                  icon arrives. It is not called if rendering fails.
+        dpr:      Device pixel ratio to render for; defaults to the
+                  application's. Pass the widget's devicePixelRatioF().
+
+    Returns:
+        QIcon (empty QIcon if loading fails or the icon is still rendering)
+    """
+    if isinstance(source, QIcon):
+        if color and size:
+            return _tint_icon(source, color, size)
+        return source
+
+    if not isinstance(source, str) or not source:
+        return QIcon()
+
+    if dpr is None:
+        dpr = _device_pixel_ratio()
+    raster_key = (source, color, dpr)
+    # Raster entries only hold the rendered sizes, so sizeless loads get the scalable icon
+    cache_key = raster_key if size is not None and raster_key in _icon_cache else (source, color)
+    cached = _icon_cache.get(cache_key)
+    if cached is not None:
+        if cache_key is not raster_key or size is None or _has_size(cached, size, dpr):
+            return cached
+        # Rendered for this DPR but not this size: keep showing the cached
+        # icon and add the missing size
+        if on_ready is not None:
+            _request_render(source, color, size, dpr, on_ready)
+            return cached
+        return _render_now(source, color, size, dpr) or cached
+
+    if _known_failure(source, color):
+        return QIcon()
+
+    if _disk_cache is not None and size is not None:
+        pixmap = _disk_cache.load(source, color, size, dpr)
+        if pixmap is not None:
+            return _merge_raster(source, color, dpr, pixmap)
+
+    if on_ready is not None and size is not None:
+        _request_render(source, color, size, dpr, on_ready)
+        return QIcon()
+
+    icon = _create_icon(source, color)
     if icon is not None:
-        _icon_cache[cache_key] = icon
+        _icon_cache.put((source, color), icon, estimate_bytes(icon, size, dpr))
+        if _disk_cache is not None and size is not None:
+            _disk_cache.store(source, color, size, dpr, rasterize(icon, size, dpr))
         return icon
 
     return QIcon()
+
+
+def _has_size(icon, size, dpr):
+    """True if a pixmap-backed icon holds ``size`` rendered at ``dpr``"""
+    return QSize(round(size.width() * dpr), round(size.height() * dpr)) in icon.availableSizes()
+
+
+def _merge_raster(source, color, dpr, pixmap):
+    """Cache a rendered pixmap under (source, color, dpr).
+
+    Renders of the same icon at other sizes are merged into one QIcon. The
+    cached QIcon is copied before adding, so widgets keep the instance they
+    were given.
+    """
+    raster_key = (source, color, dpr)
+    current = _icon_cache.peek(raster_key)
+    icon = QIcon(current) if current is not None else QIcon()
+    icon.addPixmap(pixmap)
+    _icon_cache.put(raster_key, icon, estimate_bytes(icon))
+    _watch_screens()
+    return icon
+
+
+def _has_render(source, color, size, dpr):
+    """True if the cache already covers ``size`` at ``dpr`` for the icon"""
+    if (source, color) in _icon_cache:
+        return True  # scalable icon, renders any size on demand
+    icon = _icon_cache.peek((source, color, dpr))
+    return icon is not None and _has_size(icon, size, dpr)
+
+
+def _screen_dprs():
+    """Distinct device pixel ratios of the connected screens"""
+    app = QGuiApplication.instance()
+    dprs = {screen.devicePixelRatio() for screen in app.screens()} if app is not None else set()
+    return dprs or {1.0}
+
+
+_watching_screens = False
+
+
+def _watch_screens():
+    """Drop renders for pixel ratios no screen uses once screens change"""
+    global _watching_screens
+    app = QGuiApplication.instance()
+    if _watching_screens or app is None:
+        return
+    app.screenRemoved.connect(lambda screen: evict_unused_dprs())
+    _watching_screens = True
+
+
+def evict_unused_dprs():
+    """Evict rendered icons whose DPR matches none of the connected screens.
+
+    Atlases for those DPRs are dropped too; scalable icons are unaffected. Returns the number of evicted entries.
+    """
+    dprs = _screen_dprs()
+    stale = [key for key in _icon_cache.keys() if len(key) == 3 and key[2] not in dprs]
+    for key in stale:
+        _icon_cache.pop(key)
+    for key in [key for key in _atlases if key[1] not in dprs]:
+        del _atlases[key]
+    return len(stale)
+
+
+def _get_rasterizer():
+    global _rasterizer
+    if _rasterizer is None:
+        _rasterizer = IconRasterizer()
+        _rasterizer.rendered.connect(_on_rendered)
+    return _rasterizer
+
+
+def _request_render(source, color, size, dpr, on_ready):
+    """Queue a background render, joining one already in flight for the same key.
+
+    Returns False if the icon cannot be rendered at all.
+    """
+    key = (source, color, size_key(size), dpr)
+    waiting = _pending.get(key)
+    if waiting is not None:
+        waiting.append(on_ready)
+        return True
+
+    if os.path.exists(source):
+        glyph = None  # decoded by the worker
+    else:
+        # Validated through qtawesome here; the worker only gets the glyph's
+        # immutable description, never the icon engine
+        if _create_icon(source, color) is None:
+            return False
+        glyph = _glyph(source, color)
+        if glyph is None:
+            _record_failure(source, color)
+            return False
+    _pending[key] = [on_ready]
+    _get_rasterizer().submit(key, source, glyph, size, dpr)
+    return True
+
+
+def _glyph(source, color):
+    """Capture a qtawesome icon's character, font and pen color, or None"""
+    qtawesome = _qtawesome()
+    try:
+        prefix = source.split(".", 1)[0]
+        char = qtawesome.charmap(source)
+        font = qtawesome.font(prefix, 16)
+    except Exception:
+        return None
+    # qtawesome draws uncolored glyphs in the palette's text color
+    pen = QColor(color) if color else QGuiApplication.palette().color(
+        QPalette.ColorGroup.Active, QPalette.ColorRole.Text)
+    return Glyph(char, font.family(), font.styleName(), pen.rgba())
+
+
+def _on_rendered(key, image):
+    """GUI-thread end of a background render: cache the icon and notify waiters"""
+    callbacks = _pending.pop(key, [])
+    source, color, (width, height), dpr = key
+    if image.isNull():
+        _record_failure(source, color)
+        return
+    icon = _merge_raster(source, color, dpr, QPixmap.fromImage(image))
+    if _disk_cache is not None:
+        _disk_cache.store(source, color, QSize(width, height), dpr, image)
+
+    for callback in callbacks:
+        try:
+            callback(icon)
+        except RuntimeError:
+            # The waiting widget was deleted before its icon arrived
+            pass
+
+
+def wait_for_pending_icons(timeout_ms=-1):
+    """Block until background renders finish and deliver them.
+
+    Returns:
+        True if nothing is left in flight
+    """
+    if _rasterizer is None:
+        return not _pending
+    _rasterizer.wait_for_done(timeout_ms)
+    return not _pending
+
+
+@dataclass(frozen=True)
+class PreloadReport:
+    """Outcome of a preload() batch"""
+    requested: int     # unique (source, color, size, dpr) renders asked for
+    cached: int        # already in memory
+    from_disk: int     # read from the disk cache
+    rendered: int      # rendered live
+    failed: int
+    elapsed_ms: float
+
+
+def preload(sources, colors=(None,), sizes=(), parallel=True, timeout_ms=-1):
+    """Warm the icon cache for every source x color x size in one batch.
+
+    Requests are de-duplicated first. Each render is taken from memory, then
+    from the disk cache, and otherwise rendered live: on the background pool
+    when ``parallel`` is true (this call still waits for the batch), or
+    synchronously. Without ``sizes`` the scalable icons are loaded instead.
+
+    Returns:
+        PreloadReport with counts and the elapsed time
+    """
+    start = time.perf_counter()
+    keys = list(dict.fromkeys(
+        (source, color) for source in sources if isinstance(source, str) and source
+        for color in colors
+    ))
+    unique_sizes = list({size_key(size): size for size in sizes}.values())
+    # Render once per pixel ratio in use, so a window moved to another screen stays crisp
+    dprs = sorted(_screen_dprs() | {_device_pixel_ratio()})
+    cached = from_disk = rendered = failed = 0
+
+    if not unique_sizes:
+        for source, color in keys:
+            if (source, color) in _icon_cache:
+                cached += 1
+            elif load_icon(source, color).isNull():
+                failed += 1
+            else:
+                rendered += 1
+        return PreloadReport(len(keys), cached, 0, rendered, failed,
+                             (time.perf_counter() - start) * 1000)
+
+    delivered = []
+    queued = 0
+    for source, color in keys:
+        for size in unique_sizes:
+            for dpr in dprs:
+                if _has_render(source, color, size, dpr):
+                    cached += 1
+                    continue
+                if _known_failure(source, color):
+                    failed += 1
+                    continue
+                pixmap = _disk_cache.load(source, color, size, dpr) if _disk_cache is not None else None
+                if pixmap is not None:
+                    _merge_raster(source, color, dpr, pixmap)
+                    from_disk += 1
+                elif parallel:
+                    if _request_render(source, color, size, dpr, delivered.append):
+                        queued += 1
+                    else:
+                        failed += 1
+                elif _render_now(source, color, size, dpr) is not None:
+                    rendered += 1
+                else:
+                    failed += 1
+
+    if queued:
+        wait_for_pending_icons(timeout_ms)
+        rendered += len(delivered)
+        failed += queued - len(delivered)
+
+    return PreloadReport(len(keys) * len(unique_sizes) * len(dprs), cached, from_disk, rendered, failed,
+                         (time.perf_counter() - start) * 1000)
+
+
+def _render_now(source, color, size, dpr):
+    """Render one size on the calling thread and cache it.
+
+    Returns:
+        The merged raster QIcon, or None if the icon cannot be created
+    """
+    icon = _create_icon(source, color)
+    if icon is None:
+        return None
+    image = rasterize(icon, size, dpr)
+    merged = _merge_raster(source, color, dpr, QPixmap.fromImage(image))
+    if _disk_cache is not None:
+        _disk_cache.store(source, color, size, dpr, image)
+    return merged
+
+
+def atlas_handle(source, color, size, dpr=None):
+    """Return the atlas handle of a loaded icon at ``size``, packing it on first use.
+
+    Only icons already in the icon cache are packed, so calling this from a
+    paint event never loads or renders synchronously; it returns None until
+    the icon has been loaded through load_icon().
+    """
+    if dpr is None:
+        dpr = _device_pixel_ratio()
+    atlas = _atlases.get((size_key(size), dpr))
+    key = (source, color)
+    if atlas is not None:
+        handle = atlas.get(key)
+        if handle is not None:
+            return handle
+
+    icon = _icon_cache.peek((source, color, dpr))
+    if icon is None or not _has_size(icon, size, dpr):
+        icon = _icon_cache.peek(key)
+    if icon is None:
+        return None
+    if atlas is None:
+        atlas = _atlases[(size_key(size), dpr)] = IconAtlas(size, dpr)
+    return atlas.add(key, rasterize(icon, size, dpr))
+
+
+def atlas_stats():
+    """Return (atlases, pages, icons, bytes) over every icon atlas"""
+    atlases = list(_atlases.values())
+    return (len(atlases), sum(len(a.pages) for a in atlases),
+            sum(len(a) for a in atlases), sum(a.total_bytes for a in atlases))
+
+
+def failed_icons():
+    """Return {(source, color): lookups answered from the negative cache}.
+
+    Every icon that failed to load since the last clear_icon_cache() is
+    listed, with how many later lookups skipped the filesystem and qtawesome.
+    """
+    return dict(_failure_counts)
+
+
+def icon_cache_stats():
+    """Return hit/miss/eviction counters and usage of the icon cache"""
+    return _icon_cache.stats()
+
+
+def tint_cache_stats():
+    """Return hit/miss/eviction counters and usage of the tinted-icon cache"""
+    return _tint_cache.stats()
+
+
+def configure_icon_cache(max_entries=None, max_bytes=None):
+    """Change the capacity (entries and estimated pixmap bytes) of both icon caches"""
+    _icon_cache.configure(max_entries, max_bytes)
+    _tint_cache.configure(max_entries, max_bytes)
+
+
+def trim_icon_cache(max_entries=None, max_bytes=None):
+    """Evict least-recently-used icons, e.g. under memory pressure.
+
+    Applies the limits to the icon and tinted-icon caches alike and returns
+    the number of evicted entries.
+    """
+    return _icon_cache.trim(max_entries, max_bytes) + _tint_cache.trim(max_entries, max_bytes)
+
+
+def clear_icon_cache():
+    """Drop every cached, tinted and atlas-packed icon and forget failures"""
+    _icon_cache.clear()
+    _tint_cache.clear()
+    _atlases.clear()
+    _failed.clear()
+    _failure_counts.clear()
+
+
+def enable_disk_cache(directory):
+    """Persist rasterized icons in ``directory`` and warm the cache from it.
+
+    Valid entries from a previous run are loaded into the icon cache right
+    away, one icon per (source, color, dpr), before any widget asks for an icon. Afterwards sized load_icon()
+    calls read renders from disk on a miss and store live renders for the
+    next start. The index is written on flush_disk_cache() and when the
+    application quits.
+
+    Returns:
+        Number of icons loaded from disk
+    """
+    global _disk_cache
+    disable_disk_cache()
+    _disk_cache = IconDiskCache(directory, _qtawesome_version())
+
+    icons = _disk_cache.hydrate()
+    for key, icon in icons.items():
+        if key not in _icon_cache:
+            _icon_cache.put(key, icon)
+    if icons:
+        _watch_screens()
+
+    app = QGuiApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(flush_disk_cache)
+    return len(icons)
+
+
+def flush_disk_cache():
+    """Write pending disk cache index changes"""
+    if _disk_cache is not None:
+        _disk_cache.flush()
+
+
+def disable_disk_cache():
+    """Flush and detach the disk cache; icons already loaded stay cached"""
+    global _disk_cache
+    if _disk_cache is None:
+        return
+    _disk_cache.flush()
+    app = QGuiApplication.instance()
+    if app is not None:
+        try:
+            app.aboutToQuit.disconnect(flush_disk_cache)
+        except TypeError:
+            pass
+    _disk_cache = None
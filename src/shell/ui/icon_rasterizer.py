@@ -0,0 +1,120 @@
+"""
+Background icon rasterization
+
+Icons are rendered into QImages on a small QThreadPool and handed back to the
+GUI thread through the queued ``rendered`` signal, where icon_loader turns
+them into QPixmap/QIcon. File icons are decoded by QImageReader directly at
+the target size. qtawesome's icon engine is not thread-safe, so glyph icons
+are described on the GUI thread by an immutable Glyph (character, font family
+and color) and the worker draws that with its own QPainter and QFont.
+"""
+
+from dataclasses import dataclass
+
+from PyQt6.QtCore import (QCoreApplication, QObject, QRunnable, QSize, QThread, QThreadPool, Qt,
+                          pyqtSignal, pyqtSlot)
+from PyQt6.QtGui import QColor, QFont, QImage, QImageReader, QPainter
+
+
+def decode_file(path, size, dpr):
+    """Decode an image file at ``size`` x ``dpr`` pixels, keeping its aspect ratio"""
+    target = QSize(round(size.width() * dpr), round(size.height() * dpr))
+    reader = QImageReader(path)
+    native = reader.size()
+    if native.isValid():
+        reader.setScaledSize(native.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return image
+    if image.size() != target and not native.isValid():
+        image = image.scaled(target, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+@dataclass(frozen=True)
+class Glyph:
+    """A qtawesome glyph captured on the GUI thread for drawing in a worker"""
+    char: str
+    family: str
+    style_name: str
+    color: int   # QColor.rgba()
+
+
+def render_glyph(glyph, size, dpr):
+    """Draw a glyph at ``size`` x ``dpr`` pixels the way qtawesome's text painter does"""
+    width, height = round(size.width() * dpr), round(size.height() * dpr)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    font = QFont()
+    font.setFamily(glyph.family)
+    # qtawesome sizes the glyph to 7/8 of the icon height to leave room for bearings
+    font.setPixelSize(round(0.875 * height))
+    if glyph.style_name:
+        font.setStyleName(glyph.style_name)
+
+    painter = QPainter(image)
+    painter.setPen(QColor.fromRgba(glyph.color))
+    painter.setFont(font)
+    painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, glyph.char)
+    painter.end()
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class _RenderTask(QRunnable):
+    def __init__(self, rasterizer, key, source, glyph, size, dpr):
+        super().__init__()
+        self.rasterizer = rasterizer
+        self.key = key
+        self.source = source
+        self.glyph = glyph
+        self.size = QSize(size)
+        self.dpr = dpr
+
+    def run(self):
+        try:
+            if self.glyph is None:
+                image = decode_file(self.source, self.size, self.dpr)
+            else:
+                image = render_glyph(self.glyph, self.size, self.dpr)
+        except Exception:
+            image = QImage()
+        # Emitted from the worker; queued to the rasterizer's (GUI) thread
+        self.rasterizer._finished.emit(self.key, image)
+
+
+class IconRasterizer(QObject):
+    """Worker pool rendering icons off the GUI thread.
+
+    Signals:
+        rendered(key, QImage): delivered on the GUI thread; the image is null
+                               if rendering failed
+    """
+
+    rendered = pyqtSignal(object, QImage)
+    _finished = pyqtSignal(object, QImage)
+
+    def __init__(self, max_threads=None, parent=None):
+        super().__init__(parent)
+        self._finished.connect(self._deliver)
+        self._pool = QThreadPool(self)
+        if max_threads is None:
+            max_threads = min(4, max(1, QThread.idealThreadCount() - 1))
+        self._pool.setMaxThreadCount(max_threads)
+
+    def submit(self, key, source, glyph, size, dpr):
+        """Queue a render; ``glyph`` is None for files decoded from ``source``"""
+        self._pool.start(_RenderTask(self, key, source, glyph, size, dpr))
+
+    def wait_for_done(self, timeout_ms=-1):
+        """Block until queued renders finish and deliver their ``rendered`` signals"""
+        done = self._pool.waitForDone(timeout_ms)
+        QCoreApplication.sendPostedEvents(self)
+        return done
+
+    @pyqtSlot(object, QImage)
+    def _deliver(self, key, image):
+        self.rendered.emit(key, image)
@@ -0,0 +1,190 @@
+"""
+Batch recoloring of rendered icon images
+
+Every function takes QImages and returns new ARGB32 premultiplied QImages. A
+recolor keeps each pixel's alpha and replaces its color; desaturation turns
+either the target color or, without a color, the image itself to gray (used
+for disabled states). Gray is the sRGB relative luminance, the same value
+QImage produces when converting to Format_Grayscale8.
+
+NumPy is optional. When it is installed, image bits are mapped as uint32
+arrays without copying and each image is recolored by one vectorized table
+lookup written straight into the result's bits, with the table shared by every
+image of the same target color; otherwise a QPainter composite is used per
+image.
+"""
+
+import sys
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+
+_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+
+# Byte holding alpha within a native-endian 0xAARRGGBB pixel
+_ALPHA_BYTE = 3 if sys.byteorder == "little" else 0
+
+# False until the first batch; then the numpy module, or None if not installed
+_np = False
+
+
+def numpy_module():
+    """Import numpy on first use; None if it is not installed"""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+
+# sRGB relative luminance weights, applied to linearized channels
+_LUMINANCE = (0.2126, 0.7152, 0.0722)
+
+
+def _linear(channel):
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _encode(luminance):
+    c = 12.92 * luminance if luminance <= 0.0031308 else 1.055 * luminance ** (1 / 2.4) - 0.055
+    return round(255 * c)
+
+
+# Linearized value of every 8-bit sRGB channel
+_LINEAR = tuple(_linear(c) for c in range(256))
+
+
+def _gray(color):
+    channels = (color.red(), color.green(), color.blue())
+    luminance = sum(w * _LINEAR[c] for w, c in zip(_LUMINANCE, channels))
+    value = _encode(luminance)
+    return QColor.fromRgb(value, value, value, color.alpha())
+
+
+def tint_image(image, color=None, desaturate=False):
+    """Recolor one QImage through QPainter composition.
+
+    Args:
+        image:      Source QImage
+        color:      Target color (str or QColor); None keeps the image's colors
+        desaturate: Gray out the result
+
+    Returns:
+        New ARGB32 premultiplied QImage with the source's DPR
+    """
+    source = image.convertToFormat(_FORMAT)
+    if color is None:
+        if not desaturate:
+            return source
+        # Grayscale drops alpha; restore it by masking with the source
+        tinted = image.convertToFormat(QImage.Format.Format_Grayscale8).convertToFormat(_FORMAT)
+    else:
+        color = QColor(color)
+        tinted = QImage(source.size(), _FORMAT)
+        tinted.fill(_gray(color) if desaturate else color)
+    tinted.setDevicePixelRatio(source.devicePixelRatio())
+    painter = QPainter(tinted)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, source)
+    painter.end()
+    return tinted
+
+
+def _pixels(np, image):
+    """uint32 (height, width) view onto an ARGB32 image's bits, no copy"""
+    bits = image.bits()
+    bits.setsize(image.sizeInBytes())
+    rows = np.frombuffer(bits, dtype=np.uint32).reshape(image.height(), image.bytesPerLine() // 4)
+    return rows[:, :image.width()]
+
+
+def _gray_array(np, red, green, blue, alpha):
+    """Vectorized _gray() for premultiplied channels; returns premultiplied gray"""
+    safe = np.maximum(alpha, 1).astype(np.float32)
+    linear = np.asarray(_LINEAR, dtype=np.float32)
+
+    def unpremultiplied(channel):
+        return np.minimum(np.rint(channel * 255 / safe), 255).astype(np.intp)
+
+    luminance = sum(w * linear[unpremultiplied(c)] for w, c in zip(_LUMINANCE, (red, green, blue)))
+    encoded = np.where(luminance <= 0.0031308, 12.92 * luminance,
+                       1.055 * np.power(luminance, 1 / 2.4) - 0.055)
+    gray = np.rint(255 * encoded).astype(np.uint32)
+    return (gray * alpha + 127) // 255
+
+
+def _alpha(np, pixels):
+    """uint8 view of the alpha channel of a uint32 pixel array"""
+    return pixels.view(np.uint8).reshape(pixels.shape + (4,))[..., _ALPHA_BYTE]
+
+
+def _recolor_table(np, color, desaturate):
+    """uint32 premultiplied pixel of ``color`` for each of the 256 source alphas"""
+    color = QColor(color)
+    if desaturate:
+        color = _gray(color)
+    # Premultiplied: every channel scales with the source alpha
+    alpha = (np.arange(256, dtype=np.uint32) * color.alpha() + 127) // 255
+    red, green, blue = ((alpha * channel + 127) // 255
+                        for channel in (color.red(), color.green(), color.blue()))
+    return (alpha << 24) | (red << 16) | (green << 8) | blue
+
+
+def _desaturate_pixels(np, pixels):
+    alpha = pixels >> 24
+    gray = _gray_array(np, (pixels >> 16) & 0xFF, (pixels >> 8) & 0xFF, pixels & 0xFF, alpha)
+    return (alpha << 24) | (gray << 16) | (gray << 8) | gray
+
+
+def _tint_batch(np, images, colors, desaturate):
+    """Recolor images straight between mapped QImage bits.
+
+    A recolored pixel depends on the source alpha only, so each target color
+    becomes a 256-entry table, built once per batch, and every image is a
+    single table lookup written into the result's bits.
+    """
+    tables = {}
+    results = []
+    for image, color in zip(images, colors):
+        source = image.convertToFormat(_FORMAT)
+        result = QImage(source.size(), _FORMAT)
+        result.setDevicePixelRatio(source.devicePixelRatio())
+        results.append(result)
+        if source.isNull():
+            continue
+        if color is None:
+            pixels = _pixels(np, source)
+            _pixels(np, result)[:] = _desaturate_pixels(np, pixels) if desaturate else pixels
+            continue
+        rgba = QColor(color).rgba()
+        table = tables.get(rgba)
+        if table is None:
+            table = tables[rgba] = _recolor_table(np, color, desaturate)
+        np.take(table, _alpha(np, _pixels(np, source)), out=_pixels(np, result))
+    return results
+
+
+def tint_images(images, colors, desaturate=False):
+    """Recolor many QImages, vectorized with NumPy when it is installed.
+
+    Args:
+        images:     Sequence of QImages
+        colors:     One color for every image, or a sequence with one color
+                    (or None) per image
+        desaturate: Gray out every result
+
+    Returns:
+        List of new QImages in input order
+    """
+    images = list(images)
+    if colors is None or isinstance(colors, (str, QColor, Qt.GlobalColor)):
+        colors = [colors] * len(images)
+    np = numpy_module()
+    if np is None:
+        return [tint_image(image, color, desaturate) for image, color in zip(images, colors)]
+    return _tint_batch(np, images, list(colors), desaturate)
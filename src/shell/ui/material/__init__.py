@@ -1,3 +1,16 @@
-from .factory import MaterialUIFactory
+"""
+Material Design 3 UI components
+
+Submodules are imported on first use: ``MaterialUIFactory`` loads when the
+attribute is first accessed, and each widget module when the factory first
+creates that widget, so importing this package stays cheap.
+"""
 
 __all__ = ["MaterialUIFactory"]
+
+
+def __getattr__(name):
+    if name == "MaterialUIFactory":
+        from .factory import MaterialUIFactory
+        return MaterialUIFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,15 @@ This module centralizes all animation logic from the folder interface,
 providing consistent Material Design timing and easing curves.
 """
 
+import weakref
 from typing import Optional, Callable, Union, List
-from PyQt6.QtCore import (
-    QPropertyAnimation, QEasingCurve, QRect, QPoint, QSize, QTimer,
-    QParallelAnimationGroup, QSequentialAnimationGroup, QObject, pyqtSignal
-)
-from PyQt6.QtWidgets import QWidget, QGraphicsOpacityEffect
+from PyQt6.QtCore import QEasingCurve, QRect, QPoint, QSize, QObject, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QGraphicsDropShadowEffect
+
+from .animation_engine import Tween, TweenGroup
+from .animation_governor import AnimationTier, DURATION_SCALE, animation_governor
+from .animation_stats import RunProbe, animation_stats
+from .opacity_snapshot import OpacitySnapshot
 
 
 class MaterialDesignTiming:
@@ -31,51 +34,311 @@ class MaterialDesignEasing:
     LINEAR = QEasingCurve.Type.Linear
 
 
+# Runs that move the target's presented opacity or geometry. Starting one
+# while another is running continues from wherever the running one has got to.
+_TRANSITIONS = ("fade_in", "fade_out", "scale_in", "scale_out",
+                "combined_in", "combined_out", "fab_show", "fab_hide")
+
+
+def _distance(a, b) -> float:
+    if isinstance(a, QRect):
+        return (abs(a.x() - b.x()) + abs(a.y() - b.y())
+                + abs(a.width() - b.width()) + abs(a.height() - b.height()))
+    return abs(a - b)
+
+
+def _remaining(current, start, end) -> float:
+    """Share of the way from ``start`` to ``end`` still ahead of ``current`` (0..1)"""
+    span = _distance(start, end)
+    if not span:
+        return 0.0 if current == end else 1.0
+    return min(1.0, _distance(current, end) / span)
+
+
 class AnimationManager(QObject):
-    """Centralized animation management with Material Design principles"""
+    """Centralized animation management with Material Design principles.
+
+    The manager is a facade over the shell-wide animation engine, which
+    advances the tweens of every manager from one frame timer. Each
+    animation id owns one pooled Tween (or, for combined transitions, one
+    TweenGroup of pooled tweens). Starting an id again stops, retargets and
+    restarts the same object, so repeated transitions allocate no Qt
+    objects or connections. Callbacks belong to a
+    single run: they fire once when that run finishes and are dropped if the
+    run is stopped or restarted.
+
+    Every run starts with the tier chosen by the shared animation governor:
+    durations are scaled, geometry is skipped from OPACITY_ONLY on, and the
+    target's drop shadow is disabled while its geometry moves from REDUCED on.
+    Each run is measured and recorded in the shared animation statistics.
+
+    ``windowOpacity`` only works on top-level windows. Child targets fade
+    through an OpacitySnapshot instead: a cached grab of the target painted
+    with the animated opacity, which also carries the geometry of combined
+    transitions, and is swapped back for the live widget when the run ends.
+
+    Transitions are retargeted in place. A fade, scale, combined or FAB
+    transition started while another one runs halts it where it is and
+    heads from the presented opacity and geometry to its own end values,
+    over the share of its duration that is left, without waiting or
+    snapping. Stopping halts runs the same way: the widget, or its snapshot
+    layer, stays as presented until the next transition continues from it.
+    """
 
     animation_finished = pyqtSignal(str)  # Animation name/id
     all_animations_finished = pyqtSignal()
 
     def __init__(self, target_widget: QWidget, parent: Optional[QObject] = None):
         super().__init__(parent)
-        self.target = target_widget
+        # Weak: widgets own their manager, and a back reference would make
+        # every dropped widget wait for the cyclic GC
+        self._target = weakref.ref(target_widget)
         self.animations = {}
         self.animation_groups = {}
         self._active_animations = set()
+        self._run_callbacks = {}  # animation id -> callbacks of the current run
+        self._hidden_shadow = None  # drop shadow disabled while geometry animates
+        self._probes = {}  # animation id -> RunProbe of the current run
+        self._run_of = {}  # pooled animation id -> id of the run it last belonged to
+        self._snapshot = None  # OpacitySnapshot of a child target, created on first fade
+        self._snapshot_runs = {}  # animation id -> show the live target when the run ends
+
+    @property
+    def target(self) -> Optional[QWidget]:
+        """The managed widget, or None once it has been freed"""
+        return self._target()
+
+    def _pooled_animation(
+            self,
+            animation_id: str,
+            property_name: bytes,
+            duration: int,
+            easing: QEasingCurve.Type,
+            target: Optional[QObject] = None
+    ) -> Tween:
+        """Return the stopped animation of ``animation_id``, creating it on first use.
+
+        ``target`` defaults to the managed widget. An animation for another
+        target or property under the same id is disposed and replaced.
+        """
+        target = target or self.target
+        animation = self.animations.get(animation_id)
+        if animation is not None and (animation.targetObject() is not target
+                                      or bytes(animation.propertyName()) != property_name):
+            self._dispose(self.animations.pop(animation_id))
+            animation = None
+
+        if animation is None:
+            self._dispose(self.animation_groups.pop(animation_id, None))
+            animation = Tween(target, property_name, self)
+            animation.setObjectName(animation_id)
+            animation.finished.connect(lambda: self._on_animation_finished(animation_id))
+            animation.on_frame = lambda: self._on_value_changed(animation_id)
+            self.animations[animation_id] = animation
+        else:
+            animation.stop()
+
+        animation.setDuration(duration)
+        animation.setEasingCurve(easing)
+        self._run_callbacks.pop(animation_id, None)
+        return animation
+
+    def _pooled_group(self, group_id: str, *animations: Tween) -> TweenGroup:
+        """Return the stopped parallel group of ``group_id`` running ``animations``"""
+        group = self.animation_groups.get(group_id)
+        if group is not None and [group.animationAt(i) for i in range(group.animationCount())] != list(animations):
+            self._dispose(self.animation_groups.pop(group_id))
+            group = None
+
+        if group is None:
+            self._dispose(self.animations.pop(group_id, None))
+            group = TweenGroup(self)
+            for animation in animations:
+                group.addAnimation(animation)
+            group.finished.connect(lambda: self._on_animation_finished(group_id))
+            self.animation_groups[group_id] = group
+        else:
+            group.stop()
+
+        self._run_callbacks.pop(group_id, None)
+        return group
+
+    def _dispose(self, animation):
+        """Stop and schedule deletion of a replaced animation or group"""
+        if animation is None:
+            return
+        if isinstance(animation, TweenGroup):
+            # Its pooled tweens live on; drop the connections back to the group
+            animation.clear()
+        animation.stop()
+        animation.finished.disconnect()
+        animation.deleteLater()
+
+    def _start(self, animation_id: str, animation, *callbacks: Optional[Callable]):
+        """Start a run of ``animation_id``; ``callbacks`` fire once when it finishes"""
+        callbacks = [callback for callback in callbacks if callback]
+        if callbacks:
+            self._run_callbacks[animation_id] = callbacks
+        self._active_animations.add(animation_id)
+        tier = animation_governor().run_started()
+        self._apply_tier(animation, tier)
+
+        self._end_run(animation_id, completed=False)
+        for part in self._parts(animation):
+            self._run_of[part.objectName()] = animation_id
+        self._probes[animation_id] = RunProbe(animation_id, tier.name, animation.totalDuration())
+        animation.start()
+
+    @staticmethod
+    def _parts(animation) -> List[Tween]:
+        if isinstance(animation, TweenGroup):
+            return [animation.animationAt(i) for i in range(animation.animationCount())]
+        return [animation]
+
+    def _apply_tier(self, animation, tier: AnimationTier):
+        """Scale or skip the parts of a run that ``tier`` cannot afford"""
+        moves_geometry = False
+        for part in self._parts(animation):
+            opacity = bytes(part.propertyName()) in (b"windowOpacity", b"opacity")
+            moves_geometry |= bytes(part.propertyName()) in (b"geometry", b"contentGeometry")
+            if tier >= AnimationTier.OPACITY_ONLY and not opacity:
+                # Zero-length animations jump to their end value
+                part.setDuration(0)
+            else:
+                part.setDuration(int(part.duration() * DURATION_SCALE[tier]))
+
+        if tier >= AnimationTier.REDUCED and moves_geometry:
+            self._hide_shadow()
+
+    def _hide_shadow(self):
+        effect = self.target.graphicsEffect()
+        if isinstance(effect, QGraphicsDropShadowEffect) and effect.isEnabled():
+            effect.setEnabled(False)
+            self._hidden_shadow = effect
+
+    def _layer_active(self) -> bool:
+        return self._snapshot is not None and self._snapshot.active
+
+    def _presented_opacity(self) -> float:
+        """Opacity the target is shown with right now"""
+        if self._layer_active():
+            return self._snapshot.opacity
+        if self.target.isWindow():
+            return self.target.windowOpacity()
+        return 0.0 if self.target.isHidden() else 1.0
+
+    def _presented_geometry(self) -> QRect:
+        """Geometry the target is shown at right now"""
+        return self._snapshot.content_geometry() if self._layer_active() else self.target.geometry()
+
+    def _retarget(self) -> bool:
+        """Halt running transitions where they are.
+
+        Returns True when the next transition must continue from the
+        presented state: a transition was halted or a snapshot layer is up.
+        """
+        running = [animation_id for animation_id in _TRANSITIONS if animation_id in self._active_animations]
+        for animation_id in running:
+            self._halt(animation_id)
+        return bool(running) or self._layer_active()
+
+    @staticmethod
+    def _time_left(duration: int, *spans) -> int:
+        """Duration of a retargeted run; ``spans`` are (current, start, end) values of its parts"""
+        return round(duration * max(_remaining(*span) for span in spans))
+
+    def _show_target(self):
+        """Show and raise the target, or the snapshot layer standing in for it"""
+        if self._layer_active():
+            self._snapshot.raise_()
+        else:
+            self.target.show()
+            self.target.raise_()
+
+    def _hand_back_layer(self):
+        """Replace an active snapshot layer by the live target at the layer's geometry"""
+        if self._layer_active():
+            self._snapshot.end()
+
+    def _opacity_layer(self) -> Optional[OpacitySnapshot]:
+        """Snapshot layer of a child target; None for windows, which fade natively"""
+        if self.target.isWindow():
+            return None
+        if self._snapshot is None or self._snapshot.parentWidget() is not self.target.parentWidget():
+            if self._snapshot is not None:
+                self._snapshot.end()
+                self._snapshot.deleteLater()
+            self._snapshot = OpacitySnapshot(self.target)
+        return self._snapshot
+
+    def _motion_target(self) -> QObject:
+        """Object whose geometry a combined transition animates"""
+        return self._opacity_layer() or self.target
+
+    def _motion_property(self) -> bytes:
+        """Property of ``_motion_target()`` holding the target's rect"""
+        return b"geometry" if self.target.isWindow() else b"contentGeometry"
+
+    def _begin_snapshot(self, animation_id: str, opacity: float, hide_on_finish: bool = False):
+        """Swap a child target for its snapshot for the run of ``animation_id``"""
+        layer = self._opacity_layer()
+        if layer is None:
+            return
+        if layer.active:
+            layer.set_opacity(opacity)
+        else:
+            layer.begin(opacity)
+        self._snapshot_runs[animation_id] = not hide_on_finish
+
+    def _end_snapshot(self, animation_id: str):
+        """Restore the live target once the last run using the snapshot finishes"""
+        if animation_id not in self._snapshot_runs:
+            return
+        show = self._snapshot_runs.pop(animation_id)
+        if not self._snapshot_runs:
+            self._snapshot.end(show)
+
+    def _on_value_changed(self, animation_id: str):
+        probe = self._probes.get(self._run_of.get(animation_id, animation_id))
+        if probe is not None:
+            probe.update()
+
+    def _end_run(self, animation_id: str, completed: bool):
+        """Record the measured run of ``animation_id``, if one is in progress"""
+        probe = self._probes.pop(animation_id, None)
+        if probe is not None:
+            animation_stats().add(probe.record(completed))
+
+    def _restore_shadow(self):
+        if self._hidden_shadow is not None and not self._active_animations:
+            if self.target.graphicsEffect() is self._hidden_shadow:
+                self._hidden_shadow.setEnabled(True)
+            self._hidden_shadow = None
 
     def create_fade_animation(
             self,
             duration: int = MaterialDesignTiming.MEDIUM,
             easing: QEasingCurve.Type = MaterialDesignEasing.STANDARD,
             animation_id: str = "fade"
-    ) -> QPropertyAnimation:
-        """Create opacity fade animation"""
-        animation = QPropertyAnimation(self.target, b"windowOpacity")
-        animation.setDuration(duration)
-        animation.setEasingCurve(easing)
+    ) -> Tween:
+        """Return the pooled opacity fade animation for ``animation_id``.
 
-        # Store and connect
-        self.animations[animation_id] = animation
-        animation.finished.connect(lambda: self._on_animation_finished(animation_id))
-
-        return animation
+        Windows animate ``windowOpacity``; child widgets animate the opacity
+        of their snapshot layer.
+        """
+        layer = self._opacity_layer()
+        if layer is None:
+            return self._pooled_animation(animation_id, b"windowOpacity", duration, easing)
+        return self._pooled_animation(animation_id, b"opacity", duration, easing, layer)
 
     def create_geometry_animation(
             self,
             duration: int = MaterialDesignTiming.MEDIUM,
             easing: QEasingCurve.Type = MaterialDesignEasing.STANDARD,
             animation_id: str = "geometry"
-    ) -> QPropertyAnimation:
-        """Create geometry/scale animation"""
-        animation = QPropertyAnimation(self.target, b"geometry")
-        animation.setDuration(duration)
-        animation.setEasingCurve(easing)
-
-        self.animations[animation_id] = animation
-        animation.finished.connect(lambda: self._on_animation_finished(animation_id))
-
-        return animation
+    ) -> Tween:
+        """Return the pooled geometry/scale animation for ``animation_id``"""
+        return self._pooled_animation(animation_id, b"geometry", duration, easing)
 
     def fade_in(
             self,
@@ -83,21 +346,22 @@ class AnimationManager(QObject):
             end_opacity: float = 1.0,
             duration: int = MaterialDesignTiming.MEDIUM,
             callback: Optional[Callable] = None
-    ) -> QPropertyAnimation:
+    ) -> Tween:
         """Material Design fade-in animation"""
+        if self._retarget():
+            current = self._presented_opacity()
+            duration = self._time_left(duration, (current, start_opacity, end_opacity))
+            start_opacity = current
+
         animation = self.create_fade_animation(duration, MaterialDesignEasing.DECELERATED, "fade_in")
         animation.setStartValue(start_opacity)
         animation.setEndValue(end_opacity)
 
-        if callback:
-            animation.finished.connect(callback)
-
         self.target.setWindowOpacity(start_opacity)
-        self.target.show()
-        self.target.raise_()
+        self._show_target()
+        self._begin_snapshot("fade_in", start_opacity)
 
-        self._active_animations.add("fade_in")
-        animation.start()
+        self._start("fade_in", animation, callback)
         return animation
 
     def fade_out(
@@ -107,20 +371,19 @@ class AnimationManager(QObject):
             duration: int = MaterialDesignTiming.MEDIUM,
             hide_on_finish: bool = True,
             callback: Optional[Callable] = None
-    ) -> QPropertyAnimation:
+    ) -> Tween:
         """Material Design fade-out animation"""
+        if self._retarget():
+            current = self._presented_opacity()
+            duration = self._time_left(duration, (current, start_opacity, end_opacity))
+            start_opacity = current
+
         animation = self.create_fade_animation(duration, MaterialDesignEasing.ACCELERATED, "fade_out")
         animation.setStartValue(start_opacity)
         animation.setEndValue(end_opacity)
+        self._begin_snapshot("fade_out", start_opacity, hide_on_finish)
 
-        if hide_on_finish:
-            animation.finished.connect(self.target.hide)
-
-        if callback:
-            animation.finished.connect(callback)
-
-        self._active_animations.add("fade_out")
-        animation.start()
+        self._start("fade_out", animation, self.target.hide if hide_on_finish else None, callback)
         return animation
 
     def scale_in_from_center(
@@ -129,7 +392,7 @@ class AnimationManager(QObject):
             scale_factor: float = 0.8,
             duration: int = MaterialDesignTiming.MEDIUM,
             callback: Optional[Callable] = None
-    ) -> QPropertyAnimation:
+    ) -> Tween:
         """Material Design scale-in from center point"""
         current_size = self.target.size()
         final_rect = QRect(
@@ -149,20 +412,22 @@ class AnimationManager(QObject):
             start_height
         )
 
+        if self._retarget():
+            self._hand_back_layer()
+            current = self.target.geometry()
+            duration = self._time_left(duration, (current, start_rect, final_rect))
+            start_rect = current
+
         animation = self.create_geometry_animation(duration, MaterialDesignEasing.DECELERATED, "scale_in")
         animation.setStartValue(start_rect)
         animation.setEndValue(final_rect)
 
-        if callback:
-            animation.finished.connect(callback)
-
         # Set initial state
         self.target.setGeometry(start_rect)
         self.target.show()
         self.target.raise_()
 
-        self._active_animations.add("scale_in")
-        animation.start()
+        self._start("scale_in", animation, callback)
         return animation
 
     def scale_out_to_center(
@@ -172,8 +437,10 @@ class AnimationManager(QObject):
             duration: int = MaterialDesignTiming.MEDIUM,
             hide_on_finish: bool = True,
             callback: Optional[Callable] = None
-    ) -> QPropertyAnimation:
+    ) -> Tween:
         """Material Design scale-out to center point"""
+        if self._retarget():
+            self._hand_back_layer()
         if center_pos is None:
             center_pos = self.target.geometry().center()
 
@@ -193,14 +460,7 @@ class AnimationManager(QObject):
         animation.setStartValue(current_rect)
         animation.setEndValue(end_rect)
 
-        if hide_on_finish:
-            animation.finished.connect(self.target.hide)
-
-        if callback:
-            animation.finished.connect(callback)
-
-        self._active_animations.add("scale_out")
-        animation.start()
+        self._start("scale_out", animation, self.target.hide if hide_on_finish else None, callback)
         return animation
 
     def combined_fade_and_scale_in(
@@ -211,15 +471,8 @@ class AnimationManager(QObject):
             opacity_end: float = 1.0,
             duration: int = MaterialDesignTiming.MEDIUM,
             callback: Optional[Callable] = None
-    ) -> QParallelAnimationGroup:
+    ) -> TweenGroup:
         """Combined fade and scale animation for Material Design entrance"""
-        # Create individual animations without auto-starting
-        fade_anim = self.create_fade_animation(duration, MaterialDesignEasing.DECELERATED, "combined_fade")
-        fade_anim.setStartValue(opacity_start)
-        fade_anim.setEndValue(opacity_end)
-
-        scale_anim = self.create_geometry_animation(duration, MaterialDesignEasing.DECELERATED, "combined_scale")
-
         # Setup geometry values
         current_size = self.target.size()
         final_rect = QRect(
@@ -238,29 +491,30 @@ class AnimationManager(QObject):
             start_height
         )
 
-        scale_anim.setStartValue(start_rect)
-        scale_anim.setEndValue(final_rect)
+        if self._retarget():
+            opacity, rect = self._presented_opacity(), self._presented_geometry()
+            duration = self._time_left(duration, (opacity, opacity_start, opacity_end), (rect, start_rect, final_rect))
+            opacity_start, start_rect = opacity, rect
 
-        # Create parallel group
-        group = QParallelAnimationGroup(self)
-        group.addAnimation(fade_anim)
-        group.addAnimation(scale_anim)
+        # Retarget the pooled animations without auto-starting them
+        fade_anim = self.create_fade_animation(duration, MaterialDesignEasing.DECELERATED, "combined_fade")
+        fade_anim.setStartValue(opacity_start)
+        fade_anim.setEndValue(opacity_end)
 
-        if callback:
-            group.finished.connect(callback)
+        scale_anim = self._pooled_animation("combined_scale", self._motion_property(), duration,
+                                            MaterialDesignEasing.DECELERATED, self._motion_target())
+        scale_anim.setStartValue(start_rect)
+        scale_anim.setEndValue(final_rect)
 
-        # Store group
-        self.animation_groups["combined_in"] = group
-        group.finished.connect(lambda: self._on_animation_finished("combined_in"))
+        group = self._pooled_group("combined_in", fade_anim, scale_anim)
 
-        # Set initial state
-        self.target.setGeometry(start_rect)
+        # Set initial state; a snapshot is grabbed at the final size and scaled
+        self.target.setGeometry(final_rect if self._opacity_layer() else start_rect)
         self.target.setWindowOpacity(opacity_start)
-        self.target.show()
-        self.target.raise_()
+        self._show_target()
+        self._begin_snapshot("combined_in", opacity_start)
 
-        self._active_animations.add("combined_in")
-        group.start()
+        self._start("combined_in", group, callback)
         return group
 
     def combined_fade_and_scale_out(
@@ -272,18 +526,11 @@ class AnimationManager(QObject):
             duration: int = MaterialDesignTiming.MEDIUM,
             hide_on_finish: bool = True,
             callback: Optional[Callable] = None
-    ) -> QParallelAnimationGroup:
+    ) -> TweenGroup:
         """Combined fade and scale animation for Material Design exit"""
         if center_pos is None:
             center_pos = self.target.geometry().center()
 
-        # Create individual animations
-        fade_anim = self.create_fade_animation(duration, MaterialDesignEasing.ACCELERATED, "combined_fade_out")
-        fade_anim.setStartValue(opacity_start)
-        fade_anim.setEndValue(opacity_end)
-
-        scale_anim = self.create_geometry_animation(duration, MaterialDesignEasing.ACCELERATED, "combined_scale_out")
-
         # Setup geometry values
         current_rect = self.target.geometry()
         end_width = int(current_rect.width() * scale_factor)
@@ -295,33 +542,32 @@ class AnimationManager(QObject):
             end_height
         )
 
-        scale_anim.setStartValue(current_rect)
-        scale_anim.setEndValue(end_rect)
-
-        # Create parallel group
-        group = QParallelAnimationGroup(self)
-        group.addAnimation(fade_anim)
-        group.addAnimation(scale_anim)
+        if self._retarget():
+            opacity, rect = self._presented_opacity(), self._presented_geometry()
+            duration = self._time_left(duration, (opacity, opacity_start, opacity_end), (rect, current_rect, end_rect))
+            opacity_start, current_rect = opacity, rect
 
-        if hide_on_finish:
-            group.finished.connect(self.target.hide)
+        # Retarget the pooled animations
+        fade_anim = self.create_fade_animation(duration, MaterialDesignEasing.ACCELERATED, "combined_fade_out")
+        fade_anim.setStartValue(opacity_start)
+        fade_anim.setEndValue(opacity_end)
 
-        if callback:
-            group.finished.connect(callback)
+        scale_anim = self._pooled_animation("combined_scale_out", self._motion_property(), duration,
+                                            MaterialDesignEasing.ACCELERATED, self._motion_target())
+        scale_anim.setStartValue(current_rect)
+        scale_anim.setEndValue(end_rect)
 
-        # Store group
-        self.animation_groups["combined_out"] = group
-        group.finished.connect(lambda: self._on_animation_finished("combined_out"))
+        group = self._pooled_group("combined_out", fade_anim, scale_anim)
+        self._begin_snapshot("combined_out", opacity_start, hide_on_finish)
 
-        self._active_animations.add("combined_out")
-        group.start()
+        self._start("combined_out", group, self.target.hide if hide_on_finish else None, callback)
         return group
 
     def create_floating_icon_show_animation(
             self,
             start_offset: QPoint = QPoint(0, 16),
             duration: int = MaterialDesignTiming.MEDIUM
-    ) -> QParallelAnimationGroup:
+    ) -> TweenGroup:
         """Animation for showing floating action button"""
         # Geometry animation (slide up effect)
         start_pos = self.target.pos() + start_offset
@@ -329,55 +575,84 @@ class AnimationManager(QObject):
 
         start_size = QSize(0, 0)
         end_size = self.target.size()
+        start_rect, end_rect = QRect(start_pos, start_size), QRect(end_pos, end_size)
+        opacity = 0.0
 
-        geometry_anim = self.create_geometry_animation(duration, MaterialDesignEasing.DECELERATED, "fab_geometry")
-        geometry_anim.setStartValue(QRect(start_pos, start_size))
-        geometry_anim.setEndValue(QRect(end_pos, end_size))
+        if self._retarget():
+            current_opacity, current_rect = self._presented_opacity(), self._presented_geometry()
+            duration = self._time_left(duration, (current_opacity, 0.0, 1.0), (current_rect, start_rect, end_rect))
+            opacity, start_rect = current_opacity, current_rect
+
+        geometry_anim = self._pooled_animation("fab_geometry", self._motion_property(), duration,
+                                               MaterialDesignEasing.DECELERATED, self._motion_target())
+        geometry_anim.setStartValue(start_rect)
+        geometry_anim.setEndValue(end_rect)
 
         # Fade animation
         fade_anim = self.create_fade_animation(duration, MaterialDesignEasing.DECELERATED, "fab_fade")
-        fade_anim.setStartValue(0.0)
+        fade_anim.setStartValue(opacity)
         fade_anim.setEndValue(1.0)
 
-        # Combine animations
-        group = QParallelAnimationGroup(self)
-        group.addAnimation(geometry_anim)
-        group.addAnimation(fade_anim)
+        group = self._pooled_group("fab_show", geometry_anim, fade_anim)
 
-        self.animation_groups["fab_show"] = group
-        group.finished.connect(lambda: self._on_animation_finished("fab_show"))
+        self._show_target()
+        self._begin_snapshot("fab_show", opacity)
 
-        self.target.show()
-        self.target.raise_()
-
-        self._active_animations.add("fab_show")
-        group.start()
+        self._start("fab_show", group)
         return group
 
     def create_floating_icon_hide_animation(
             self,
             duration: int = MaterialDesignTiming.SHORT,
             callback: Optional[Callable] = None
-    ) -> QPropertyAnimation:
+    ) -> Tween:
         """Animation for hiding floating action button"""
+        opacity = 1.0
+        if self._retarget():
+            opacity = self._presented_opacity()
+            duration = self._time_left(duration, (opacity, 1.0, 0.0))
+
         animation = self.create_fade_animation(duration, MaterialDesignEasing.ACCELERATED, "fab_hide")
-        animation.setStartValue(1.0)
+        animation.setStartValue(opacity)
         animation.setEndValue(0.0)
-        animation.finished.connect(self.target.hide)
+        self._begin_snapshot("fab_hide", opacity, hide_on_finish=True)
 
-        if callback:
-            animation.finished.connect(callback)
+        self._start("fab_hide", animation, self.target.hide, callback)
+        return animation
 
-        self._active_animations.add("fab_hide")
-        animation.start()
+    def _supports_press_scale(self) -> bool:
+        return self.target.metaObject().indexOfProperty("pressScale") >= 0
+
+    def _animate_press_scale(self, end_scale: float, duration: int, animation_id: str) -> Tween:
+        """Animate the target's paint-time ``pressScale`` property.
+
+        Press and release share the property, so each stops the other and
+        starts from the current scale. Widget geometry is never touched.
+        """
+        for other_id in ("button_press", "button_release"):
+            if other_id != animation_id:
+                self.stop_animation(other_id)
+
+        animation = self._pooled_animation(animation_id, b"pressScale", duration, MaterialDesignEasing.STANDARD)
+        animation.setStartValue(float(self.target.property("pressScale")))
+        animation.setEndValue(float(end_scale))
+
+        self._start(animation_id, animation)
         return animation
 
     def create_button_press_animation(
             self,
             scale_factor: float = 0.95,
             duration: int = MaterialDesignTiming.FAST
-    ) -> QPropertyAnimation:
-        """Material Design button press feedback animation"""
+    ) -> Tween:
+        """Material Design button press feedback animation.
+
+        Targets exposing a ``pressScale`` property are scaled at paint time;
+        others fall back to animating their geometry.
+        """
+        if self._supports_press_scale():
+            return self._animate_press_scale(scale_factor, duration, "button_press")
+
         current_rect = self.target.geometry()
         center = current_rect.center()
 
@@ -392,16 +667,18 @@ class AnimationManager(QObject):
         animation.setStartValue(current_rect)
         animation.setEndValue(scaled_rect)
 
-        self._active_animations.add("button_press")
-        animation.start()
+        self._start("button_press", animation)
         return animation
 
     def create_button_release_animation(
             self,
             original_rect: Optional[QRect] = None,
             duration: int = MaterialDesignTiming.FAST
-    ) -> QPropertyAnimation:
+    ) -> Tween:
         """Material Design button release feedback animation"""
+        if self._supports_press_scale():
+            return self._animate_press_scale(1.0, duration, "button_release")
+
         if original_rect is None:
             # Calculate original rect from current scaled rect (assuming 0.95 scale factor)
             current_rect = self.target.geometry()
@@ -416,29 +693,40 @@ class AnimationManager(QObject):
         animation.setStartValue(self.target.geometry())
         animation.setEndValue(original_rect)
 
-        self._active_animations.add("button_release")
-        animation.start()
+        self._start("button_release", animation)
         return animation
 
+    def _halt(self, animation_id: str):
+        """Stop a run where it is and drop its callbacks; a snapshot layer stays up"""
+        animation = self.animations.get(animation_id) or self.animation_groups.get(animation_id)
+        if animation is not None:
+            animation.stop()
+        self._active_animations.discard(animation_id)
+        self._run_callbacks.pop(animation_id, None)
+        self._end_run(animation_id, completed=False)
+        self._snapshot_runs.pop(animation_id, None)
+
     def stop_animation(self, animation_id: str) -> bool:
-        """Stop specific animation by ID"""
-        if animation_id in self.animations:
-            self.animations[animation_id].stop()
-            self._active_animations.discard(animation_id)
-            return True
-        elif animation_id in self.animation_groups:
-            self.animation_groups[animation_id].stop()
-            self._active_animations.discard(animation_id)
-            return True
-        return False
+        """Stop specific animation by ID where it is; its pending callbacks are dropped.
+
+        Nothing jumps: a child target's snapshot layer stays at its current
+        opacity and geometry until the next transition continues from it.
+        """
+        if animation_id not in self.animations and animation_id not in self.animation_groups:
+            return False
+        self._halt(animation_id)
+        self._restore_shadow()
+        return True
 
     def stop_all_animations(self):
-        """Stop all active animations"""
+        """Stop all active animations where they are (see ``stop_animation``)"""
         for animation in self.animations.values():
             animation.stop()
         for group in self.animation_groups.values():
             group.stop()
-        self._active_animations.clear()
+        for animation_id in list(self._active_animations):
+            self._halt(animation_id)
+        self._restore_shadow()
 
     def is_animation_active(self, animation_id: str) -> bool:
         """Check if specific animation is currently running"""
@@ -451,6 +739,11 @@ class AnimationManager(QObject):
     def _on_animation_finished(self, animation_id: str):
         """Internal handler for animation completion"""
         self._active_animations.discard(animation_id)
+        self._end_run(animation_id, completed=True)
+        self._end_snapshot(animation_id)
+        self._restore_shadow()
+        for callback in self._run_callbacks.pop(animation_id, ()):
+            callback()
         self.animation_finished.emit(animation_id)
 
         if not self._active_animations:
@@ -460,15 +753,19 @@ class AnimationManager(QObject):
         """Clean up all animations and groups"""
         self.stop_all_animations()
 
-        for animation in self.animations.values():
-            animation.deleteLater()
-
         for group in self.animation_groups.values():
-            group.deleteLater()
+            self._dispose(group)
+        for animation in self.animations.values():
+            self._dispose(animation)
 
         self.animations.clear()
         self.animation_groups.clear()
         self._active_animations.clear()
+        if self._snapshot is not None:
+            # A halted layer hands back to the live target, shown if it was visible at all
+            self._snapshot.end(show_target=self._snapshot.opacity > 0.0)
+            self._snapshot.deleteLater()
+            self._snapshot = None
 
 
 # Utility functions for common animation patterns
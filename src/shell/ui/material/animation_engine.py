@@ -0,0 +1,372 @@
+"""
+Shell-wide animation engine
+
+Every AnimationManager tween runs on one engine driven by a single frame
+timer of the shell clock (``src.shell.clock``). A tick first computes the
+value of every running tween, then writes all properties in one pass
+through setters resolved when the tween was created, and only then emits
+``finished`` for the tweens that completed, so completion callbacks always
+see a fully updated frame. Widget updates requested during the pass are
+coalesced by Qt into one paint per window on the next event-loop turn. The
+timer runs only while a tween does.
+
+``Tween`` and ``TweenGroup`` mirror the parts of QPropertyAnimation and
+QParallelAnimationGroup that the managers and their callers use: values,
+duration, easing, ``start``/``stop``/``setCurrentTime``, ``state`` and the
+``valueChanged``/``finished`` signals. As with Qt, ``start()`` applies the
+start value immediately and a zero-length tween finishes inside it.
+Tweens hold their target weakly, so a widget's own animations never keep it
+alive.
+"""
+
+import weakref
+from typing import Callable, List, Optional
+
+from PyQt6.QtCore import (
+    QAbstractAnimation, QEasingCurve, QObject, QPoint, QRect, QSize, pyqtSignal,
+)
+from PyQt6.QtWidgets import QWidget
+
+from src.shell.clock import current_clock
+from .animation_governor import animation_governor
+
+
+# Interval of the engine's frame timer (~60 fps)
+FRAME_INTERVAL_MS = 16
+
+_curves = {}
+
+
+def easing_curve(easing) -> QEasingCurve:
+    """Shared QEasingCurve for an easing type (curves pass through unchanged)"""
+    if isinstance(easing, QEasingCurve):
+        return easing
+    curve = _curves.get(easing)
+    if curve is None:
+        curve = _curves[easing] = QEasingCurve(easing)
+    return curve
+
+
+def interpolator(start, end) -> Callable[[float], object]:
+    """Function of eased progress (0..1) returning the value between ``start`` and ``end``.
+
+    Component deltas are taken once per run, so a frame costs one multiply
+    and round per component.
+    """
+    if isinstance(start, QRect):
+        x, y, w, h = start.x(), start.y(), start.width(), start.height()
+        dx, dy, dw, dh = end.x() - x, end.y() - y, end.width() - w, end.height() - h
+        return lambda p: QRect(round(x + dx * p), round(y + dy * p), round(w + dw * p), round(h + dh * p))
+    if isinstance(start, QPoint):
+        x, y = start.x(), start.y()
+        dx, dy = end.x() - x, end.y() - y
+        return lambda p: QPoint(round(x + dx * p), round(y + dy * p))
+    if isinstance(start, QSize):
+        w, h = start.width(), start.height()
+        dw, dh = end.width() - w, end.height() - h
+        return lambda p: QSize(round(w + dw * p), round(h + dh * p))
+    delta = end - start
+    if isinstance(start, int) and not isinstance(start, bool) and isinstance(end, int):
+        return lambda p: round(start + delta * p)
+    return lambda p: start + delta * p
+
+
+def interpolate(start, end, progress: float):
+    """Value between ``start`` and ``end`` at eased ``progress`` (0..1)"""
+    return interpolator(start, end)(progress)
+
+
+def property_setter(target: QObject, property_name: bytes) -> Callable:
+    """Direct setter for the common widget properties, setProperty otherwise.
+
+    The setter references ``target`` weakly and raises RuntimeError, like a
+    deleted Qt object, once the target is gone.
+    """
+    ref = weakref.ref(target)
+    if isinstance(target, QWidget) and property_name == b"geometry":
+        write = QWidget.setGeometry
+    elif isinstance(target, QWidget) and property_name == b"windowOpacity":
+        write = QWidget.setWindowOpacity
+    else:
+        name = property_name.decode()
+
+        def write(obj, value):
+            obj.setProperty(name, value)
+
+    def setter(value):
+        obj = ref()
+        if obj is None:
+            raise RuntimeError("tween target has been deleted")
+        write(obj, value)
+    return setter
+
+
+class AnimationEngine(QObject):
+    """Advances every running tween from one frame timer.
+
+    Args:
+        interval_ms: Frame timer interval
+    """
+
+    def __init__(self, interval_ms: int = FRAME_INTERVAL_MS, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self._running = {}  # Tween -> None, in start order
+        self._frames = None  # repeating TimerHandle while tweens run
+        self._frames_clock = None
+
+    def now_ms(self) -> float:
+        return current_clock().now_ms()
+
+    @property
+    def active_count(self) -> int:
+        return len(self._running)
+
+    def register(self, tween: "Tween"):
+        self._running[tween] = None
+        clock = current_clock()
+        if self._frames is None or not self._frames.active or self._frames_clock is not clock:
+            # (Re)start the frame timer, on the newly installed clock if it changed
+            self._stop_frames()
+            self._frames = clock.call_every(self.interval_ms, self.tick)
+            self._frames_clock = clock
+
+    def unregister(self, tween: "Tween"):
+        self._running.pop(tween, None)
+
+    def tick(self):
+        """Advance all running tweens to now: compute, write, then finish"""
+        if not self._running:
+            self._stop_frames()
+            return
+        animation_governor().record_frame()
+
+        now = self.now_ms()
+        frame = [(tween, min(now - tween._started_at, tween._duration)) for tween in self._running]
+        for tween, time_ms in frame:
+            if tween._running:
+                tween._write(time_ms)
+        for tween, time_ms in frame:
+            if tween._running and time_ms >= tween._duration:
+                tween._complete()
+
+        if not self._running:
+            self._stop_frames()
+
+    def _stop_frames(self):
+        if self._frames is not None:
+            self._frames.cancel()
+            self._frames = None
+            self._frames_clock = None
+
+
+_engine = None
+
+
+def animation_engine() -> AnimationEngine:
+    """Return the engine shared by every AnimationManager"""
+    global _engine
+    if _engine is None:
+        _engine = AnimationEngine()
+    return _engine
+
+
+class Tween(QObject):
+    """Animates one property of ``target`` on the shared engine.
+
+    ``on_frame`` is an optional plain callable run after every applied
+    value; it is cheaper than a ``valueChanged`` connection on the per-frame
+    path.
+    """
+
+    finished = pyqtSignal()
+    valueChanged = pyqtSignal(object)
+
+    def __init__(self, target: QObject, property_name: bytes, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._target = weakref.ref(target)
+        self._property = bytes(property_name)
+        self._setter = property_setter(target, self._property)
+        self._duration = 250
+        self._curve = easing_curve(QEasingCurve.Type.Linear)
+        self._start_value = None
+        self._end_value = None
+        self._lerp = None  # interpolator of the current run
+        self._value = None
+        self._time = 0
+        self._started_at = 0.0
+        self._running = False
+        self.on_frame: Optional[Callable[[], None]] = None
+
+    def targetObject(self) -> Optional[QObject]:
+        return self._target()
+
+    def propertyName(self) -> bytes:
+        return self._property
+
+    def setDuration(self, duration: int):
+        self._duration = max(0, int(duration))
+
+    def duration(self) -> int:
+        return self._duration
+
+    def totalDuration(self) -> int:
+        return self._duration
+
+    def setEasingCurve(self, easing):
+        self._curve = easing_curve(easing)
+
+    def easingCurve(self) -> QEasingCurve:
+        return self._curve
+
+    def setStartValue(self, value):
+        self._start_value = value
+
+    def startValue(self):
+        return self._start_value
+
+    def setEndValue(self, value):
+        self._end_value = value
+
+    def endValue(self):
+        return self._end_value
+
+    def currentValue(self):
+        return self._value
+
+    def currentTime(self) -> int:
+        return self._time
+
+    def state(self) -> QAbstractAnimation.State:
+        return QAbstractAnimation.State.Running if self._running else QAbstractAnimation.State.Stopped
+
+    def start(self):
+        """Apply the start value and run; a zero-length tween finishes here"""
+        if self._running:
+            return
+        engine = animation_engine()
+        # Like Qt, a missing start value is read from the property when started
+        start = (self._start_value if self._start_value is not None
+                 else self._target().property(self._property.decode()))
+        self._lerp = interpolator(start, self._end_value)
+        self._running = True
+        self._started_at = engine.now_ms()
+        engine.register(self)
+        self.setCurrentTime(0)
+
+    def stop(self):
+        """Stop where it is; ``finished`` is not emitted"""
+        if self._running:
+            self._running = False
+            animation_engine().unregister(self)
+
+    def setCurrentTime(self, time_ms: int):
+        """Seek and apply the value at ``time_ms``; seeking a running tween to its end finishes it"""
+        time_ms = min(max(0, time_ms), self._duration)
+        if self._running:
+            self._started_at = animation_engine().now_ms() - time_ms
+        elif self._start_value is not None:
+            self._lerp = interpolator(self._start_value, self._end_value)
+        self._write(time_ms)
+        if self._running and time_ms >= self._duration:
+            self._complete()
+
+    def _write(self, time_ms: float):
+        self._time = int(time_ms)
+        progress = time_ms / self._duration if self._duration else 1.0
+        value = self._lerp(self._curve.valueForProgress(progress))
+        self._value = value
+        try:
+            self._setter(value)
+        except RuntimeError:
+            # Target deleted underneath the tween
+            self.stop()
+            return
+        if self.on_frame is not None:
+            self.on_frame()
+        self.valueChanged.emit(value)
+
+    def _complete(self):
+        self._running = False
+        animation_engine().unregister(self)
+        self.finished.emit()
+
+
+class TweenGroup(QObject):
+    """Runs tweens in parallel; finishes when all of them have.
+
+    Unlike QParallelAnimationGroup the group does not take ownership of its
+    tweens, so pooled tweens keep their parent. Pooled tweens also outlive
+    the group, so a replaced group must be ``clear()``-ed to drop its
+    connections to them.
+    """
+
+    finished = pyqtSignal()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._animations: List[Tween] = []
+        self._connections = []  # finished connection of each tween, in _animations order
+        self._pending = set()
+        self._running = False
+
+    def addAnimation(self, animation: Tween):
+        self._animations.append(animation)
+        self._connections.append(animation.finished.connect(lambda: self._child_finished(animation)))
+
+    def clear(self):
+        """Stop, disconnect from and forget every tween"""
+        self.stop()
+        for animation, connection in zip(self._animations, self._connections):
+            try:
+                animation.finished.disconnect(connection)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected, or the tween was deleted
+        self._animations.clear()
+        self._connections.clear()
+
+    def animationAt(self, index: int) -> Tween:
+        return self._animations[index]
+
+    def animationCount(self) -> int:
+        return len(self._animations)
+
+    def duration(self) -> int:
+        return max((a.totalDuration() for a in self._animations), default=0)
+
+    def totalDuration(self) -> int:
+        return self.duration()
+
+    def state(self) -> QAbstractAnimation.State:
+        return QAbstractAnimation.State.Running if self._running else QAbstractAnimation.State.Stopped
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._pending = set(self._animations)
+        for animation in self._animations:
+            animation.start()
+        if self._running and not self._pending:
+            self._finish()
+
+    def stop(self):
+        self._running = False
+        self._pending.clear()
+        for animation in self._animations:
+            animation.stop()
+
+    def setCurrentTime(self, time_ms: int):
+        for animation in self._animations:
+            animation.setCurrentTime(min(time_ms, animation.totalDuration()))
+
+    def _child_finished(self, animation: Tween):
+        if not self._running:
+            return
+        self._pending.discard(animation)
+        if not self._pending:
+            self._finish()
+
+    def _finish(self):
+        self._running = False
+        self.finished.emit()
@@ -0,0 +1,223 @@
+"""
+Global animation governor
+
+One governor is shared by every AnimationManager. While animations run it
+timestamps their frames (the shared AnimationEngine reports each tick once)
+and keeps a window of recent frame intervals. When the mean interval of a
+full window exceeds the frame budget, the automatic tier steps down one
+level; after ``RECOVERY_S`` seconds without an over-budget window it steps
+back up one level, so a tier that no longer animates still recovers.
+
+An explicit performance mode pins the tier instead. Every started run is
+counted against the tier it was started with; ``usage_report()`` returns
+the counts together with the measured frame times.
+"""
+
+from collections import Counter, deque
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.shell.clock import current_clock
+
+
+class AnimationTier(IntEnum):
+    """Animation variants from most to least expensive"""
+    FULL = 0            # as designed
+    REDUCED = 1         # shorter durations, shadows off during motion
+    OPACITY_ONLY = 2    # geometry jumps to its end value, only opacity animates
+    INSTANT = 3         # every property jumps to its end value
+
+
+# Mean frame interval (ms) above which a window counts as dropping frames
+FRAME_BUDGET_MS = 25.0
+
+# Frame intervals per evaluation window
+FRAME_WINDOW = 20
+
+# Seconds without an over-budget window before stepping back up one tier
+RECOVERY_S = 30.0
+
+# Ticks or value changes closer than this belong to the same frame (ms)
+SAME_FRAME_MS = 2.0
+
+# Longer intervals are pauses between runs, not frames (ms)
+MAX_FRAME_MS = 500.0
+
+# Duration multiplier per tier
+DURATION_SCALE = MappingProxyType({
+    AnimationTier.FULL: 1.0,
+    AnimationTier.REDUCED: 0.5,
+    AnimationTier.OPACITY_ONLY: 0.5,
+    AnimationTier.INSTANT: 0.0,
+})
+
+
+@dataclass(frozen=True)
+class GovernorReport:
+    """Snapshot of governor usage since the last reset()"""
+    tier: AnimationTier                  # tier new runs start with
+    performance_mode: Optional[AnimationTier]  # pinned tier, None when automatic
+    runs: Mapping[str, int]              # tier name -> runs started with it
+    downgrades: int
+    upgrades: int
+    frames: int                          # frame intervals measured
+    mean_frame_ms: float
+    worst_frame_ms: float
+
+
+def parse_tier(mode) -> Optional[AnimationTier]:
+    """Return the AnimationTier for a tier, its name or number; None/"auto" -> None"""
+    if mode is None or isinstance(mode, AnimationTier):
+        return mode
+    if isinstance(mode, str):
+        if mode.lower() == "auto":
+            return None
+        try:
+            return AnimationTier[mode.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown performance mode: {mode!r}") from None
+    return AnimationTier(mode)
+
+
+class AnimationGovernor(QObject):
+    """Chooses the animation tier from measured frame delivery.
+
+    Args:
+        budget_ms:  Mean frame interval above which the tier degrades
+        window:     Frame intervals per evaluation
+        recovery_s: Quiet seconds before the tier improves again
+    """
+
+    tier_changed = pyqtSignal(object)  # AnimationTier
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, window=FRAME_WINDOW, recovery_s=RECOVERY_S, parent=None):
+        super().__init__(parent)
+        self.budget_ms = budget_ms
+        self.recovery_s = recovery_s
+        self._window = deque(maxlen=window)
+        self._mode = None
+        self._auto_tier = AnimationTier.FULL
+        self._last_frame = None
+        self._last_change = current_clock().now_ms()
+        self.reset()
+
+    @property
+    def performance_mode(self) -> Optional[AnimationTier]:
+        return self._mode
+
+    @performance_mode.setter
+    def performance_mode(self, mode: Union[AnimationTier, str, int, None]):
+        self.set_performance_mode(mode)
+
+    def set_performance_mode(self, mode: Union[AnimationTier, str, int, None]):
+        """Pin every animation to ``mode``; None or "auto" measures and adapts"""
+        previous = self.tier
+        self._mode = parse_tier(mode)
+        if self.tier != previous:
+            self.tier_changed.emit(self.tier)
+
+    @property
+    def tier(self) -> AnimationTier:
+        """Tier new runs start with"""
+        return self._auto_tier if self._mode is None else self._mode
+
+    def run_started(self) -> AnimationTier:
+        """Count a new run and return the tier it should use"""
+        if (self._mode is None and self._auto_tier > AnimationTier.FULL
+                and (current_clock().now_ms() - self._last_change) / 1000 >= self.recovery_s):
+            self._set_auto_tier(self._auto_tier - 1)
+            self._upgrades += 1
+        # Time between runs is not a frame
+        self._last_frame = None
+        tier = self.tier
+        self._runs[tier] += 1
+        return tier
+
+    def record_frame(self):
+        """Timestamp one frame; called once per AnimationEngine tick"""
+        now = current_clock().now_ms()
+        last, self._last_frame = self._last_frame, now
+        if last is None:
+            return
+        interval = now - last
+        if interval < SAME_FRAME_MS:
+            # Another tick within the same frame
+            self._last_frame = last
+            return
+        if interval > MAX_FRAME_MS:
+            return
+        self.add_frame_interval(interval)
+
+    def add_frame_interval(self, interval_ms: float):
+        """Record one frame interval and re-evaluate the automatic tier"""
+        self._frames += 1
+        self._frame_total += interval_ms
+        self._worst = max(self._worst, interval_ms)
+        self._window.append(interval_ms)
+        if len(self._window) < self._window.maxlen:
+            return
+
+        over_budget = sum(self._window) / len(self._window) > self.budget_ms
+        self._window.clear()
+        if not over_budget:
+            return
+        self._last_change = current_clock().now_ms()
+        if self._mode is None and self._auto_tier < AnimationTier.INSTANT:
+            self._set_auto_tier(self._auto_tier + 1)
+            self._downgrades += 1
+
+    def _set_auto_tier(self, tier):
+        self._auto_tier = AnimationTier(tier)
+        self._last_change = current_clock().now_ms()
+        if self._mode is None:
+            self.tier_changed.emit(self._auto_tier)
+
+    def usage_report(self) -> GovernorReport:
+        return GovernorReport(
+            tier=self.tier,
+            performance_mode=self._mode,
+            runs=MappingProxyType({tier.name: self._runs[tier] for tier in AnimationTier}),
+            downgrades=self._downgrades,
+            upgrades=self._upgrades,
+            frames=self._frames,
+            mean_frame_ms=self._frame_total / self._frames if self._frames else 0.0,
+            worst_frame_ms=self._worst,
+        )
+
+    def reset(self):
+        """Return to the FULL tier and clear all measurements and counts"""
+        self._auto_tier = AnimationTier.FULL
+        self._last_change = current_clock().now_ms()
+        self._last_frame = None
+        self._window.clear()
+        self._runs = Counter()
+        self._downgrades = 0
+        self._upgrades = 0
+        self._frames = 0
+        self._frame_total = 0.0
+        self._worst = 0.0
+
+
+_governor = None
+
+
+def animation_governor() -> AnimationGovernor:
+    """Return the governor shared by every AnimationManager"""
+    global _governor
+    if _governor is None:
+        _governor = AnimationGovernor()
+    return _governor
+
+
+def set_performance_mode(mode: Union[AnimationTier, str, int, None]):
+    """Pin (or, with None/"auto", release) the tier of every animation"""
+    animation_governor().set_performance_mode(mode)
+
+
+def usage_report() -> GovernorReport:
+    """Return how often each tier was used and the measured frame times"""
+    return animation_governor().usage_report()
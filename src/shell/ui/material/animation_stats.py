@@ -0,0 +1,170 @@
+"""
+Frame-delivery statistics for AnimationManager runs
+
+Every run of an animation id is recorded when it finishes or is stopped:
+the planned duration (after the governor's tier was applied), the actual
+duration on the shell clock, how many frames delivered a value update, and
+the longest gap between two updates (the start counts as the first update).
+Records are kept per id in a bounded history shared by all managers;
+``summary()`` reduces them to percentiles and ``export_trace()`` writes
+them as Chrome trace events (chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+from collections import deque
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+from src.shell.clock import current_clock
+from .animation_governor import SAME_FRAME_MS
+
+
+# Records kept per animation id
+STATS_HISTORY = 256
+
+
+@dataclass(frozen=True)
+class AnimationRecord:
+    """One run of an animation id"""
+    animation_id: str
+    tier: str
+    start_s: float          # clock time at start, in seconds
+    planned_ms: float
+    actual_ms: float
+    updates: int            # frames that delivered a value update
+    max_gap_ms: float       # longest time between updates
+    completed: bool         # False when the run was stopped or restarted
+
+
+@dataclass(frozen=True)
+class AnimationSummary:
+    """Percentiles over the completed runs of one animation id"""
+    runs: int
+    stopped: int
+    planned_ms: float       # median
+    actual_p50_ms: float
+    actual_p95_ms: float
+    updates_p50: float
+    max_gap_p50_ms: float
+    max_gap_p95_ms: float
+    max_gap_worst_ms: float
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of ``values`` (0.0 when empty)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * fraction // 1))
+    return float(ordered[int(rank) - 1])
+
+
+class RunProbe:
+    """Measures one run while it is active"""
+    __slots__ = ("animation_id", "tier", "planned_ms", "start", "last", "updates", "max_gap")
+
+    def __init__(self, animation_id, tier, planned_ms):
+        self.animation_id = animation_id
+        self.tier = tier
+        self.planned_ms = planned_ms
+        self.start = self.last = current_clock().now_ms()
+        self.updates = 0
+        self.max_gap = 0.0
+
+    def update(self):
+        now = current_clock().now_ms()
+        gap = now - self.last
+        if self.updates and gap < SAME_FRAME_MS:
+            # Another part of the same run advancing in the same frame
+            return
+        self.updates += 1
+        self.max_gap = max(self.max_gap, gap)
+        self.last = now
+
+    def record(self, completed) -> AnimationRecord:
+        return AnimationRecord(
+            animation_id=self.animation_id,
+            tier=self.tier,
+            start_s=self.start / 1000,
+            planned_ms=self.planned_ms,
+            actual_ms=current_clock().now_ms() - self.start,
+            updates=self.updates,
+            max_gap_ms=self.max_gap,
+            completed=completed,
+        )
+
+
+class AnimationStats:
+    """Bounded per-id history of AnimationRecords"""
+
+    def __init__(self, history=STATS_HISTORY):
+        self.history = history
+        self._records: Dict[str, deque] = {}
+
+    def add(self, record: AnimationRecord):
+        records = self._records.get(record.animation_id)
+        if records is None:
+            records = self._records[record.animation_id] = deque(maxlen=self.history)
+        records.append(record)
+
+    def records(self, animation_id: Optional[str] = None):
+        """Return the kept records of one id, or of every id in start order"""
+        if animation_id is not None:
+            return list(self._records.get(animation_id, ()))
+        return sorted((r for records in self._records.values() for r in records),
+                      key=lambda r: r.start_s)
+
+    def summary(self) -> Mapping[str, AnimationSummary]:
+        """Return {animation id: AnimationSummary} over the kept records"""
+        table = {}
+        for animation_id, records in self._records.items():
+            done = [r for r in records if r.completed]
+            gaps = [r.max_gap_ms for r in done]
+            table[animation_id] = AnimationSummary(
+                runs=len(done),
+                stopped=len(records) - len(done),
+                planned_ms=percentile([r.planned_ms for r in done], 0.5),
+                actual_p50_ms=percentile([r.actual_ms for r in done], 0.5),
+                actual_p95_ms=percentile([r.actual_ms for r in done], 0.95),
+                updates_p50=percentile([r.updates for r in done], 0.5),
+                max_gap_p50_ms=percentile(gaps, 0.5),
+                max_gap_p95_ms=percentile(gaps, 0.95),
+                max_gap_worst_ms=max(gaps, default=0.0),
+            )
+        return MappingProxyType(table)
+
+    def trace_events(self):
+        """Chrome trace "complete" events, one per record"""
+        pid = os.getpid()
+        return [{
+            "name": record.animation_id,
+            "cat": "animation",
+            "ph": "X",
+            "ts": round(record.start_s * 1e6),
+            "dur": round(record.actual_ms * 1e3),
+            "pid": pid,
+            "tid": 0,
+            "args": {key: value for key, value in asdict(record).items()
+                     if key not in ("animation_id", "start_s", "actual_ms")},
+        } for record in self.records()]
+
+    def export_trace(self, path):
+        """Write every kept record to ``path`` in the Chrome trace JSON format"""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, handle)
+
+    def clear(self):
+        self._records.clear()
+
+
+_stats = None
+
+
+def animation_stats() -> AnimationStats:
+    """Return the statistics table shared by every AnimationManager"""
+    global _stats
+    if _stats is None:
+        _stats = AnimationStats()
+    return _stats
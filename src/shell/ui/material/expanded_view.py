@@ -1,17 +1,14 @@
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout, QScrollArea,
     QGraphicsDropShadowEffect, QFrame
 )
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QPushButton
 
-from src.shell.ui.styles import (
-    PRIMARY, PRIMARY_DARK, PRIMARY_HOVER, SURFACE, BORDER,
-    TEXT_PRIMARY, TEXT_ON_PRIMARY,
-    SCROLLBAR_BG, SCROLLBAR_HANDLE, SCROLLBAR_HANDLE_HOVER,
-    SHADOW_MEDIUM, SHADOW_DARK,
-)
+from src.shell.clock import current_clock
+from src.shell.ui.styles import SHADOW_MEDIUM, SHADOW_DARK
+from src.shell.ui.fonts import get_font
 from .animation import AnimationManager
 
 
@@ -37,17 +34,10 @@ class ExpandedFolderView(QFrame):
         self.setup_ui()
         self.animation_manager = AnimationManager(self)
         self.animation_manager.animation_finished.connect(self._on_animation_finished)
+        self.close_button_animation_manager = AnimationManager(self.close_app_button, self)
 
     def setup_ui(self):
         """Material Design 3 surface styling"""
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {SURFACE};
-                border: 1px solid {BORDER};
-                border-radius: 28px;
-            }}
-        """)
-
         # Material Design elevation shadow
         try:
             shadow = QGraphicsDropShadowEffect()
@@ -72,45 +62,13 @@ class ExpandedFolderView(QFrame):
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Material Design typography
-        try:
-            font = QFont("Roboto", 28, QFont.Weight.Medium)
-            if not font.exactMatch():
-                font = QFont("Segoe UI", 28, QFont.Weight.Medium)
-            self.title_label.setFont(font)
-        except Exception:
-            pass
-
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_PRIMARY};
-                background-color: transparent;
-                padding-bottom: 8px;
-                font-weight: 500;
-                letter-spacing: 0px;
-            }}
-        """)
+        self.title_label.setFont(get_font("expanded_title"))
 
         # Material Design filled button for close app
         self.close_app_button = QPushButton("Close App")
         self.close_app_button.setFixedSize(140, 40)
-        self.close_app_button.setStyleSheet(f"""
-            QPushButton {{
-                background: {PRIMARY};
-                border: none;
-                border-radius: 20px;
-                color: {TEXT_ON_PRIMARY};
-                font-size: 14px;
-                font-weight: 500;
-                font-family: 'Roboto', 'Segoe UI', sans-serif;
-                padding: 10px 24px;
-            }}
-            QPushButton:hover {{
-                background: {PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background: {PRIMARY_DARK};
-            }}
-        """)
+        self.close_app_button.setObjectName("CloseAppButton")
+        self.close_app_button.setFont(get_font("button"))
         self.close_app_button.clicked.connect(self.on_close_app_clicked)
         self.close_app_button.hide()
 
@@ -133,34 +91,9 @@ class ExpandedFolderView(QFrame):
         self.scroll_area = QScrollArea()
         self.scroll_area.setObjectName("ExpandedScrollArea")
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background: transparent;
-            }}
-            QScrollBar:vertical {{
-                background-color: {SCROLLBAR_BG};
-                width: 12px;
-                border-radius: 6px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {SCROLLBAR_HANDLE};
-                border-radius: 6px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {SCROLLBAR_HANDLE_HOVER};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: none;
-                background: none;
-                height: 0px;
-            }}
-        """)
 
         grid_widget = QWidget()
-        grid_widget.setStyleSheet("background-color: transparent;")
+        grid_widget.setObjectName("ExpandedGrid")
         self.grid_layout = QGridLayout(grid_widget)
         self.grid_layout.setSpacing(16)  # Material Design grid spacing
         self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
@@ -181,20 +114,14 @@ class ExpandedFolderView(QFrame):
         self.fade_out()
 
     def fade_in(self, center_pos):
-        """Material Design scale-in animation"""
-        # Stop any existing animations
-        self.animation_manager.stop_all_animations()
-
+        """Material Design scale-in animation; a running fade-out is reversed in place"""
         self.animation_manager.combined_fade_and_scale_in(
             center_pos=center_pos,
             callback=self.animation_finished
         )
 
     def fade_out(self):
-        """Material Design scale-out animation"""
-        if self.animation_manager.has_active_animations():
-            return
-
+        """Material Design scale-out animation; a running fade-in is reversed in place"""
         self.animation_manager.combined_fade_and_scale_out(
             hide_on_finish=True,
             callback=self.animation_finished
@@ -212,21 +139,15 @@ class ExpandedFolderView(QFrame):
         """Material Design button reveal animation"""
         if self.close_app_button and self._current_app_name:
             self.close_app_button.setText(f"BACK")
-            self.close_app_button.show()
 
             # Material Design fade-in
-            self.close_app_button.setWindowOpacity(0.0)
-            button_animation = QPropertyAnimation(self.close_app_button, b"windowOpacity")
-            button_animation.setDuration(200)
-            button_animation.setStartValue(0.0)
-            button_animation.setEndValue(1.0)
-            button_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            button_animation.start()
+            self.close_button_animation_manager.fade_in(duration=200)
 
     def hide_close_app_button(self):
         """Hide close button with Material Design transition"""
-        if self.close_app_button:
-            self.close_app_button.hide()
+        manager = self.close_button_animation_manager
+        if self.close_app_button and (not self.close_app_button.isHidden() or manager.has_active_animations()):
+            manager.fade_out(duration=150)
         self._current_app_name = None
 
     def on_close_app_clicked(self):
@@ -248,7 +169,7 @@ class ExpandedFolderView(QFrame):
     def animation_finished(self):
         """Animation completion handler"""
         if self._is_closing:
-            QTimer.singleShot(0, self.safe_hide)
+            current_clock().call_later(0, self.safe_hide)
 
     def _on_animation_finished(self, animation_id: str):
         """Handle specific animation completion"""
@@ -257,7 +178,7 @@ class ExpandedFolderView(QFrame):
     def safe_hide(self):
         """Safe hide with Material Design cleanup"""
         if self._is_closing:
-            QTimer.singleShot(0, self.hide)
+            current_clock().call_later(0, self.hide)
 
     def mousePressEvent(self, event):
         """Accept mouse events to prevent propagation"""
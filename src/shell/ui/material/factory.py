@@ -1,20 +1,30 @@
-from .folder_widget import FolderWidget
-from .managers.expanded_view_manager import ExpandedViewManager
-from .managers.floating_icon_manager import FloatingIconManager
-from .managers.overlay_manager import OverlayManager
+class MaterialUIFactory:
+    """Factory that creates Material Design 3 UI components (the existing implementation).
 
+    Widget modules are imported by the method that first needs them, so
+    creating the factory loads none of them.
+    """
 
-class MaterialUIFactory:
-    """Factory that creates Material Design 3 UI components (the existing implementation)."""
+    def __init__(self, menu_icon_class=None):
+        """
+        Args:
+            menu_icon_class: Optional MenuIcon subclass used for folder previews and
+                             expanded views (e.g. PaintedMenuIcon). Defaults to MenuIcon.
+        """
+        self.menu_icon_class = menu_icon_class
 
     def create_folder_widget(self, ID, folder_name):
-        return FolderWidget(ID, folder_name)
+        from .folder_widget import FolderWidget
+        return FolderWidget(ID, folder_name, icon_class=self.menu_icon_class)
 
     def create_expanded_view_manager(self, folder_widget):
-        return ExpandedViewManager(folder_widget)
+        from .managers.expanded_view_manager import ExpandedViewManager
+        return ExpandedViewManager(folder_widget, icon_class=self.menu_icon_class)
 
     def create_floating_icon_manager(self, folder_widget):
+        from .managers.floating_icon_manager import FloatingIconManager
         return FloatingIconManager(folder_widget)
 
     def create_overlay_manager(self, folder_widget, overlay_parent, overlay_callback):
+        from .managers.overlay_manager import OverlayManager
         return OverlayManager(folder_widget, overlay_parent, overlay_callback)
@@ -2,9 +2,8 @@ from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QPushButton
 from PyQt6.QtGui import QColor
 
-from src.shell.ui.styles import (
-    PRIMARY, PRIMARY_DARK, PRIMARY_HOVER, SHADOW_FAB,
-)
+from src.shell.ui.fonts import get_font
+from src.shell.ui.styles import SHADOW_FAB
 from .animation import AnimationManager
 
 
@@ -22,26 +21,8 @@ class FloatingFolderIcon(QPushButton):
 
     def setup_ui(self):
         """Setup Material Design floating action button"""
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {PRIMARY};
-                border: none;
-                border-radius: 40px;
-                font-size: 20px;
-                font-weight: 500;
-                color: white;
-                font-family: 'Roboto', 'Segoe UI', sans-serif;
-                padding: 12px;
-            }}
-            QPushButton:hover {{
-                background: {PRIMARY_HOVER};
-                transform: scale(1.05);
-            }}
-            QPushButton:pressed {{
-                background: {PRIMARY_DARK};
-                transform: scale(0.95);
-            }}
-        """)
+        self.setObjectName("FloatingFolderIcon")
+        self.setFont(get_font("button"))
 
         self.setText("\u2630")
 
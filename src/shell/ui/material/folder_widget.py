@@ -1,11 +1,15 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtGui import QColor
 from src.shell.ui.styles import (
-    PRIMARY, SURFACE, BORDER, TEXT_PRIMARY, TEXT_DISABLED, TEXT_ON_PRIMARY,
-    DISABLED_BG, DISABLED_BORDER, DISABLED_PREVIEW_BG, DISABLED_PREVIEW_BORDER,
+    PRIMARY, TEXT_ON_PRIMARY,
     SHADOW_LIGHT, SHADOW_PRIMARY_LIGHT, SHADOW_PRIMARY,
     QTA_ICON_COLOR,
 )
+from src.shell.ui.fonts import get_font
+from src.shell.ui.theme import set_style_property
 from PyQt6.QtWidgets import (
     QFrame, QLabel, QGridLayout, QVBoxLayout,
     QGraphicsDropShadowEffect, QSizePolicy
@@ -14,6 +18,60 @@ from PyQt6.QtWidgets import (
 from .menu_icon import MenuIcon
 
 
+# Widths are quantized into buckets of this many pixels before metrics are
+# computed, so dragging a window edge maps many sizes onto one bundle.
+METRICS_BUCKET_PX = 8
+
+# Bounds of ResponsiveMetrics.icon_size, the edge of a folder preview MenuIcon
+PREVIEW_ICON_MIN = 64
+PREVIEW_ICON_MAX = 96
+
+
+@dataclass(frozen=True)
+class ResponsiveMetrics:
+    """Immutable bundle of responsive layout values for one size bucket"""
+    main_margin: int
+    main_spacing: int
+    title_font_size: int
+    preview_margin: int
+    preview_spacing: int
+    icon_size: int
+
+
+def _quantize(value):
+    return (value // METRICS_BUCKET_PX) * METRICS_BUCKET_PX
+
+
+@lru_cache(maxsize=None)
+def _metrics_for_bucket(folder_width, preview_width, preview_height):
+    main_margin = max(16, min(24, int(folder_width * 0.05)))
+    main_spacing = max(12, min(20, int(folder_width * 0.04)))
+    title_font_size = max(18, min(28, int(folder_width * 0.06)))
+
+    preview_margin = max(16, min(28, int(preview_width * 0.08)))
+    preview_spacing = max(8, min(16, int(preview_width * 0.04)))
+    available_size = min(preview_width, preview_height)
+    icon_size = max(PREVIEW_ICON_MIN,
+                    min(PREVIEW_ICON_MAX, int((available_size - 2 * preview_margin - preview_spacing) / 2.2)))
+
+    return ResponsiveMetrics(main_margin, main_spacing, title_font_size,
+                             preview_margin, preview_spacing, icon_size)
+
+
+def responsive_metrics(folder_width, preview_width, preview_height):
+    """Memoized metrics bundle for the bucket containing the given sizes"""
+    return _metrics_for_bucket(_quantize(folder_width), _quantize(preview_width), _quantize(preview_height))
+
+
+def preview_icon_render_sizes():
+    """Icon sizes a preview MenuIcon can request, largest first.
+
+    A preview icon renders at half its ResponsiveMetrics.icon_size edge, so
+    these are the sizes to preload for folder previews.
+    """
+    return tuple(QSize(edge // 2, edge // 2) for edge in range(PREVIEW_ICON_MAX, PREVIEW_ICON_MIN - 1, -2))
+
+
 class LayoutManager:
     """Material Design 3 layout management"""
 
@@ -23,6 +81,22 @@ class LayoutManager:
         self.max_size = QSize(480, 520)
         self.preferred_aspect_ratio = 0.88
         self._resize_timer = None
+        # Last values pushed to the layouts; only deltas are applied
+        self._applied = {}
+        self._built_icon_size = None
+
+    def current_metrics(self):
+        folder_width = self.folder.width() if self.folder.width() > 0 else self.min_size.width()
+        preview = getattr(self.folder, "folder_preview", None)
+        preview_width = preview.width() if preview is not None and preview.width() > 0 else 200
+        preview_height = preview.height() if preview is not None and preview.height() > 0 else 200
+        return responsive_metrics(folder_width, preview_width, preview_height)
+
+    def _changed(self, key, value):
+        if self._applied.get(key) == value:
+            return False
+        self._applied[key] = value
+        return True
 
     def setup_responsive_sizing(self):
         self.folder.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
@@ -30,39 +104,33 @@ class LayoutManager:
         self.folder.setMaximumSize(self.max_size)
 
     def update_main_layout_margins(self):
-        current_width = self.folder.width() if self.folder.width() > 0 else self.min_size.width()
-        margin = max(16, min(24, int(current_width * 0.05)))
-        spacing = max(12, min(20, int(current_width * 0.04)))
-        self.folder.main_layout.setContentsMargins(margin, margin, margin, margin)
-        self.folder.main_layout.setSpacing(spacing)
+        metrics = self.current_metrics()
+        if self._changed("main_margin", metrics.main_margin):
+            margin = metrics.main_margin
+            self.folder.main_layout.setContentsMargins(margin, margin, margin, margin)
+        if self._changed("main_spacing", metrics.main_spacing):
+            self.folder.main_layout.setSpacing(metrics.main_spacing)
 
     def update_header_layout_spacing(self):
-        self.folder.header_layout.setSpacing(16)
+        if self._changed("header_spacing", 16):
+            self.folder.header_layout.setSpacing(16)
 
     def update_preview_layout_margins(self):
-        preview_width = self.folder.folder_preview.width() if self.folder.folder_preview.width() > 0 else 200
-        margin = max(16, min(28, int(preview_width * 0.08)))
-        spacing = max(8, min(16, int(preview_width * 0.04)))
-        self.folder.preview_layout.setContentsMargins(margin, margin, margin, margin)
-        self.folder.preview_layout.setSpacing(spacing)
+        metrics = self.current_metrics()
+        if self._changed("preview_margin", metrics.preview_margin):
+            margin = metrics.preview_margin
+            self.folder.preview_layout.setContentsMargins(margin, margin, margin, margin)
+        if self._changed("preview_spacing", metrics.preview_spacing):
+            self.folder.preview_layout.setSpacing(metrics.preview_spacing)
 
     def calculate_icon_size(self):
-        preview_width = self.folder.folder_preview.width() if self.folder.folder_preview.width() > 0 else 200
-        preview_height = self.folder.folder_preview.height() if self.folder.folder_preview.height() > 0 else 200
-        available_size = min(preview_width, preview_height)
-        margins = self.folder.preview_layout.contentsMargins()
-        total_margin = margins.left() + margins.right()
-        spacing = self.folder.preview_layout.spacing()
-        icon_size = max(64, min(96, int((available_size - total_margin - spacing) / 2.2)))
-        return icon_size
+        self._built_icon_size = self.current_metrics().icon_size
+        return self._built_icon_size
 
     def update_typography(self):
-        current_width = self.folder.width() if self.folder.width() > 0 else self.min_size.width()
-        font_size = max(18, min(28, int(current_width * 0.06)))
-        font = QFont("Roboto", font_size, QFont.Weight.Medium)
-        if not font.exactMatch():
-            font = QFont("Segoe UI", font_size, QFont.Weight.Medium)
-        self.folder.title_label.setFont(font)
+        font_size = self.current_metrics().title_font_size
+        if self._changed("title_font_size", font_size):
+            self.folder.title_label.setFont(get_font("folder_title", font_size))
 
     def handle_resize_event(self):
         if self.folder.parent():
@@ -70,7 +138,9 @@ class LayoutManager:
             target_width = max(self.min_size.width(),
                                min(int(available_width * 0.3), self.max_size.width()))
             target_height = int(target_width / self.preferred_aspect_ratio)
-            self.folder.setFixedSize(QSize(target_width, target_height))
+            target_size = QSize(target_width, target_height)
+            if self.folder.size() != target_size or self.folder.minimumSize() != target_size:
+                self.folder.setFixedSize(target_size)
 
         self.update_main_layout_margins()
         self.update_typography()
@@ -78,11 +148,18 @@ class LayoutManager:
         if self._resize_timer:
             self._resize_timer.stop()
         else:
-            self._resize_timer = QTimer()
+            self._resize_timer = QTimer(self.folder)
             self._resize_timer.setSingleShot(True)
-            self._resize_timer.timeout.connect(self.folder.update_folder_preview)
+            self._resize_timer.timeout.connect(self._on_resize_settled)
         self._resize_timer.start(150)
 
+    def _on_resize_settled(self):
+        """Rebuild the preview only when the icon size bucket changed"""
+        if self.current_metrics().icon_size != self._built_icon_size:
+            self.folder.update_folder_preview()
+        else:
+            self.update_preview_layout_margins()
+
 
 class FolderWidget(QFrame):
     """Pure UI component - only handles visual presentation"""
@@ -90,10 +167,11 @@ class FolderWidget(QFrame):
     clicked = pyqtSignal()
     outside_clicked = pyqtSignal()
 
-    def __init__(self, ID, folder_name="Apps", parent=None):
+    def __init__(self, ID, folder_name="Apps", parent=None, icon_class=None):
         super().__init__(parent)
         self.ID = ID
         self.folder_name = folder_name
+        self.icon_class = icon_class or MenuIcon
         self.buttons = []
         self.is_grayed_out = False
         self.layout_manager = LayoutManager(self)
@@ -118,13 +196,8 @@ class FolderWidget(QFrame):
         """Material Design 3 UI setup - pure presentation"""
         self.layout_manager.setup_responsive_sizing()
 
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {SURFACE};
-                border: 1px solid {BORDER};
-                border-radius: 24px;
-            }}
-        """)
+        self.setObjectName("FolderWidget")
+        self.setProperty("grayed", False)
 
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(16)
@@ -136,18 +209,15 @@ class FolderWidget(QFrame):
         self.layout_manager.update_main_layout_margins()
 
         self.header_widget = QFrame()
+        self.header_widget.setObjectName("FolderHeader")
+        self.header_widget.setProperty("grayed", False)
         self.header_layout = QVBoxLayout(self.header_widget)
         self.layout_manager.update_header_layout_spacing()
 
         self.folder_preview = QFrame()
+        self.folder_preview.setObjectName("FolderPreview")
+        self.folder_preview.setProperty("grayed", False)
         self.folder_preview.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.folder_preview.setStyleSheet(f"""
-            QFrame {{
-                background: {SURFACE};
-                border: 1px solid {BORDER};
-                border-radius: 28px;
-            }}
-        """)
 
         preview_shadow = QGraphicsDropShadowEffect()
         preview_shadow.setBlurRadius(20)
@@ -160,22 +230,13 @@ class FolderWidget(QFrame):
         self.layout_manager.update_preview_layout_margins()
 
         self.title_label = QLabel(self.folder_name)
+        self.title_label.setObjectName("FolderName")
+        self.title_label.setProperty("grayed", False)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
         self.title_label.setWordWrap(True)
         self.layout_manager.update_typography()
 
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_PRIMARY};
-                background-color: transparent;
-                border: none;
-                padding: 12px 16px;
-                font-weight: 500;
-                letter-spacing: 0px;
-            }}
-        """)
-
         self.header_layout.addWidget(self.folder_preview, 1)
         self.header_layout.addWidget(self.title_label, 0)
         self.main_layout.addWidget(self.header_widget)
@@ -197,7 +258,7 @@ class FolderWidget(QFrame):
             row, col = divmod(i, 2)
 
             try:
-                small_btn = MenuIcon(app.icon_label, app.icon_path, app.icon_text if hasattr(app, 'icon_text') else "", app.callback if hasattr(app, 'callback') else None, parent=self, qta_color=QTA_ICON_COLOR)
+                small_btn = self.icon_class(app.icon_label, app.icon_path, app.icon_text if hasattr(app, 'icon_text') else "", app.callback if hasattr(app, 'callback') else None, parent=self, qta_color=QTA_ICON_COLOR)
                 small_btn.setFixedSize(icon_size, icon_size)
                 # Ensure clicking a preview button opens the folder: forward its signals to the folder's clicked
                 try:
@@ -209,14 +270,17 @@ class FolderWidget(QFrame):
                     small_btn.setup_icon_content()
                 except Exception:
                     pass
-                try:
-                    mini_shadow = QGraphicsDropShadowEffect()
-                    mini_shadow.setBlurRadius(8)
-                    mini_shadow.setColor(QColor(*SHADOW_PRIMARY))
-                    mini_shadow.setOffset(0, 2)
-                    small_btn.setGraphicsEffect(mini_shadow)
-                except Exception:
-                    pass
+                if not small_btn.PAINTS_OWN_SHADOW:
+                    try:
+                        mini_shadow = QGraphicsDropShadowEffect()
+                        mini_shadow.setBlurRadius(8)
+                        mini_shadow.setColor(QColor(*SHADOW_PRIMARY))
+                        mini_shadow.setOffset(0, 2)
+                        small_btn.setGraphicsEffect(mini_shadow)
+                    except Exception:
+                        pass
+                if self.is_grayed_out:
+                    self._apply_grayed_to_preview_icon(small_btn)
                 self.preview_layout.addWidget(small_btn, row, col)
             except Exception:
                 placeholder = QLabel()
@@ -224,84 +288,34 @@ class FolderWidget(QFrame):
                 self.preview_layout.addWidget(placeholder, row, col)
 
     def set_grayed_out(self, grayed_out):
-        """Update visual disabled state"""
+        """Update visual disabled state.
+
+        Flips the ``grayed`` dynamic property matched by the theme
+        instead of rewriting stylesheets, so toggling has constant cost.
+        """
+        grayed_out = bool(grayed_out)
+        if grayed_out == self.is_grayed_out:
+            return
         self.is_grayed_out = grayed_out
 
-        if grayed_out:
-            # Outer frame
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background: {DISABLED_BG};
-                    border: 1px dashed {DISABLED_BORDER};
-                    border-radius: 24px;
-                }}
-            """)
-
-            # Title text
-            self.title_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {TEXT_DISABLED};
-                    background-color: transparent;
-                    border: none;
-                    padding: 12px 16px;
-                    font-weight: 500;
-                    letter-spacing: 0px;
-                }}
-            """)
-
-            # Folder preview (icons background dimmed)
-            self.folder_preview.setStyleSheet(f"""
-                QFrame {{
-                    background: {DISABLED_PREVIEW_BG};
-                    border: 1px solid {DISABLED_PREVIEW_BORDER};
-                    border-radius: 28px;
-                }}
-            """)
-
-            # Dim all child icons
-            for i in range(self.preview_layout.count()):
-                child = self.preview_layout.itemAt(i).widget()
-                if child:
-                    child.setGraphicsEffect(None)  # remove shadows
-                    child.setStyleSheet(child.styleSheet() + "opacity: 0.4;")
+        for widget in (self, self.header_widget, self.folder_preview, self.title_label):
+            set_style_property(widget, "grayed", grayed_out)
 
-        else:
-            # Outer frame
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background: {SURFACE};
-                    border: 1px solid {BORDER};
-                    border-radius: 24px;
-                }}
-            """)
-
-            # Reset title
-            self.title_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {TEXT_PRIMARY};
-                    background-color: transparent;
-                    border: none;
-                    padding: 12px 16px;
-                    font-weight: 500;
-                    letter-spacing: 0px;
-                }}
-            """)
-
-            # Reset preview
-            self.folder_preview.setStyleSheet(f"""
-                QFrame {{
-                    background: {SURFACE};
-                    border: 1px solid {BORDER};
-                    border-radius: 28px;
-                }}
-            """)
-
-            # Reset icons (restore drop shadow + normal look)
-            self.update_folder_preview()
+        for i in range(self.preview_layout.count()):
+            child = self.preview_layout.itemAt(i).widget()
+            if child:
+                self._apply_grayed_to_preview_icon(child)
+
+    def _apply_grayed_to_preview_icon(self, child):
+        """Dim a preview icon via its :disabled state and pause its shadow"""
+        child.setEnabled(not self.is_grayed_out)
+        effect = child.graphicsEffect()
+        if effect is not None:
+            effect.setEnabled(not self.is_grayed_out)
 
     def add_app(self, app_name, icon_path="", callback=None):
         """Add app to UI - no business logic"""
-        app_icon = MenuIcon(app_name, icon_path, "", callback)
+        app_icon = self.icon_class(app_name, icon_path, "", callback)
         self.buttons.append(app_icon)
         self.update_folder_preview()
 
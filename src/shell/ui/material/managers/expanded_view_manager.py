@@ -5,8 +5,9 @@ from ..menu_icon import MenuIcon
 class ExpandedViewManager:
     """Handles expanded view creation and lifecycle"""
 
-    def __init__(self, parent_widget):
+    def __init__(self, parent_widget, icon_class=None):
         self.parent_widget = parent_widget
+        self.icon_class = icon_class
         self.expanded_view = None
 
     def show_expanded_view(self, folder_name, overlay_parent, on_close, on_app_selected, on_minimize, on_close_app):
@@ -24,10 +25,11 @@ class ExpandedViewManager:
         if not self.expanded_view:
             return
 
+        icon_class = self.icon_class or MenuIcon
         cols = 4
         for i, button in enumerate(buttons):
             row, col = divmod(i, cols)
-            button_copy = MenuIcon(button.icon_label, button.icon_path, button.icon_text, button.callback, qta_color=QTA_ICON_COLOR)
+            button_copy = icon_class(button.icon_label, button.icon_path, button.icon_text, button.callback, qta_color=QTA_ICON_COLOR)
             button_copy.button_clicked.connect(self.expanded_view.on_app_clicked)
             self.expanded_view.add_app_icon(button_copy, row, col)
 
@@ -1,4 +1,4 @@
-from PyQt6.QtCore import QTimer
+from src.shell.clock import current_clock
 
 
 class FloatingIconManager:
@@ -29,10 +29,7 @@ class FloatingIconManager:
         if self.floating_icon and not self.floating_icon.isHidden():
             self.floating_icon.hide_with_animation()
             # Schedule cleanup after animation
-            self._cleanup_timer = QTimer()
-            self._cleanup_timer.setSingleShot(True)
-            self._cleanup_timer.timeout.connect(self._safe_cleanup)
-            self._cleanup_timer.start(300)
+            self._cleanup_timer = current_clock().call_later(300, self._safe_cleanup)
 
     def _safe_cleanup(self):
         """Safer cleanup"""
@@ -46,7 +43,7 @@ class FloatingIconManager:
             self.floating_icon = None
 
         if self._cleanup_timer:
-            self._cleanup_timer.stop()
+            self._cleanup_timer.cancel()
             self._cleanup_timer = None
 
     def _get_main_window(self):
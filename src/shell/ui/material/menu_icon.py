@@ -1,16 +1,81 @@
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from PyQt6.QtCore import (Qt, pyqtSignal, pyqtProperty, QSize, QRectF, QEvent,
+                          QAbstractAnimation)
 from PyQt6.QtGui import QFont, QColor, QIcon
-from PyQt6.QtWidgets import (QPushButton, QGraphicsDropShadowEffect)
+from PyQt6.QtWidgets import (QPushButton, QGraphicsDropShadowEffect,
+                             QStyle, QStyleOptionButton, QStylePainter)
 
 from src.shell.ui.styles import (
     PRIMARY, PRIMARY_DARK, PRIMARY_HOVER, TEXT_ON_PRIMARY,
     SECONDARY_BG, SECONDARY_HOVER, SECONDARY_PRESSED,
     TERTIARY_BG, TERTIARY_HOVER, TERTIARY_PRESSED, TERTIARY_TEXT,
-    DISABLED_BG, SCROLLBAR_HANDLE_HOVER,
     SHADOW_PRIMARY, SHADOW_PRIMARY_HOVER,
 )
+from src.shell.ui.fonts import get_font
 from src.shell.ui.icon_loader import load_icon
-from .animation import AnimationManager
+from src.shell.ui.theme import set_style_property
+from .animation import AnimationManager, MaterialDesignTiming, MaterialDesignEasing
+from .animation_engine import Tween
+
+
+def _interpolate_elevation(steps, rest, hover):
+    """Pre-compute (blur, rgba, y offset) levels between two elevations"""
+    def blend(a, b, t):
+        return round(a + (b - a) * t)
+
+    levels = []
+    for i in range(steps):
+        t = i / (steps - 1)
+        levels.append((
+            blend(rest[0], hover[0], t),
+            tuple(blend(a, b, t) for a, b in zip(rest[1], hover[1])),
+            blend(rest[2], hover[2], t),
+        ))
+    return tuple(levels)
+
+
+# Elevation levels from rest (level 0) to hover (last level); the hover
+# transition steps through these instead of allocating new shadow effects.
+ELEVATION_LEVELS = _interpolate_elevation(5, (12, SHADOW_PRIMARY, 2), (16, SHADOW_PRIMARY_HOVER, 4))
+_ELEVATION_COLORS = tuple(QColor(*rgba) for _, rgba, _ in ELEVATION_LEVELS)
+
+
+@dataclass(frozen=True)
+class StyleVariant:
+    """Colors of one Material style variant; ``name`` is the theme [variant] value"""
+    name: str
+    background: str
+    hover: str
+    pressed: str
+    text: str
+
+
+@dataclass(frozen=True)
+class SizeVariant:
+    """Geometry of one Material size variant; ``name`` is the theme [sizeVariant] value"""
+    name: str
+    edge: int
+    radius: int
+    icon_size: int
+
+
+def _size_variant(name, edge):
+    return SizeVariant(name, edge, edge // 4, edge // 2)
+
+
+# Built once at import; switching variants only looks these up
+STYLE_VARIANTS = MappingProxyType({
+    "primary": StyleVariant("primary", PRIMARY, PRIMARY_HOVER, PRIMARY_DARK, TEXT_ON_PRIMARY),
+    "secondary": StyleVariant("secondary", SECONDARY_BG, SECONDARY_HOVER, SECONDARY_PRESSED, PRIMARY),
+    "tertiary": StyleVariant("tertiary", TERTIARY_BG, TERTIARY_HOVER, TERTIARY_PRESSED, TERTIARY_TEXT),
+})
+SIZE_VARIANTS = MappingProxyType({
+    "compact": _size_variant("compact", 80),
+    "standard": _size_variant("standard", 112),
+    "large": _size_variant("large", 144),
+})
 
 
 class MenuIcon(QPushButton):
@@ -18,6 +83,9 @@ class MenuIcon(QPushButton):
 
     button_clicked = pyqtSignal(str)
 
+    # Painter-based variants draw their own elevation instead of using a graphics effect
+    PAINTS_OWN_SHADOW = False
+
     def __init__(self, icon_label, icon_path, icon_text="", callback=None, parent=None, qta_color=None):
         super().__init__(parent)
         self.icon_label = icon_label
@@ -26,7 +94,9 @@ class MenuIcon(QPushButton):
         self.callback = callback
         # Optional color to use when rendering qtawesome icon strings specifically for mini icons
         self.qta_color = qta_color
-        self._original_rect = None
+        self._press_scale = 1.0
+        self._elevation_level = 0
+        self._elevation_animation = None
 
         # Material Design touch target size (minimum 48dp)
         self.setFixedSize(112, 112)  # 112dp for comfortable touch interaction
@@ -39,38 +109,19 @@ class MenuIcon(QPushButton):
 
     def setup_ui(self):
         """Setup Material Design 3 styling with proper tokens"""
+        # Styled by the application theme through objectName and properties
+        self.setObjectName("MenuIcon")
+        self.setProperty("variant", "primary")
+        self.setProperty("sizeVariant", "standard")
+        self.setFont(get_font("icon_label"))
 
-        # Material Design 3 filled button styling
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {PRIMARY};
-                color: {TEXT_ON_PRIMARY};
-                border: none;
-                border-radius: 28px;
-                font-size: 12px;
-                font-weight: 500;
-                font-family: 'Roboto', 'Segoe UI', sans-serif;
-                text-align: center;
-                padding: 8px;
-            }}
-            QPushButton:hover {{
-                background: {PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background: {PRIMARY_DARK};
-            }}
-            QPushButton:disabled {{
-                background: {DISABLED_BG};
-                color: {SCROLLBAR_HANDLE_HOVER};
-            }}
-        """)
-
-        # Material Design elevation shadow (level 1)
+        # Material Design elevation shadow (level 1); hover only retunes this effect
         try:
+            blur, _, offset_y = ELEVATION_LEVELS[0]
             shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(12)
-            shadow.setColor(QColor(*SHADOW_PRIMARY))
-            shadow.setOffset(0, 2)
+            shadow.setBlurRadius(blur)
+            shadow.setColor(_ELEVATION_COLORS[0])
+            shadow.setOffset(0, offset_y)
             self.setGraphicsEffect(shadow)
         except Exception:
             pass
@@ -84,19 +135,59 @@ class MenuIcon(QPushButton):
     def setup_icon_content(self):
         """Setup icon content following Material Design icon guidelines"""
         icon_size = int(self.width() * 0.5)
-        size = QSize(icon_size, icon_size)
-
-        icon = load_icon(self.icon_path, color=self.qta_color, size=size)
+        self.setIconSize(QSize(icon_size, icon_size))
+
+        # Cache misses render in the background; the fallback text is the
+        # placeholder until on_icon_ready delivers the icon
+        if not self.request_icon():
+            self.setup_fallback_text()
+
+    def request_icon(self):
+        """Load the icon at the current iconSize() and DPR.
+
+        Returns True when it was cached and is shown now; otherwise it is
+        rendered in the background and delivered through on_icon_ready.
+        """
+        icon_path = self.icon_path
+        size = self.iconSize()
+        icon = load_icon(icon_path, color=self.qta_color, size=size,
+                         on_ready=lambda ready: self.on_icon_ready(icon_path, ready, size),
+                         dpr=self.devicePixelRatioF())
         if icon and not icon.isNull():
-            self.setIcon(icon)
-            self.setIconSize(size)
-            self.setText("")
-            return
-
-        self.setup_fallback_text()
-
-    def setup_fallback_text(self):
-        """Setup fallback text with Material Design typography"""
+            self.apply_icon(icon)
+            return True
+        return False
+
+    def apply_icon(self, icon):
+        """Show an icon in place of the fallback text"""
+        self.setIcon(icon)
+        self.setText("")
+        set_style_property(self, "state", "icon")
+
+    def on_icon_ready(self, icon_path, icon, size=None):
+        """Swap the placeholder for an icon rendered in the background"""
+        if icon_path != self.icon_path or icon.isNull():
+            return  # Icon path changed while the render was in flight
+        if size is not None and size != self.iconSize():
+            return  # Rendered for a size variant the widget has since left
+        self.apply_icon(icon)
+
+    def refresh_icon_for_dpr(self):
+        """Re-request the icon for the current screen's pixel ratio.
+
+        The icon on display stays up until the crisp render arrives through
+        on_icon_ready; icons already rendered for this ratio are reused.
+        """
+        self.request_icon()
+
+    def event(self, event):
+        """Re-render the icon when the widget moves to a screen with another DPR"""
+        if event.type() == QEvent.Type.DevicePixelRatioChange:
+            self.refresh_icon_for_dpr()
+        return super().event(event)
+
+    def fallback_display_text(self):
+        """Return (text, font pixel size) shown when no icon is available"""
 
         # Use emoji or abbreviation for better visual representation
         if self.icon_text and self.icon_text != " No text and icon provided":
@@ -109,68 +200,121 @@ class MenuIcon(QPushButton):
             else:
                 display_text = self.icon_label[:2].upper()
 
-        self.setText(display_text)
-
         # Adjust font size based on text length for optimal readability
         if len(display_text) <= 2:
             font_size = 18  # Larger for abbreviations
         else:
             font_size = 14  # Smaller for longer text
+        return display_text, font_size
+
+    def setup_fallback_text(self):
+        """Setup fallback text with Material Design typography"""
+        display_text, font_size = self.fallback_display_text()
+        self.setText(display_text)
 
-        # Update stylesheet for text-only display
-        self.setStyleSheet(self.styleSheet() + f"""
-            QPushButton {{
-                font-size: {font_size}px;
-                font-weight: 500;
-                letter-spacing: 0.5px;
-            }}
-        """)
+        # Abbreviations and longer text select their own theme typography
+        set_style_property(self, "state", "abbreviation" if font_size == 18 else "text")
 
     def enterEvent(self, event):
         """Material Design hover state"""
         super().enterEvent(event)
-
-        # Update shadow for hover state (Material Design elevation change)
-        try:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(16)
-            shadow.setColor(QColor(*SHADOW_PRIMARY_HOVER))
-            shadow.setOffset(0, 4)
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        self.animate_elevation(hovered=True)
 
     def leaveEvent(self, event):
         """Material Design normal state restoration"""
         super().leaveEvent(event)
+        self.animate_elevation(hovered=False)
+
+    def animate_elevation(self, hovered):
+        """Run the persistent elevation tween towards hover or rest.
+
+        The tween is created on first use and afterwards only retargeted from
+        the current level, with the duration scaled to the remaining distance,
+        so a pointer sweep allocates no Qt objects.
+        """
+        top = len(ELEVATION_LEVELS) - 1
+        target = top if hovered else 0
+        animation = self._elevation_animation
+        if animation is None:
+            animation = Tween(self, b"elevationLevel", self)
+            animation.setEasingCurve(MaterialDesignEasing.STANDARD)
+            self._elevation_animation = animation
+        elif animation.state() == QAbstractAnimation.State.Running:
+            if animation.endValue() == target:
+                return
+            animation.stop()
+
+        if self._elevation_level == target:
+            return
+        animation.setStartValue(self._elevation_level)
+        animation.setEndValue(target)
+        animation.setDuration(round(MaterialDesignTiming.FAST * abs(target - self._elevation_level) / top))
+        animation.start()
+
+    def set_elevation_level(self, level):
+        """Apply one of the pre-computed ELEVATION_LEVELS to the existing shadow effect"""
+        if level == self._elevation_level:
+            return
+        self._elevation_level = level
+        shadow = self.graphicsEffect()
+        if isinstance(shadow, QGraphicsDropShadowEffect):
+            blur, _, offset_y = ELEVATION_LEVELS[level]
+            shadow.setBlurRadius(blur)
+            shadow.setColor(_ELEVATION_COLORS[level])
+            shadow.setOffset(0, offset_y)
+
+    def get_elevation_level(self):
+        return self._elevation_level
+
+    # Driven by the hover tween; resolved per call so subclasses can override set_elevation_level
+    elevationLevel = pyqtProperty(int, fget=get_elevation_level,
+                                  fset=lambda self, level: self.set_elevation_level(level))
+
+    def get_press_scale(self):
+        return self._press_scale
+
+    def set_press_scale(self, scale):
+        if scale == self._press_scale:
+            return
+        self._press_scale = scale
+        self.update()
 
-        # Restore normal shadow
-        try:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(12)
-            shadow.setColor(QColor(*SHADOW_PRIMARY))
-            shadow.setOffset(0, 2)
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+    # Paint-time scale used for press feedback; never affects geometry or layout
+    pressScale = pyqtProperty(float, fget=get_press_scale, fset=set_press_scale)
 
     def mousePressEvent(self, event):
         """Material Design press interaction"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self._original_rect = self.geometry()
             self.animation_manager.create_button_press_animation()
             self.button_clicked.emit(self.icon_label)
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         """Material Design release interaction"""
-        if event.button() == Qt.MouseButton.LeftButton and self._original_rect:
-            self.animation_manager.create_button_release_animation(self._original_rect)
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.animation_manager.create_button_release_animation()
         super().mouseReleaseEvent(event)
 
+    def apply_press_scale(self, painter):
+        """Scale the painter around the widget center by pressScale"""
+        center = QRectF(self.rect()).center()
+        painter.translate(center)
+        painter.scale(self._press_scale, self._press_scale)
+        painter.translate(-center)
+
     def paintEvent(self, event):
         """Custom paint event for Material Design visual consistency"""
-        super().paintEvent(event)
+        if self._press_scale == 1.0:
+            super().paintEvent(event)
+            return
+
+        # Same drawing as QPushButton.paintEvent, through a scaled painter
+        painter = QStylePainter(self)
+        self.apply_press_scale(painter)
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        painter.drawControl(QStyle.ControlElement.CE_PushButton, option)
+        painter.end()
 
     def sizeHint(self):
         """Material Design size hint"""
@@ -187,82 +331,22 @@ class MenuIcon(QPushButton):
 
     def set_material_style(self, style_variant="primary"):
         """Apply different Material Design style variants"""
-
-        style_variants = {
-            "primary": {
-                "background": PRIMARY,
-                "hover": PRIMARY_HOVER,
-                "pressed": PRIMARY_DARK,
-                "text_color": TEXT_ON_PRIMARY
-            },
-            "secondary": {
-                "background": SECONDARY_BG,
-                "hover": SECONDARY_HOVER,
-                "pressed": SECONDARY_PRESSED,
-                "text_color": PRIMARY
-            },
-            "tertiary": {
-                "background": TERTIARY_BG,
-                "hover": TERTIARY_HOVER,
-                "pressed": TERTIARY_PRESSED,
-                "text_color": TERTIARY_TEXT
-            }
-        }
-
-        if style_variant in style_variants:
-            colors = style_variants[style_variant]
-
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {colors['background']};
-                    color: {colors['text_color']};
-                    border: none;
-                    border-radius: 28px;
-                    font-size: 12px;
-                    font-weight: 500;
-                    font-family: 'Roboto', 'Segoe UI', sans-serif;
-                    text-align: center;
-                    padding: 8px;
-                }}
-                QPushButton:hover {{
-                    background: {colors['hover']};
-                }}
-                QPushButton:pressed {{
-                    background: {colors['pressed']};
-                }}
-                QPushButton:disabled {{
-                    background: {DISABLED_BG};
-                    color: {SCROLLBAR_HANDLE_HOVER};
-                }}
-            """)
+        variant = STYLE_VARIANTS.get(style_variant)
+        if variant is not None:
+            set_style_property(self, "variant", variant.name)
 
     def set_material_size(self, size_variant="standard"):
         """Apply different Material Design size variants"""
+        variant = SIZE_VARIANTS.get(size_variant)
+        if variant is None:
+            return
+
+        self.setFixedSize(variant.edge, variant.edge)
+        # The theme rounds each size variant proportionally
+        set_style_property(self, "sizeVariant", variant.name)
 
-        size_variants = {
-            "compact": QSize(80, 80),
-            "standard": QSize(112, 112),
-            "large": QSize(144, 144)
-        }
-
-        if size_variant in size_variants:
-            new_size = size_variants[size_variant]
-            self.setFixedSize(new_size)
-
-            # Update border radius proportionally
-            radius = min(new_size.width(), new_size.height()) // 4
-
-            current_style = self.styleSheet()
-            # Update border-radius in stylesheet
-            import re
-            updated_style = re.sub(
-                r'border-radius:\s*\d+px',
-                f'border-radius: {radius}px',
-                current_style
-            )
-            self.setStyleSheet(updated_style)
-
-            # Update icon size proportionally
-            if hasattr(self, 'icon') and not self.icon().isNull():
-                icon_size = min(new_size.width(), new_size.height()) // 2
-                self.setIconSize(QSize(icon_size, icon_size))
+        # Render the icon again at the new size instead of scaling the old pixmap
+        size = QSize(variant.icon_size, variant.icon_size)
+        if size != self.iconSize():
+            self.setIconSize(size)
+            self.request_icon()
@@ -0,0 +1,144 @@
+"""
+Snapshot layer for fading child widgets
+
+``windowOpacity`` only affects top-level windows, and a QGraphicsOpacityEffect
+stacked on a widget's drop shadow renders both offscreen on every frame.
+``OpacitySnapshot`` instead grabs the target into a pixmap once, hides it and
+paints the pixmap in its place with the animated opacity (scaled to its own
+geometry when that is animated too). At the end the live target takes over
+the layer's geometry and is shown again.
+
+``QWidget.grab()`` leaves out a widget's graphics effect, so a target with a
+drop shadow is grabbed through an identical shadow and the layer grows by
+the shadow's margins; ``contentGeometry`` is the target's rect inside it.
+"""
+
+from PyQt6.QtCore import QMargins, QRect, QRectF, Qt, pyqtProperty
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QGraphicsScene, QWidget
+
+
+def grab_with_shadow(widget: QWidget):
+    """Grab ``widget`` including its drop shadow.
+
+    Returns:
+        (pixmap, margins): the grab and how far the shadow reaches beyond
+        the widget's rect on each side (zero without an enabled shadow)
+    """
+    pixmap = widget.grab()
+    effect = widget.graphicsEffect()
+    if not isinstance(effect, QGraphicsDropShadowEffect) or not effect.isEnabled():
+        return pixmap, QMargins()
+
+    rect = widget.rect()
+    bounds = effect.boundingRectFor(QRectF(rect)).toAlignedRect()
+    margins = QMargins(rect.left() - bounds.left(), rect.top() - bounds.top(),
+                       bounds.right() - rect.right(), bounds.bottom() - rect.bottom())
+
+    # Render the grab through a copy of the effect, onto transparency
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(effect.blurRadius())
+    shadow.setOffset(effect.offset())
+    shadow.setColor(effect.color())
+    scene = QGraphicsScene()
+    scene.addPixmap(pixmap).setGraphicsEffect(shadow)
+
+    dpr = pixmap.devicePixelRatio()
+    shadowed = QPixmap(round(bounds.width() * dpr), round(bounds.height() * dpr))
+    shadowed.setDevicePixelRatio(dpr)
+    shadowed.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(shadowed)
+    scene.render(painter, QRectF(0, 0, bounds.width(), bounds.height()), QRectF(bounds))
+    painter.end()
+    return shadowed, margins
+
+
+class OpacitySnapshot(QWidget):
+    """Stand-in sibling that paints a cached grab of ``target``.
+
+    Args:
+        target: Child widget to fade; the layer is created in its parent
+    """
+
+    def __init__(self, target: QWidget):
+        super().__init__(target.parentWidget())
+        self.target = target
+        self._opacity = 1.0
+        self._pixmap = None
+        self._margins = QMargins()  # shadow margins around the content in the pixmap
+        self._grab_size = None  # target size the pixmap was grabbed at
+        self._content = None  # contentGeometry while active
+        self._size_policy = None
+        self.hide()
+
+    def get_opacity(self) -> float:
+        return self._opacity
+
+    def set_opacity(self, opacity: float):
+        self._opacity = opacity
+        self.update()
+
+    opacity = pyqtProperty(float, fget=get_opacity, fset=set_opacity)
+
+    def content_geometry(self) -> QRect:
+        """Geometry the target's own rect is painted at, without the shadow margins"""
+        return QRect(self._content) if self._content is not None else self.geometry()
+
+    def set_content_geometry(self, rect: QRect):
+        """Place the target's rect at ``rect``; the shadow margins scale along with it"""
+        self._content = QRect(rect)
+        if self._grab_size is None or self._margins.isNull():
+            self.setGeometry(rect)
+            return
+        sx = rect.width() / max(1, self._grab_size.width())
+        sy = rect.height() / max(1, self._grab_size.height())
+        m = self._margins
+        self.setGeometry(rect.adjusted(-round(m.left() * sx), -round(m.top() * sy),
+                                       round(m.right() * sx), round(m.bottom() * sy)))
+
+    # Animated instead of geometry when the layer stands in for a moving target
+    contentGeometry = pyqtProperty(QRect, fget=content_geometry, fset=set_content_geometry)
+
+    @property
+    def active(self) -> bool:
+        return self._pixmap is not None
+
+    def begin(self, opacity: float):
+        """Grab the target and replace it with the layer at ``opacity``"""
+        self._pixmap, self._margins = grab_with_shadow(self.target)
+        self._grab_size = self.target.size()
+        self.set_content_geometry(self.target.geometry())
+        self.set_opacity(opacity)
+        self.show()
+        self.raise_()
+
+        # Keep the target's place in its layout while it is hidden
+        self._size_policy = self.target.sizePolicy()
+        retained = self.target.sizePolicy()
+        retained.setRetainSizeWhenHidden(True)
+        self.target.setSizePolicy(retained)
+        self.target.hide()
+
+    def end(self, show_target: bool = True):
+        """Drop the pixmap and hand the layer's geometry back to the live target"""
+        if not self.active:
+            return
+        self.hide()
+        self._pixmap = None
+        self.target.setGeometry(self.content_geometry())
+        self._content = None
+        self._grab_size = None
+        self._margins = QMargins()
+        if show_target:
+            self.target.show()
+        self.target.setSizePolicy(self._size_policy)
+        self._size_policy = None
+
+    def paintEvent(self, event):
+        if self._pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setOpacity(self._opacity)
+        painter.drawPixmap(self.rect(), self._pixmap)
+        painter.end()
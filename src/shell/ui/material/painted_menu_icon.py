@@ -0,0 +1,151 @@
+from PyQt6.QtCore import Qt, QMargins, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QIcon, QPainter
+
+from src.shell.ui.styles import DISABLED_BG, SCROLLBAR_HANDLE_HOVER
+from src.shell.ui.fonts import get_font
+from src.shell.ui.icon_loader import atlas_handle
+from .menu_icon import MenuIcon, ELEVATION_LEVELS, STYLE_VARIANTS, SIZE_VARIANTS
+from .shadow_cache import get_shadow_patch, draw_shadow
+
+
+# variant name -> (background, hover, pressed, text) as QColors, built once
+_STYLE_COLORS = {
+    name: (QColor(v.background), QColor(v.hover), QColor(v.pressed), QColor(v.text))
+    for name, v in STYLE_VARIANTS.items()
+}
+_DISABLED_COLORS = (QColor(DISABLED_BG), QColor(SCROLLBAR_HANDLE_HOVER))
+
+
+def _shadow_margins(levels):
+    """Room around the surface for the blur spill of every elevation level.
+
+    The shadow extends ``blur`` past the surface on each side and is shifted
+    down by the level's y offset, so the bottom needs the most room.
+    """
+    spread = max(blur for blur, _, _ in levels)
+    top = max(blur - offset_y for blur, _, offset_y in levels)
+    bottom = max(blur + offset_y for blur, _, offset_y in levels)
+    return QMargins(spread, top, spread, bottom)
+
+
+# Kept around the painted surface so no elevation level's shadow is clipped by the widget
+SHADOW_MARGINS = _shadow_margins(ELEVATION_LEVELS)
+
+
+class PaintedMenuIcon(MenuIcon):
+    """MenuIcon variant that paints background, icon, text and shadow itself.
+
+    No per-widget stylesheet and no QGraphicsDropShadowEffect: the elevation
+    shadow comes from the shared nine-patch cache in ``shadow_cache``, and the
+    icon is blitted from the shared icon atlas (see ``icon_loader.atlas_handle``).
+    """
+
+    PAINTS_OWN_SHADOW = True
+
+    def setup_ui(self):
+        """Setup painter state instead of a stylesheet and graphics effect"""
+        self._colors = _STYLE_COLORS["primary"]
+        self._radius = SIZE_VARIANTS["standard"].radius
+        self._text_font = None
+        self._atlas_key = None
+        self._atlas_handle = None
+
+        self.setup_icon_content()
+        self.setToolTip(self.icon_label)
+
+    def setup_fallback_text(self):
+        """Store fallback text and its font for paintEvent"""
+        display_text, font_size = self.fallback_display_text()
+        self._text_font = QFont(get_font("icon_label"))
+        self._text_font.setPixelSize(font_size)
+        self.setText(display_text)
+
+    def set_elevation_level(self, level):
+        """Select a pre-rendered elevation level and repaint"""
+        if level == self._elevation_level:
+            return
+        self._elevation_level = level
+        self.update()
+
+    def surface_rect(self):
+        """Rect of the rounded surface inside the widget"""
+        return self.rect().marginsRemoved(SHADOW_MARGINS)
+
+    def paintEvent(self, event):
+        """Draw shadow, surface, then icon or fallback text"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self._press_scale != 1.0:
+            self.apply_press_scale(painter)
+        surface = self.surface_rect()
+        radius = min(self._radius, surface.width() // 2, surface.height() // 2)
+        enabled = self.isEnabled()
+
+        if enabled:
+            blur, color, offset_y = ELEVATION_LEVELS[self._elevation_level]
+            draw_shadow(painter, surface, get_shadow_patch(radius, blur, color), offset_y)
+
+        background, hover, pressed, text_color = self._colors
+        if not enabled:
+            background, text_color = _DISABLED_COLORS
+        elif self.isDown():
+            background = pressed
+        elif self.underMouse():
+            background = hover
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(surface), radius, radius)
+
+        icon = self.icon()
+        if not icon.isNull():
+            icon_rect = QRectF(0, 0, self.iconSize().width(), self.iconSize().height())
+            icon_rect.moveCenter(QRectF(surface).center())
+            handle = self.icon_atlas_handle() if enabled else None
+            if handle is not None:
+                handle.draw(painter, icon_rect.toRect())
+            else:
+                mode = QIcon.Mode.Normal if enabled else QIcon.Mode.Disabled
+                icon.paint(painter, icon_rect.toRect(), Qt.AlignmentFlag.AlignCenter, mode)
+        elif self.text():
+            painter.setPen(text_color)
+            if self._text_font is not None:
+                painter.setFont(self._text_font)
+            painter.drawText(surface, Qt.AlignmentFlag.AlignCenter, self.text())
+
+        painter.end()
+
+    def icon_atlas_handle(self):
+        """Atlas handle of the current icon at the current icon size and DPR.
+
+        Looked up again only when the icon, its size or the DPR changed.
+        """
+        size = self.iconSize()
+        dpr = self.devicePixelRatioF()
+        key = (self.icon().cacheKey(), size.width(), size.height(), dpr)
+        if key != self._atlas_key:
+            self._atlas_handle = atlas_handle(self.icon_path, self.qta_color, size, dpr)
+            # Retry on the next paint until the icon has been loaded
+            self._atlas_key = key if self._atlas_handle is not None else None
+        return self._atlas_handle
+
+    def set_material_style(self, style_variant="primary"):
+        """Switch painted colors to another Material Design style variant"""
+        colors = _STYLE_COLORS.get(style_variant)
+        if colors is not None and colors is not self._colors:
+            self._colors = colors
+            self.update()
+
+    def set_material_size(self, size_variant="standard"):
+        """Apply a Material Design size variant to the painted surface"""
+        variant = SIZE_VARIANTS.get(size_variant)
+        if variant is None:
+            return
+
+        self.setFixedSize(variant.edge, variant.edge)
+        self._radius = variant.radius
+        size = QSize(variant.icon_size, variant.icon_size)
+        if size != self.iconSize():
+            self.setIconSize(size)
+            self.request_icon()
+        self.update()
@@ -0,0 +1,115 @@
+"""
+Nine-patch shadow cache for painter-based Material components
+
+A blurred rounded rectangle is rendered once per (radius, blur, color) and
+sliced into nine patches at paint time, so drawing an elevation shadow costs
+nine pixmap blits instead of a QGraphicsDropShadowEffect blur per repaint.
+"""
+
+from dataclasses import dataclass
+
+from PyQt6.QtCore import Qt, QRect, QRectF
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+
+
+@dataclass(frozen=True)
+class ShadowPatch:
+    """Pre-rendered shadow pixmap plus the size of its stretchable corners"""
+    pixmap: QPixmap
+    margin: int   # Blur spill around the shape
+    corner: int   # margin + radius; corner slices are corner x corner
+
+
+_shadow_cache = {}
+
+
+def _blur_image(image: QImage, blur: int) -> QImage:
+    """Blur an image once through QGraphicsBlurEffect"""
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    result.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(result)
+    scene.render(painter, QRectF(result.rect()), QRectF(image.rect()))
+    painter.end()
+    return result
+
+
+def get_shadow_patch(radius: int, blur: int, color) -> ShadowPatch:
+    """Return the shared nine-patch shadow for a shape radius, blur and color.
+
+    Args:
+        radius: Corner radius of the shape casting the shadow
+        blur:   Blur radius (same meaning as QGraphicsDropShadowEffect)
+        color:  RGBA tuple (e.g. styles.SHADOW_PRIMARY) or QColor
+    """
+    rgba = QColor(color).rgba() if isinstance(color, QColor) else QColor(*color).rgba()
+    key = (radius, blur, rgba)
+    patch = _shadow_cache.get(key)
+    if patch is not None:
+        return patch
+
+    margin = blur
+    corner = margin + radius
+    side = 2 * corner + 1
+
+    image = QImage(side, side, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor.fromRgba(rgba))
+    painter.drawRoundedRect(QRectF(margin, margin, side - 2 * margin, side - 2 * margin), radius, radius)
+    painter.end()
+
+    if blur > 0:
+        image = _blur_image(image, blur)
+
+    patch = ShadowPatch(QPixmap.fromImage(image), margin, corner)
+    _shadow_cache[key] = patch
+    return patch
+
+
+def draw_shadow(painter: QPainter, shape_rect: QRect, patch: ShadowPatch, offset_y: int = 0):
+    """Draw a cached shadow around ``shape_rect`` as nine pixmap slices"""
+    target = shape_rect.adjusted(-patch.margin, -patch.margin, patch.margin, patch.margin)
+    target.translate(0, offset_y)
+
+    c = patch.corner
+    # Shapes smaller than two corners would overlap; clamp the slices
+    cw = min(c, target.width() // 2)
+    ch = min(c, target.height() // 2)
+    side = patch.pixmap.width()
+    mid_w = target.width() - 2 * cw
+    mid_h = target.height() - 2 * ch
+
+    src_x = (0, c, side - c)
+    src_w = (c, side - 2 * c, c)
+    dst_x = (target.left(), target.left() + cw, target.right() + 1 - cw)
+    dst_w = (cw, mid_w, cw)
+    dst_y = (target.top(), target.top() + ch, target.bottom() + 1 - ch)
+    dst_h = (ch, mid_h, ch)
+
+    for row in range(3):
+        if dst_h[row] <= 0:
+            continue
+        for col in range(3):
+            if dst_w[col] <= 0:
+                continue
+            painter.drawPixmap(
+                QRect(dst_x[col], dst_y[row], dst_w[col], dst_h[row]),
+                patch.pixmap,
+                QRect(src_x[col], src_x[row], src_w[col], src_w[row]),
+            )
+
+
+def clear_shadow_cache():
+    """Drop all cached shadow pixmaps"""
+    _shadow_cache.clear()
@@ -56,6 +56,17 @@ SHADOW_FAB = (0, 0, 0, 60)
 SHADOW_PRIMARY_LIGHT = (122, 90, 248, 30)
 SHADOW_PRIMARY = (122, 90, 248, 40)
 SHADOW_PRIMARY_HOVER = (122, 90, 248, 60)
+# ================= TYPOGRAPHY =================
+# Family fallback chain, resolved once per process by src.shell.ui.fonts
+FONT_FAMILY_FALLBACKS = ("Roboto", "Segoe UI")
+# Typography roles: role -> (default point size, weight). Themed buttons take
+# family and weight from their role; their pixel size comes from theme.py.
+TYPOGRAPHY_ROLES = {
+    "folder_title": (22, 500),
+    "expanded_title": (28, 500),
+    "icon_label": (12, 500),
+    "button": (14, 500),
+}
 # ================= SIZE CONSTANTS =================
 BUTTON_SIZE = 60
 ICON_SIZE = 26
@@ -0,0 +1,278 @@
+"""
+Application-wide theme stylesheet compiled from the styles.py tokens
+
+Shell widgets no longer carry their own stylesheet strings. They set an
+objectName plus the dynamic properties ``variant``, ``sizeVariant`` and
+``state`` (and ``grayed`` for folders), and one stylesheet installed on the
+QApplication styles all of them. Switching themes is a single
+``install_theme(tokens)`` call.
+"""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from src.shell.ui import styles
+
+
+# Token name -> value. Any subset can be overridden when compiling a theme.
+DEFAULT_TOKENS = {
+    "primary": styles.PRIMARY,
+    "primary_dark": styles.PRIMARY_DARK,
+    "primary_hover": styles.PRIMARY_HOVER,
+    "surface": styles.SURFACE,
+    "border": styles.BORDER,
+    "text_primary": styles.TEXT_PRIMARY,
+    "text_disabled": styles.TEXT_DISABLED,
+    "text_on_primary": styles.TEXT_ON_PRIMARY,
+    "secondary_bg": styles.SECONDARY_BG,
+    "secondary_hover": styles.SECONDARY_HOVER,
+    "secondary_pressed": styles.SECONDARY_PRESSED,
+    "tertiary_bg": styles.TERTIARY_BG,
+    "tertiary_hover": styles.TERTIARY_HOVER,
+    "tertiary_pressed": styles.TERTIARY_PRESSED,
+    "tertiary_text": styles.TERTIARY_TEXT,
+    "disabled_bg": styles.DISABLED_BG,
+    "disabled_border": styles.DISABLED_BORDER,
+    "disabled_preview_bg": styles.DISABLED_PREVIEW_BG,
+    "disabled_preview_border": styles.DISABLED_PREVIEW_BORDER,
+    "scrollbar_bg": styles.SCROLLBAR_BG,
+    "scrollbar_handle": styles.SCROLLBAR_HANDLE,
+    "scrollbar_handle_hover": styles.SCROLLBAR_HANDLE_HOVER,
+    "shell_gradient_start": "rgba(248, 250, 252, 1)",
+    "shell_gradient_end": "rgba(241, 245, 249, 1)",
+}
+
+# MenuIcon text states -> font pixel size. Family and weight are not part of
+# the theme; widgets take them from their typography role (fonts.get_font).
+MENU_ICON_TEXT_SIZES = {"abbreviation": 18, "text": 14}
+
+_installed_theme = None
+
+
+def compile_theme(tokens=None):
+    """Compile the shell stylesheet.
+
+    Args:
+        tokens: Optional dict overriding entries of DEFAULT_TOKENS
+
+    Returns:
+        Stylesheet string for QApplication.setStyleSheet()
+    """
+    # Radii come from the MenuIcon size descriptors; imported here because
+    # menu_icon itself imports this module
+    from src.shell.ui.material.menu_icon import SIZE_VARIANTS
+
+    t = {**DEFAULT_TOKENS, **(tokens or {})}
+
+    # The shell background must come first: it has the same specificity as
+    # the widget rules below and later rules win ties.
+    sheet = f"""
+QWidget#AppShell, #AppShell QWidget {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 {t['shell_gradient_start']},
+        stop:1 {t['shell_gradient_end']});
+}}
+
+QPushButton#MenuIcon {{
+    background: {t['primary']};
+    color: {t['text_on_primary']};
+    border: none;
+    border-radius: {SIZE_VARIANTS['standard'].radius}px;
+    font-size: 12px;
+    text-align: center;
+    padding: 8px;
+}}
+QPushButton#MenuIcon:hover {{
+    background: {t['primary_hover']};
+}}
+QPushButton#MenuIcon:pressed {{
+    background: {t['primary_dark']};
+}}
+QPushButton#MenuIcon[variant="secondary"] {{
+    background: {t['secondary_bg']};
+    color: {t['primary']};
+}}
+QPushButton#MenuIcon[variant="secondary"]:hover {{
+    background: {t['secondary_hover']};
+}}
+QPushButton#MenuIcon[variant="secondary"]:pressed {{
+    background: {t['secondary_pressed']};
+}}
+QPushButton#MenuIcon[variant="tertiary"] {{
+    background: {t['tertiary_bg']};
+    color: {t['tertiary_text']};
+}}
+QPushButton#MenuIcon[variant="tertiary"]:hover {{
+    background: {t['tertiary_hover']};
+}}
+QPushButton#MenuIcon[variant="tertiary"]:pressed {{
+    background: {t['tertiary_pressed']};
+}}
+"""
+    for variant in SIZE_VARIANTS.values():
+        if variant.name != "standard":
+            sheet += f"""QPushButton#MenuIcon[sizeVariant="{variant.name}"] {{
+    border-radius: {variant.radius}px;
+}}
+"""
+    for state, font_size in MENU_ICON_TEXT_SIZES.items():
+        sheet += f"""QPushButton#MenuIcon[state="{state}"] {{
+    font-size: {font_size}px;
+    letter-spacing: 0.5px;
+}}
+"""
+    sheet += f"""QPushButton#MenuIcon:disabled {{
+    background: {t['disabled_bg']};
+    color: {t['scrollbar_handle_hover']};
+}}
+
+QFrame#FolderWidget, QFrame#FolderHeader {{
+    background: {t['surface']};
+    border: 1px solid {t['border']};
+    border-radius: 24px;
+}}
+QFrame#FolderWidget[grayed="true"], QFrame#FolderHeader[grayed="true"] {{
+    background: {t['disabled_bg']};
+    border: 1px dashed {t['disabled_border']};
+}}
+QFrame#FolderPreview {{
+    background: {t['surface']};
+    border: 1px solid {t['border']};
+    border-radius: 28px;
+}}
+QFrame#FolderPreview[grayed="true"] {{
+    background: {t['disabled_preview_bg']};
+    border: 1px solid {t['disabled_preview_border']};
+}}
+QLabel#FolderName {{
+    color: {t['text_primary']};
+    background-color: transparent;
+    border: none;
+    padding: 12px 16px;
+    font-weight: 500;
+    letter-spacing: 0px;
+}}
+QLabel#FolderName[grayed="true"] {{
+    color: {t['text_disabled']};
+}}
+
+QFrame#ExpandedFolderView {{
+    background: {t['surface']};
+    border: 1px solid {t['border']};
+    border-radius: 28px;
+}}
+QLabel#FolderTitle {{
+    color: {t['text_primary']};
+    background-color: transparent;
+    padding-bottom: 8px;
+    font-weight: 500;
+    letter-spacing: 0px;
+}}
+QPushButton#CloseAppButton {{
+    background: {t['primary']};
+    border: none;
+    border-radius: 20px;
+    color: {t['text_on_primary']};
+    font-size: 14px;
+    padding: 10px 24px;
+}}
+QPushButton#CloseAppButton:hover {{
+    background: {t['primary_hover']};
+}}
+QPushButton#CloseAppButton:pressed {{
+    background: {t['primary_dark']};
+}}
+QScrollArea#ExpandedScrollArea {{
+    border: none;
+    background: transparent;
+}}
+QWidget#ExpandedGrid {{
+    background-color: transparent;
+}}
+#ExpandedScrollArea QScrollBar:vertical {{
+    background-color: {t['scrollbar_bg']};
+    width: 12px;
+    border-radius: 6px;
+    margin: 2px;
+}}
+#ExpandedScrollArea QScrollBar::handle:vertical {{
+    background-color: {t['scrollbar_handle']};
+    border-radius: 6px;
+    min-height: 30px;
+}}
+#ExpandedScrollArea QScrollBar::handle:vertical:hover {{
+    background-color: {t['scrollbar_handle_hover']};
+}}
+#ExpandedScrollArea QScrollBar::add-line:vertical, #ExpandedScrollArea QScrollBar::sub-line:vertical {{
+    border: none;
+    background: none;
+    height: 0px;
+}}
+
+QPushButton#FloatingFolderIcon {{
+    background: {t['primary']};
+    border: none;
+    border-radius: 40px;
+    font-size: 20px;
+    color: {t['text_on_primary']};
+    padding: 12px;
+}}
+QPushButton#FloatingFolderIcon:hover {{
+    background: {t['primary_hover']};
+}}
+QPushButton#FloatingFolderIcon:pressed {{
+    background: {t['primary_dark']};
+}}
+"""
+    return sheet
+
+
+def install_theme(tokens=None, app=None):
+    """Compile the theme and install it on the application in one pass.
+
+    Any stylesheet the host application set is kept; a previously installed
+    shell theme is replaced, so this also switches themes at runtime.
+    """
+    global _installed_theme
+    app = app or QApplication.instance()
+    if app is None:
+        return None
+
+    sheet = compile_theme(tokens)
+    current = app.styleSheet()
+    if _installed_theme and current.endswith(_installed_theme):
+        current = current[:-len(_installed_theme)]
+    app.setStyleSheet(current + sheet)
+    _installed_theme = sheet
+    return sheet
+
+
+def ensure_theme(app=None):
+    """Install the default theme unless the installed shell theme is still in place.
+
+    Hosts that replace ``QApplication.styleSheet()`` drop the shell theme with
+    it, so this checks the application's current stylesheet rather than
+    trusting an earlier install.
+    """
+    app = app or QApplication.instance()
+    if app is None:
+        return
+    if _installed_theme is None or not app.styleSheet().endswith(_installed_theme):
+        install_theme(app=app)
+
+
+def set_style_property(widget, name, value):
+    """Set a dynamic property used by theme selectors and repolish the widget.
+
+    Widgets that have not been polished yet pick the property up on their
+    first polish, so construction-time calls skip the repolish.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    if not widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        return
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -0,0 +1,61 @@
+"""Benchmark: paint a grid of distinct icons via QIcon.paint versus atlas blits."""
+
+import time
+
+import pytest
+
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+
+from src.shell.ui import icon_loader
+
+ICONS = 200
+ROUNDS = 5
+SIZE = QSize(56, 56)
+
+
+@pytest.fixture
+def grid_icons(qapp, tmp_path):
+    icon_loader.clear_icon_cache()
+    sources = []
+    for i in range(ICONS):
+        pixmap = QPixmap(128, 128)
+        pixmap.fill(QColor.fromHsv(i % 360, 200, 200))
+        path = str(tmp_path / f"icon_{i}.png")
+        pixmap.save(path, "PNG")
+        icon_loader.load_icon(path)
+        sources.append(path)
+    yield sources
+    icon_loader.clear_icon_cache()
+
+
+def _paint(draw):
+    """Best time in ms to paint every icon once into a grid"""
+    target = QImage(20 * SIZE.width(), 10 * SIZE.height(), QImage.Format.Format_ARGB32_Premultiplied)
+    best = None
+    for _ in range(ROUNDS):
+        target.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(target)
+        start = time.perf_counter()
+        for i in range(ICONS):
+            draw(i, painter, QRect((i % 20) * SIZE.width(), (i // 20) * SIZE.height(),
+                                   SIZE.width(), SIZE.height()))
+        elapsed = (time.perf_counter() - start) * 1000
+        painter.end()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_atlas_packs_grid_into_few_pages(grid_icons):
+    icons = [icon_loader.load_icon(source) for source in grid_icons]
+    handles = [icon_loader.atlas_handle(source, None, SIZE, 1.0) for source in grid_icons]
+
+    qicon_ms = _paint(lambda i, painter, rect: icons[i].paint(painter, rect))
+    atlas_ms = _paint(lambda i, painter, rect: handles[i].draw(painter, rect))
+    atlases, pages, packed, size = icon_loader.atlas_stats()
+
+    print(f"\n[bench] {ICONS} icons: QIcon.paint {qicon_ms:.2f} ms, atlas {atlas_ms:.2f} ms, "
+          f"{pages} atlas pages ({size // 1024} KiB)")
+
+    assert (atlases, packed) == (1, ICONS)
+    assert pages <= 2
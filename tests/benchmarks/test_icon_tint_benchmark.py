@@ -0,0 +1,53 @@
+"""Benchmark: batch recolor via NumPy versus the QPainter composite path."""
+
+import time
+
+import pytest
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage
+
+from src.shell.ui import icon_tint
+
+np = pytest.importorskip("numpy")
+
+ROUNDS = 3
+EDGE = 56
+
+
+def _images(count):
+    images = []
+    for i in range(count):
+        image = QImage(EDGE, EDGE, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        image.fill(QColor.fromHsv(i % 360, 200, 200, 180))
+        images.append(image)
+    return images
+
+
+def _best_ms(backend, images, desaturate):
+    icon_tint._np = backend
+    try:
+        best = None
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            icon_tint.tint_images(images, "#FFFFFF", desaturate)
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+    finally:
+        icon_tint._np = False
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+@pytest.mark.parametrize("desaturate", [False, True])
+def test_batch_tint(qapp, count, desaturate):
+    images = _images(count)
+
+    painter_ms = _best_ms(None, images, desaturate)
+    numpy_ms = _best_ms(np, images, desaturate)
+
+    print(f"\n[bench] tint {count} icons{' (desaturated)' if desaturate else ''}: "
+          f"QPainter {painter_ms:.2f} ms, NumPy {numpy_ms:.2f} ms")
+
+    assert painter_ms > 0 and numpy_ms > 0
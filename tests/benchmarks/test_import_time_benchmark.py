@@ -0,0 +1,63 @@
+"""Benchmark: `python -X importtime` of run_mainwindow, and which modules load lazily."""
+
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Imported on demand; none of these may load just by importing the entry point
+LAZY_MODULES = ("qtawesome", "qtpy", "src.shell.ui.material.factory", "src.shell.ui.material.menu_icon")
+
+
+def _run(code, *flags):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=REPO_ROOT, env=env,
+                          capture_output=True, text=True, timeout=60, check=True)
+
+
+def _importtime(module):
+    """Map module name -> cumulative import time in microseconds"""
+    result = _run(f"import {module}", "-X", "importtime")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_entry_point_import_skips_lazy_modules():
+    times = _importtime("run_mainwindow")
+
+    print(f"\n[bench] import run_mainwindow: {times['run_mainwindow'] / 1000:.1f} ms "
+          f"(src.shell.AppShell {times['src.shell.AppShell'] / 1000:.1f} ms)")
+
+    assert not [name for name in LAZY_MODULES if name in times]
+
+
+def test_factory_import_loads_no_widget_modules():
+    code = """
+import sys
+from src.shell.ui.material import MaterialUIFactory
+MaterialUIFactory()
+assert not [name for name in sys.modules if name.startswith("src.shell.ui.material.")
+            and name != "src.shell.ui.material.factory"], sorted(sys.modules)
+"""
+    _run(code)
+
+
+def test_qtawesome_loads_on_first_glyph_request(tmp_icon_file):
+    code = f"""
+import sys
+from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+from src.shell.ui.icon_loader import load_icon
+assert not load_icon({tmp_icon_file!r}, size=QSize(16, 16)).isNull()
+assert "qtawesome" not in sys.modules
+assert not load_icon("fa5s.cog").isNull()
+assert "qtawesome" in sys.modules
+"""
+    _run(code)
@@ -0,0 +1,81 @@
+"""Benchmark: drag the window width across 1000 sizes and count layout requests."""
+
+import time
+
+import pytest
+from unittest.mock import patch
+
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from src.shell.ui.material.folder_widget import FolderWidget, responsive_metrics
+
+DRAG_STEPS = 1000
+
+
+class LayoutRequestCounter(QObject):
+    """Event filter counting LayoutRequest events delivered to watched widgets."""
+
+    def __init__(self, widgets):
+        super().__init__()
+        self.count = 0
+        for widget in widgets:
+            widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.LayoutRequest:
+            self.count += 1
+        return False
+
+
+def _drag(window, folder, forget_applied):
+    counter = LayoutRequestCounter([folder, folder.header_widget, folder.folder_preview])
+    start = time.perf_counter()
+    for step in range(DRAG_STEPS):
+        window.resize(1000 + step, 900)
+        if forget_applied:
+            # Emulates the previous behaviour: every setter is called on every resize
+            folder.layout_manager._applied.clear()
+        folder.layout_manager.handle_resize_event()
+        QApplication.processEvents()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    folder.layout_manager._resize_timer.stop()
+    return counter.count, elapsed_ms
+
+
+@pytest.fixture
+def window(qapp):
+    with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+        window = QWidget()
+        folder = FolderWidget(1, "Work", parent=window)
+        for name in ("Dashboard", "Management", "Settings", "Gallery"):
+            folder.add_app(name, "fa5s.cog")
+        window.show()
+        QApplication.processEvents()
+        # Layout is what is measured here; skip painting the offscreen window
+        window.setUpdatesEnabled(False)
+        yield window, folder
+        window.close()
+
+
+def test_memoized_metrics_reduce_layout_requests(window):
+    """Width drag issues far fewer layout requests than re-applying every value."""
+    window, folder = window
+
+    memoized_requests, memoized_ms = _drag(window, folder, forget_applied=False)
+    naive_requests, naive_ms = _drag(window, folder, forget_applied=True)
+
+    print(f"\n[bench] {DRAG_STEPS} widths: memoized {memoized_requests} layout requests "
+          f"({memoized_ms:.1f} ms), unconditional {naive_requests} ({naive_ms:.1f} ms)")
+
+    assert memoized_requests < naive_requests
+    # One request per distinct bundle at most, plus one per actual fixed-size change
+    distinct = {responsive_metrics(int(w * 0.3), 200, 200) for w in range(1000, 1000 + DRAG_STEPS)}
+    sizes = {min(int(w * 0.3), folder.layout_manager.max_size.width()) for w in range(1000, 1000 + DRAG_STEPS)}
+    assert memoized_requests <= 3 * (len(distinct) + len(sizes))
+
+
+def test_metrics_are_memoized_per_bucket():
+    """Sizes within one bucket share the very same bundle object."""
+    assert responsive_metrics(401, 250, 250) is responsive_metrics(406, 252, 254)
@@ -0,0 +1,100 @@
+"""Benchmark: per-widget stylesheets versus the application-wide compiled theme."""
+
+import time
+
+import pytest
+from unittest.mock import patch
+
+from PyQt6.QtGui import QColor, QIcon
+from PyQt6.QtWidgets import QWidget
+
+from src.shell.ui import styles
+from src.shell.ui.theme import install_theme
+from src.shell.ui.material.menu_icon import MenuIcon
+
+WIDGETS = 300
+ROUNDS = 3
+
+# The stylesheet every MenuIcon used to carry, plus the fallback-text suffix
+LEGACY_MENU_ICON_STYLE = f"""
+    QPushButton {{
+        background: {styles.PRIMARY};
+        color: {styles.TEXT_ON_PRIMARY};
+        border: none;
+        border-radius: 28px;
+        font-size: 12px;
+        font-weight: 500;
+        font-family: 'Roboto', 'Segoe UI', sans-serif;
+        text-align: center;
+        padding: 8px;
+    }}
+    QPushButton:hover {{
+        background: {styles.PRIMARY_HOVER};
+    }}
+    QPushButton:pressed {{
+        background: {styles.PRIMARY_DARK};
+    }}
+    QPushButton:disabled {{
+        background: {styles.DISABLED_BG};
+        color: {styles.SCROLLBAR_HANDLE_HOVER};
+    }}
+"""
+LEGACY_TEXT_STYLE = """
+    QPushButton {
+        font-size: 18px;
+        font-weight: 500;
+        letter-spacing: 0.5px;
+    }
+"""
+
+
+def _construct(legacy):
+    """Best per-widget construction + polish time in microseconds over ROUNDS runs."""
+    best = None
+    for _ in range(ROUNDS):
+        parent = QWidget()
+        start = time.perf_counter()
+        for i in range(WIDGETS):
+            icon = MenuIcon(f"App {i}", "", parent=parent)
+            if legacy:
+                icon.setStyleSheet(LEGACY_MENU_ICON_STYLE)
+                icon.setStyleSheet(icon.styleSheet() + LEGACY_TEXT_STYLE)
+            icon.ensurePolished()
+        elapsed = (time.perf_counter() - start) * 1e6 / WIDGETS
+        parent.deleteLater()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+@pytest.fixture
+def default_theme(qapp):
+    install_theme()
+    yield
+    install_theme()
+
+
+def test_theme_reduces_construction_time(default_theme):
+    """Widgets that only set properties build faster than ones parsing their own sheet."""
+    with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+        themed_us = _construct(legacy=False)
+        legacy_us = _construct(legacy=True)
+
+    print(f"\n[bench] MenuIcon construction: per-widget stylesheet {legacy_us:.1f} us, "
+          f"app theme {themed_us:.1f} us")
+
+    assert themed_us < legacy_us
+
+
+def test_runtime_theme_switch_single_pass(default_theme):
+    """One install_theme() call restyles every existing widget."""
+    with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+        icons = [MenuIcon(f"App {i}", "") for i in range(50)]
+
+    start = time.perf_counter()
+    install_theme({"primary": "#FF0000"})
+    pixels = [QColor(icon.grab().toImage().pixel(56, 10)) for icon in icons]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n[bench] theme switch + repaint of {len(icons)} icons: {elapsed_ms:.1f} ms")
+
+    assert all(p.red() > 200 and p.green() < 40 and p.blue() < 40 for p in pixels)
@@ -0,0 +1,101 @@
+"""Tests for src.shell.clock — injectable real and virtual time."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.shell.clock import RealClock, VirtualClock, current_clock, set_clock, use_clock
+
+
+class TestVirtualClock:
+    def test_call_later_fires_when_due(self):
+        clock = VirtualClock()
+        callback = MagicMock()
+        clock.call_later(300, callback)
+
+        clock.advance(299)
+        callback.assert_not_called()
+        clock.advance(1)
+        callback.assert_called_once()
+        assert clock.now_ms() == 300
+
+    def test_timers_fire_in_deadline_then_scheduling_order(self):
+        clock = VirtualClock()
+        order = []
+        clock.call_later(20, lambda: order.append("late"))
+        clock.call_later(10, lambda: order.append("first"))
+        clock.call_later(10, lambda: order.append("second"))
+
+        clock.advance(50)
+
+        assert order == ["first", "second", "late"]
+
+    def test_callback_sees_its_deadline(self):
+        clock = VirtualClock()
+        seen = []
+        clock.call_later(16, lambda: seen.append(clock.now_ms()))
+
+        clock.advance(100)
+
+        assert seen == [16]
+
+    def test_call_every_repeats_until_cancelled(self):
+        clock = VirtualClock()
+        ticks = []
+        handle = clock.call_every(16, lambda: ticks.append(clock.now_ms()))
+
+        clock.advance(50)
+        handle.cancel()
+        clock.advance(50)
+
+        assert ticks == [16, 32, 48]
+        assert clock.pending == 0
+
+    def test_run_until_idle_follows_chained_timers(self):
+        clock = VirtualClock()
+        clock.call_later(100, lambda: clock.call_later(200, lambda: None))
+
+        assert clock.run_until_idle() == 300
+        assert clock.pending == 0
+
+    def test_run_until_idle_gives_up_on_endless_timers(self):
+        clock = VirtualClock()
+        clock.call_every(16, lambda: None)
+
+        with pytest.raises(RuntimeError):
+            clock.run_until_idle(limit_ms=1000)
+
+
+class TestInstalledClock:
+    def test_use_clock_restores_previous(self):
+        previous = current_clock()
+        with use_clock(VirtualClock()) as clock:
+            assert current_clock() is clock
+        assert current_clock() is previous
+
+    def test_set_clock_none_installs_real_clock(self):
+        previous = set_clock(None)
+        try:
+            assert isinstance(current_clock(), RealClock)
+        finally:
+            set_clock(previous)
+
+    def test_real_clock_schedules_with_qt(self, qapp):
+        from PyQt6.QtTest import QTest
+
+        callback = MagicMock()
+        RealClock().call_later(0, callback)
+
+        QTest.qWait(20)
+        callback.assert_called_once()
+
+    def test_pending_timer_outlives_its_clock(self, qapp):
+        """A dropped RealClock does not take its pending timers with it."""
+        import gc
+        from PyQt6.QtTest import QTest
+
+        callback = MagicMock()
+        RealClock().call_later(0, callback)
+        gc.collect()
+
+        QTest.qWait(20)
+        callback.assert_called_once()
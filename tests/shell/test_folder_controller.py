@@ -0,0 +1,91 @@
+"""Tests for src.shell.folder_controller — folder flows on virtual time."""
+
+import pytest
+
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QWidget
+
+from src.shell.clock import VirtualClock, use_clock
+from src.shell.folder_controller import FolderController
+from src.shell.ui.material.animation_engine import FRAME_INTERVAL_MS, animation_engine
+from src.shell.ui.material.animation_governor import animation_governor
+from src.shell.ui.material.factory import MaterialUIFactory
+
+
+@pytest.fixture
+def flow(qapp):
+    """A folder with three apps in a shown window, timed by a VirtualClock"""
+    animation_governor().set_performance_mode("full")
+    with use_clock(VirtualClock()) as clock:
+        window = QWidget()
+        window.resize(320, 240)
+        factory = MaterialUIFactory()
+        folder = factory.create_folder_widget(0, "Apps")
+        folder.setParent(window)
+        for app_name in ("Files", "Music", "Notes"):
+            folder.add_app(app_name)
+        window.show()
+        controller = FolderController(folder, window, ui_factory=factory)
+        yield clock, controller
+        window.deleteLater()
+    animation_governor().set_performance_mode(None)
+
+
+def _step(clock, action):
+    """Run ``action`` and every timer it schedules; return the virtual ms taken"""
+    start = clock.now_ms()
+    action()
+    clock.run_until_idle()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    return clock.now_ms() - start
+
+
+class TestFolderFlow:
+    def test_open_launch_close_cycle(self, flow):
+        clock, controller = flow
+
+        _step(clock, controller.handle_folder_click)
+        assert controller.state.is_open
+        view = controller.expanded_view_manager.expanded_view
+        assert view.isVisible()
+
+        _step(clock, lambda: view.on_app_clicked("Music"))
+        assert controller.state.current_app_name == "Music"
+        assert controller.floating_icon_manager.floating_icon.isVisible()
+        assert not view.isVisible()
+
+        _step(clock, controller.handle_close_app)
+        assert not controller.state.is_open
+        assert not controller.state.app_running
+        assert controller.floating_icon_manager.floating_icon is None
+        assert animation_engine().active_count == 0
+        assert clock.pending == 0
+
+    def test_close_mid_open_reverses_within_one_frame(self, flow):
+        clock, controller = flow
+        controller.handle_folder_click()
+        clock.advance(100)
+        layer = controller.expanded_view_manager.expanded_view.animation_manager._opacity_layer()
+        opened_to = layer.opacity
+
+        controller.handle_folder_click()
+        clock.advance(FRAME_INTERVAL_MS)
+
+        assert 0 < layer.opacity < opened_to
+        clock.run_until_idle()
+        assert controller.expanded_view_manager.expanded_view.isHidden()
+        assert not controller.state.is_open
+
+    def test_step_timings_are_reproducible(self, flow):
+        clock, controller = flow
+
+        def cycle():
+            return (
+                _step(clock, controller.handle_folder_click),
+                _step(clock, lambda: controller.expanded_view_manager.expanded_view.on_app_clicked("Files")),
+                _step(clock, controller.handle_close_app),
+            )
+
+        first = cycle()
+        assert all(first)
+        assert [cycle() for _ in range(3)] == [first] * 3
@@ -0,0 +1,98 @@
+"""Tests for src.shell.ui.material.animation — pooled AnimationManager."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from PyQt6 import sip
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject, QPoint
+from PyQt6.QtWidgets import QWidget
+
+from src.shell.ui.material.animation import AnimationManager
+
+
+@pytest.fixture
+def manager(qapp):
+    widget = QWidget()
+    widget.resize(200, 200)
+    manager = AnimationManager(widget)
+    yield manager
+    manager.cleanup()
+    widget.deleteLater()
+
+
+def _finish(animation):
+    """Jump a running animation or group to its end, emitting finished"""
+    animation.setCurrentTime(animation.totalDuration())
+
+
+def _delete_later_events():
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+class TestPooling:
+    def test_repeated_transitions_reuse_objects(self, manager):
+        first = (manager.fade_in(), manager.fade_out(),
+                 manager.combined_fade_and_scale_in(QPoint(100, 100)),
+                 manager.combined_fade_and_scale_out())
+        children = len(manager.findChildren(QObject))
+
+        for _ in range(20):
+            again = (manager.fade_in(), manager.fade_out(),
+                     manager.combined_fade_and_scale_in(QPoint(100, 100)),
+                     manager.combined_fade_and_scale_out())
+            assert all(a is b for a, b in zip(first, again))
+
+        assert len(manager.findChildren(QObject)) == children
+
+    def test_callbacks_belong_to_one_run(self, manager):
+        stale, current = MagicMock(), MagicMock()
+
+        manager.fade_in(callback=stale)
+        animation = manager.fade_in(callback=current)
+        _finish(animation)
+        animation.start()
+        _finish(animation)
+
+        stale.assert_not_called()
+        current.assert_called_once()
+
+    def test_group_callbacks_do_not_accumulate(self, manager):
+        callback = MagicMock()
+
+        for _ in range(3):
+            group = manager.combined_fade_and_scale_out(hide_on_finish=False, callback=callback)
+        _finish(group)
+
+        callback.assert_called_once()
+        assert not manager.has_active_animations()
+
+    def test_stop_drops_pending_callbacks(self, manager):
+        callback = MagicMock()
+        animation = manager.fade_out(hide_on_finish=False, callback=callback)
+
+        manager.stop_animation("fade_out")
+        animation.start()
+        _finish(animation)
+
+        callback.assert_not_called()
+
+    def test_replaced_animation_is_disposed(self, manager):
+        old = manager.create_fade_animation(animation_id="shared")
+        old.setStartValue(0.0)
+        old.setEndValue(1.0)
+        old.start()
+
+        new = manager.create_geometry_animation(animation_id="shared")
+        _delete_later_events()
+
+        assert sip.isdeleted(old)
+        assert manager.animations["shared"] is new
+
+    def test_cleanup_deletes_everything(self, manager):
+        manager.combined_fade_and_scale_in(QPoint(100, 100))
+        manager.fade_in()
+
+        manager.cleanup()
+        _delete_later_events()
+
+        assert manager.findChildren(QObject) == []
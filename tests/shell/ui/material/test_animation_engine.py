@@ -0,0 +1,149 @@
+"""Tests for src.shell.ui.material.animation_engine — the shared frame tick."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from PyQt6.QtCore import QAbstractAnimation, QCoreApplication, QEasingCurve, QEvent, QRect
+from PyQt6.QtWidgets import QWidget
+
+from src.shell.clock import VirtualClock, use_clock
+from src.shell.ui.material.animation_engine import (
+    Tween, TweenGroup, animation_engine, interpolate,
+)
+
+
+@pytest.fixture
+def clock():
+    with use_clock(VirtualClock()) as clock:
+        yield clock
+
+
+@pytest.fixture
+def widgets(qapp):
+    widgets = [QWidget() for _ in range(3)]
+    yield widgets
+    for widget in widgets:
+        widget.deleteLater()
+
+
+def _tick_at(clock, time_ms):
+    """Advance virtual time to ``time_ms`` and run a frame exactly there"""
+    clock.advance(time_ms - clock.now_ms())
+    animation_engine().tick()
+
+
+def _geometry_tween(widget, end_x, duration=100):
+    tween = Tween(widget, b"geometry", widget)
+    tween.setDuration(duration)
+    tween.setStartValue(QRect(0, 0, 10, 10))
+    tween.setEndValue(QRect(end_x, 0, 10, 10))
+    return tween
+
+
+class TestInterpolate:
+    def test_rect_and_numbers(self):
+        assert interpolate(QRect(0, 0, 10, 10), QRect(10, 20, 30, 40), 0.5) == QRect(5, 10, 20, 25)
+        assert interpolate(0.0, 1.0, 0.25) == 0.25
+        assert interpolate(0, 4, 0.5) == 2
+
+
+class TestEngine:
+    def test_start_applies_start_value(self, widgets, clock):
+        tween = _geometry_tween(widgets[0], 100)
+
+        tween.start()
+
+        assert widgets[0].geometry() == QRect(0, 0, 10, 10)
+        assert tween.state() == QAbstractAnimation.State.Running
+        tween.stop()
+
+    def test_one_tick_writes_every_tween_before_finishing(self, widgets, clock):
+        tweens = [_geometry_tween(widget, 100) for widget in widgets]
+        seen = []
+        tweens[0].finished.connect(lambda: seen.append([w.geometry().x() for w in widgets]))
+        for tween in tweens:
+            tween.start()
+
+        _tick_at(clock, 50)
+        assert [w.geometry().x() for w in widgets] == [50, 50, 50]
+
+        _tick_at(clock, 100)
+        assert seen == [[100, 100, 100]]
+        assert animation_engine().active_count == 0
+
+    def test_easing_is_applied(self, widgets, clock):
+        tween = _geometry_tween(widgets[0], 100)
+        tween.setEasingCurve(QEasingCurve.Type.OutCubic)
+        tween.start()
+
+        _tick_at(clock, 50)
+
+        assert widgets[0].geometry().x() == round(100 * QEasingCurve(QEasingCurve.Type.OutCubic).valueForProgress(0.5))
+        tween.stop()
+
+    def test_zero_duration_finishes_in_start(self, widgets, clock):
+        tween = _geometry_tween(widgets[0], 100, duration=0)
+        finished = MagicMock()
+        tween.finished.connect(finished)
+
+        tween.start()
+
+        finished.assert_called_once()
+        assert widgets[0].geometry().x() == 100
+
+    def test_group_finishes_after_longest_tween(self, widgets, clock):
+        group = TweenGroup()
+        group.addAnimation(_geometry_tween(widgets[0], 100, duration=100))
+        group.addAnimation(_geometry_tween(widgets[1], 100, duration=200))
+        finished = MagicMock()
+        group.finished.connect(finished)
+        group.start()
+
+        _tick_at(clock, 150)
+        finished.assert_not_called()
+
+        _tick_at(clock, 200)
+        finished.assert_called_once()
+
+    def test_cleared_group_releases_its_tweens(self, widgets, clock):
+        tween = _geometry_tween(widgets[0], 100)
+        connected = tween.receivers(tween.finished)
+        group = TweenGroup()
+        group.addAnimation(tween)
+        group.clear()
+        group._child_finished = MagicMock()
+
+        tween.start()
+        _tick_at(clock, 100)
+
+        group._child_finished.assert_not_called()
+        assert group.animationCount() == 0
+        assert tween.receivers(tween.finished) == connected
+
+    def test_replaced_groups_do_not_accumulate_on_pooled_tweens(self, widgets, clock):
+        from src.shell.ui.material.animation import AnimationManager
+        manager = AnimationManager(widgets[0])
+        first = manager._pooled_animation("a", b"geometry", 100, QEasingCurve.Type.Linear)
+        second = manager._pooled_animation("b", b"geometry", 100, QEasingCurve.Type.Linear, widgets[1])
+        manager._pooled_group("pair", first, second)
+        connected = first.receivers(first.finished)
+
+        for _ in range(10):
+            manager._pooled_group("pair", second, first)
+            manager._pooled_group("pair", first, second)
+
+        assert first.receivers(first.finished) == connected
+
+    def test_deleted_target_stops_tween(self, qapp, clock):
+        owner = QWidget()
+        target = QWidget(owner)
+        tween = _geometry_tween(target, 100)
+        tween.setParent(None)
+        tween.start()
+
+        target.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        _tick_at(clock, 50)
+
+        assert tween.state() == QAbstractAnimation.State.Stopped
+        owner.deleteLater()
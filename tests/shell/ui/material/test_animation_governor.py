@@ -0,0 +1,154 @@
+"""Tests for src.shell.ui.material.animation_governor — adaptive animation tiers."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from PyQt6.QtCore import QPoint, QRect
+from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QWidget
+
+from src.shell.clock import VirtualClock, use_clock
+from src.shell.ui.material.animation import AnimationManager
+from src.shell.ui.material.animation_governor import (
+    AnimationGovernor, AnimationTier, animation_governor, parse_tier,
+)
+
+
+@pytest.fixture(autouse=True)
+def shared_governor():
+    governor = animation_governor()
+    governor.set_performance_mode(None)
+    governor.reset()
+    yield governor
+    governor.set_performance_mode(None)
+    governor.reset()
+
+
+@pytest.fixture
+def widget(qapp):
+    widget = QWidget()
+    widget.setGeometry(0, 0, 200, 200)
+    shadow = QGraphicsDropShadowEffect()
+    widget.setGraphicsEffect(shadow)
+    yield widget
+    widget.deleteLater()
+
+
+@pytest.fixture
+def manager(widget):
+    manager = AnimationManager(widget)
+    yield manager
+    manager.cleanup()
+
+
+def _feed(governor, interval_ms, count):
+    for _ in range(count):
+        governor.add_frame_interval(interval_ms)
+
+
+class TestGovernor:
+    def test_slow_windows_step_down_one_tier_each(self, qapp):
+        governor = AnimationGovernor(budget_ms=20, window=5)
+
+        _feed(governor, 16, 5)
+        assert governor.tier is AnimationTier.FULL
+
+        _feed(governor, 40, 5)
+        assert governor.tier is AnimationTier.REDUCED
+        _feed(governor, 40, 15)
+        assert governor.tier is AnimationTier.INSTANT
+
+        report = governor.usage_report()
+        assert report.downgrades == 3
+        assert report.frames == 25
+        assert report.worst_frame_ms == 40
+
+    def test_recovers_one_tier_after_quiet_period(self, qapp):
+        governor = AnimationGovernor(budget_ms=20, window=5, recovery_s=0)
+        _feed(governor, 40, 10)
+        assert governor.tier is AnimationTier.OPACITY_ONLY
+
+        assert governor.run_started() is AnimationTier.REDUCED
+        assert governor.usage_report().upgrades == 1
+
+    def test_performance_mode_pins_tier(self, qapp):
+        governor = AnimationGovernor(budget_ms=20, window=5, recovery_s=0)
+        changed = MagicMock()
+        governor.tier_changed.connect(changed)
+
+        governor.set_performance_mode("instant")
+        _feed(governor, 40, 10)
+        assert governor.run_started() is AnimationTier.INSTANT
+        changed.assert_called_once_with(AnimationTier.INSTANT)
+
+        governor.set_performance_mode("auto")
+        assert governor.performance_mode is None
+        assert governor.tier is AnimationTier.FULL
+
+    def test_report_counts_runs_per_tier(self, qapp):
+        governor = AnimationGovernor()
+        governor.run_started()
+        governor.set_performance_mode(AnimationTier.OPACITY_ONLY)
+        governor.run_started()
+        governor.run_started()
+
+        assert dict(governor.usage_report().runs) == {
+            "FULL": 1, "REDUCED": 0, "OPACITY_ONLY": 2, "INSTANT": 0,
+        }
+
+    def test_same_frame_updates_are_not_frames(self, qapp):
+        with use_clock(VirtualClock()) as clock:
+            governor = AnimationGovernor()
+            for step in (0, 0.5, 16.5, 0.2, 16.8):
+                clock.advance(step)
+                governor.record_frame()
+
+        assert governor.usage_report().frames == 2
+        assert governor.usage_report().mean_frame_ms == pytest.approx(17)
+
+    def test_parse_tier(self):
+        assert parse_tier(None) is None
+        assert parse_tier("Reduced") is AnimationTier.REDUCED
+        assert parse_tier(3) is AnimationTier.INSTANT
+        with pytest.raises(ValueError):
+            parse_tier("turbo")
+
+
+class TestManagerTiers:
+    def test_reduced_halves_duration_and_hides_shadow(self, manager, widget, shared_governor):
+        shared_governor.set_performance_mode(AnimationTier.REDUCED)
+
+        group = manager.combined_fade_and_scale_out(duration=300, hide_on_finish=False)
+
+        assert [group.animationAt(i).duration() for i in range(2)] == [150, 150]
+        assert not widget.graphicsEffect().isEnabled()
+        group.setCurrentTime(group.totalDuration())
+        assert widget.graphicsEffect().isEnabled()
+
+    def test_opacity_only_jumps_geometry(self, manager, widget, shared_governor):
+        shared_governor.set_performance_mode(AnimationTier.OPACITY_ONLY)
+
+        group = manager.combined_fade_and_scale_in(QPoint(300, 300), duration=300)
+
+        fade, scale = group.animationAt(0), group.animationAt(1)
+        assert (fade.duration(), scale.duration()) == (150, 0)
+        assert widget.geometry() == QRect(200, 200, 200, 200)
+        manager.stop_all_animations()
+        assert widget.graphicsEffect().isEnabled()
+
+    def test_instant_finishes_synchronously(self, manager, widget, shared_governor):
+        shared_governor.set_performance_mode("instant")
+        callback = MagicMock()
+        widget.show()
+
+        manager.combined_fade_and_scale_out(callback=callback)
+
+        callback.assert_called_once()
+        assert widget.isHidden()
+        assert not manager.has_active_animations()
+        assert shared_governor.usage_report().runs["INSTANT"] == 1
+
+    def test_full_tier_keeps_design(self, manager, widget):
+        animation = manager.fade_in(duration=300)
+
+        assert animation.duration() == 300
+        assert widget.graphicsEffect().isEnabled()
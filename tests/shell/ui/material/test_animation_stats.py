@@ -0,0 +1,109 @@
+"""Tests for src.shell.ui.material.animation_stats — per-run frame delivery."""
+
+import json
+
+import pytest
+
+from PyQt6.QtCore import QPoint
+from PyQt6.QtWidgets import QWidget
+
+from src.shell.clock import VirtualClock, use_clock
+from src.shell.ui.material.animation import AnimationManager
+from src.shell.ui.material.animation_governor import animation_governor
+from src.shell.ui.material.animation_stats import (
+    AnimationRecord, AnimationStats, RunProbe, animation_stats, percentile,
+)
+
+
+@pytest.fixture(autouse=True)
+def shared_stats():
+    animation_governor().reset()
+    animation_stats().clear()
+    yield animation_stats()
+    animation_stats().clear()
+
+
+@pytest.fixture
+def manager(qapp):
+    widget = QWidget()
+    widget.resize(200, 200)
+    manager = AnimationManager(widget)
+    yield manager
+    manager.cleanup()
+    widget.deleteLater()
+
+
+def _record(animation_id="fade_in", actual_ms=300.0, max_gap_ms=17.0, completed=True, start_s=0.0):
+    return AnimationRecord(animation_id, "FULL", start_s, 300.0, actual_ms, 18, max_gap_ms, completed)
+
+
+class TestAnimationStats:
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.95) == 95
+        assert percentile([7], 0.95) == 7
+        assert percentile([], 0.5) == 0.0
+
+    def test_summary_uses_completed_runs(self):
+        stats = AnimationStats()
+        for gap in (10, 20, 30, 40):
+            stats.add(_record(max_gap_ms=gap))
+        stats.add(_record(max_gap_ms=500, completed=False))
+
+        summary = stats.summary()["fade_in"]
+
+        assert (summary.runs, summary.stopped) == (4, 1)
+        assert summary.max_gap_p50_ms == 20
+        assert summary.max_gap_worst_ms == 40
+
+    def test_history_is_bounded_per_id(self):
+        stats = AnimationStats(history=3)
+        for start in range(5):
+            stats.add(_record(start_s=start))
+        stats.add(_record("fab_show"))
+
+        assert [r.start_s for r in stats.records("fade_in")] == [2, 3, 4]
+        assert len(stats.records()) == 4
+
+    def test_export_trace_writes_complete_events(self, tmp_path):
+        stats = AnimationStats()
+        stats.add(_record(start_s=1.5, actual_ms=250.0))
+        path = tmp_path / "trace.json"
+
+        stats.export_trace(path)
+
+        event, = json.loads(path.read_text())["traceEvents"]
+        assert (event["name"], event["ph"], event["ts"], event["dur"]) == ("fade_in", "X", 1500000, 250000)
+        assert event["args"]["max_gap_ms"] == 17.0
+
+    def test_probe_merges_same_frame_updates(self):
+        with use_clock(VirtualClock()) as clock:
+            probe = RunProbe("combined_in", "FULL", 300)
+            for step in (16, 0.1, 33.9):
+                clock.advance(step)
+                probe.update()
+
+        assert probe.updates == 2
+        assert probe.max_gap == pytest.approx(34)
+
+
+class TestManagerRecording:
+    def test_finished_group_run_is_recorded_under_group_id(self, manager, shared_stats):
+        group = manager.combined_fade_and_scale_in(QPoint(100, 100), duration=300)
+        for time_ms in (100, 200, 300):
+            group.setCurrentTime(time_ms)
+
+        record, = shared_stats.records("combined_in")
+        assert record.completed
+        assert record.planned_ms == 300
+        assert record.updates >= 1
+        assert shared_stats.records("combined_fade") == []
+
+    def test_restarted_and_stopped_runs_are_marked(self, manager, shared_stats):
+        manager.fade_in()
+        manager.fade_in()
+        manager.stop_animation("fade_in")
+
+        assert [r.completed for r in shared_stats.records("fade_in")] == [False, False]
+        assert shared_stats.summary()["fade_in"].stopped == 2
@@ -0,0 +1,101 @@
+"""Tests for src.shell.ui.material.folder_widget — FolderWidget grayed-out state."""
+
+import pytest
+from unittest.mock import patch
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon
+
+
+@pytest.fixture
+def folder(qapp):
+    with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+        from src.shell.ui.material.folder_widget import FolderWidget
+        widget = FolderWidget(1, "Work")
+        widget.add_app("Dashboard", "fa5s.cog")
+        widget.add_app("Settings", "fa5s.cog")
+        yield widget
+
+
+def _preview_icons(folder):
+    layout = folder.preview_layout
+    return [layout.itemAt(i).widget() for i in range(layout.count())]
+
+
+class TestSetGrayedOut:
+    def test_grayed_out_sets_dynamic_property(self, folder):
+        """Grayed state is exposed through the 'grayed' property."""
+        folder.set_grayed_out(True)
+
+        assert folder.is_grayed_out is True
+        for widget in (folder, folder.header_widget, folder.folder_preview, folder.title_label):
+            assert widget.property("grayed") is True
+
+        folder.set_grayed_out(False)
+
+        for widget in (folder, folder.header_widget, folder.folder_preview, folder.title_label):
+            assert widget.property("grayed") is False
+
+    def test_repeated_toggles_do_not_grow_stylesheets(self, folder):
+        """Toggling never rewrites or appends to any stylesheet."""
+        widgets = [folder, folder.header_widget, folder.folder_preview, folder.title_label]
+        widgets += _preview_icons(folder)
+        before = [w.styleSheet() for w in widgets]
+
+        for _ in range(500):
+            folder.set_grayed_out(True)
+            folder.set_grayed_out(False)
+
+        assert [w.styleSheet() for w in widgets] == before
+
+    def test_grayed_out_disables_preview_icons_and_shadows(self, folder):
+        """Preview icons use their :disabled look and pause their shadow."""
+        folder.set_grayed_out(True)
+
+        for icon in _preview_icons(folder):
+            assert not icon.isEnabled()
+            assert not icon.graphicsEffect().isEnabled()
+
+    def test_re_enable_keeps_existing_preview_icons(self, folder):
+        """Restoring the folder does not rebuild the preview grid."""
+        icons = _preview_icons(folder)
+
+        folder.set_grayed_out(True)
+        folder.set_grayed_out(False)
+
+        assert _preview_icons(folder) == icons
+        for icon in icons:
+            assert icon.isEnabled()
+            assert icon.graphicsEffect().isEnabled()
+
+
+class TestPreviewPreload:
+    def test_preview_construction_hits_preloaded_cache(self, qapp):
+        """Preloading the preview sizes leaves nothing for the previews to render."""
+        from src.shell.ui import icon_loader
+        from src.shell.ui.styles import QTA_ICON_COLOR
+        from src.shell.ui.material.folder_widget import FolderWidget, preview_icon_render_sizes
+        icon_loader.clear_icon_cache()
+        sources = ["fa5s.cog", "fa5s.users"]
+        icon_loader.preload(sources, colors=(None, QTA_ICON_COLOR), sizes=(QSize(56, 56),))
+        icon_loader.preload(sources, colors=(QTA_ICON_COLOR,), sizes=preview_icon_render_sizes())
+
+        with patch.object(icon_loader, "_request_render") as request_render:
+            widget = FolderWidget(1, "Work")
+            for name, source in zip(("Dashboard", "Users"), sources):
+                widget.add_app(name, source)
+
+        request_render.assert_not_called()
+        assert all(not icon.icon().isNull() for icon in _preview_icons(widget))
+        icon_loader.clear_icon_cache()
+
+    def test_render_sizes_cover_metrics_range(self):
+        from src.shell.ui.material.folder_widget import (
+            PREVIEW_ICON_MAX, PREVIEW_ICON_MIN, preview_icon_render_sizes, responsive_metrics)
+        sizes = preview_icon_render_sizes()
+
+        for preview_edge in range(0, 600, 8):
+            edge = responsive_metrics(400, preview_edge, preview_edge).icon_size
+            assert QSize(edge // 2, edge // 2) in sizes
+        assert sizes[0] == QSize(PREVIEW_ICON_MAX // 2, PREVIEW_ICON_MAX // 2)
+        assert sizes[-1] == QSize(PREVIEW_ICON_MIN // 2, PREVIEW_ICON_MIN // 2)
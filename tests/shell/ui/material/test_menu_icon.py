@@ -84,3 +84,278 @@ class TestMenuIconSetIconFromPath:
 
         assert widget.icon_path == "new_path"
         mock_load_icon.assert_called()
+
+
+class TestMenuIconLifetime:
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_dropped_icon_is_freed_without_cyclic_gc(self, mock_load_icon, qapp):
+        """Animations must not tie the widget into a cycle only gc.collect() breaks."""
+        import gc
+        import weakref
+
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.menu_icon import MenuIcon
+        widget = MenuIcon("Test", "fa5s.cog")
+        widget.animation_manager.create_button_press_animation()
+        widget.animation_manager.create_button_release_animation()
+        _hover(widget, True)
+        dropped = weakref.ref(widget)
+        mock_load_icon.reset_mock()  # recorded calls hold the on_ready callback
+
+        gc.disable()
+        try:
+            del widget
+            assert dropped() is None
+        finally:
+            gc.enable()
+
+
+def _hover(widget, entered):
+    from PyQt6.QtCore import QEvent, QPointF
+    from PyQt6.QtGui import QEnterEvent
+    if entered:
+        widget.enterEvent(QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+    else:
+        widget.leaveEvent(QEvent(QEvent.Type.Leave))
+
+
+class TestMenuIconHoverElevation:
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_hover_reuses_shadow_effect(self, mock_load_icon, qapp):
+        """Hover sweeps keep the same effect and animation objects."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material import menu_icon
+        widget = menu_icon.MenuIcon("Test", "fa5s.cog")
+        shadow = widget.graphicsEffect()
+        _hover(widget, True)
+        animation = widget._elevation_animation
+
+        with patch.object(menu_icon, "QGraphicsDropShadowEffect") as effect_cls, \
+                patch.object(menu_icon, "Tween") as animation_cls:
+            for _ in range(50):
+                _hover(widget, False)
+                _hover(widget, True)
+
+        effect_cls.assert_not_called()
+        animation_cls.assert_not_called()
+        assert widget.graphicsEffect() is shadow
+        assert widget._elevation_animation is animation
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_hover_reaches_top_elevation_level(self, mock_load_icon, qapp):
+        """Finishing the hover animation applies the hover shadow parameters."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.menu_icon import MenuIcon, ELEVATION_LEVELS
+        widget = MenuIcon("Test", "fa5s.cog")
+        _hover(widget, True)
+        animation = widget._elevation_animation
+        animation.setCurrentTime(animation.duration())
+
+        blur, rgba, offset_y = ELEVATION_LEVELS[-1]
+        assert widget.graphicsEffect().blurRadius() == blur
+        assert widget.graphicsEffect().offset().y() == offset_y
+
+        _hover(widget, False)
+        animation.setCurrentTime(animation.duration())
+
+        assert widget.graphicsEffect().blurRadius() == ELEVATION_LEVELS[0][0]
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_hover_runs_on_shared_engine(self, mock_load_icon, qapp):
+        """The hover tween is advanced by the shared engine's frame tick."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.clock import VirtualClock, use_clock
+        from src.shell.ui.material.animation_engine import FRAME_INTERVAL_MS, animation_engine
+        from src.shell.ui.material.menu_icon import MenuIcon, ELEVATION_LEVELS
+        widget = MenuIcon("Test", "fa5s.cog")
+
+        with use_clock(VirtualClock()) as clock:
+            _hover(widget, True)
+            assert widget._elevation_animation in animation_engine()._running
+            clock.advance(FRAME_INTERVAL_MS)
+            halfway = widget.elevationLevel
+            assert 0 < halfway < len(ELEVATION_LEVELS) - 1
+
+            # Reversing mid-hover heads back down from the current level
+            _hover(widget, False)
+            animation = widget._elevation_animation
+            assert animation.startValue() == halfway
+            clock.advance(animation.duration() + FRAME_INTERVAL_MS)
+
+        assert widget.elevationLevel == 0
+        assert animation not in animation_engine()._running
+
+
+class TestMenuIconPressFeedback:
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_rapid_taps_never_touch_geometry(self, mock_load_icon, qapp):
+        """Press/release animate pressScale only; geometry stays put."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtTest import QTest
+        from src.shell.ui.material.menu_icon import MenuIcon
+        widget = MenuIcon("Test", "fa5s.cog")
+        widget.move(20, 30)
+        geometry = widget.geometry()
+
+        for _ in range(20):
+            QTest.mousePress(widget, Qt.MouseButton.LeftButton)
+            assert widget.geometry() == geometry
+            QTest.mouseRelease(widget, Qt.MouseButton.LeftButton)
+            assert widget.geometry() == geometry
+
+        release = widget.animation_manager.animations["button_release"]
+        release.setCurrentTime(release.duration())
+        assert widget.pressScale == pytest.approx(1.0)
+        assert widget.geometry() == geometry
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_press_scales_paint(self, mock_load_icon, qapp):
+        """A finished press animation leaves the icon scaled at paint time."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.menu_icon import MenuIcon
+        widget = MenuIcon("Test", "fa5s.cog")
+        press = widget.animation_manager.create_button_press_animation()
+        press.setCurrentTime(press.duration())
+
+        assert widget.pressScale == pytest.approx(0.95)
+        assert widget.size().width() == 112
+        assert not widget.grab().isNull()
+
+
+class TestMenuIconVariants:
+    def test_variant_descriptors_are_immutable(self):
+        """Variant tables and descriptors cannot be mutated at runtime."""
+        from dataclasses import FrozenInstanceError
+        from src.shell.ui.material.menu_icon import SIZE_VARIANTS, STYLE_VARIANTS
+
+        with pytest.raises(TypeError):
+            SIZE_VARIANTS["huge"] = SIZE_VARIANTS["large"]
+        with pytest.raises(FrozenInstanceError):
+            STYLE_VARIANTS["primary"].background = "#000000"
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_size_variant_flips_property(self, mock_load_icon, qapp):
+        """Size switch sets geometry, icon size and the theme property only."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.menu_icon import MenuIcon
+        widget = MenuIcon("Test App", "fa5s.cog")
+        widget.set_material_size("compact")
+
+        assert widget.size() == QSize(80, 80)
+        assert widget.iconSize() == QSize(40, 40)
+        assert widget.property("sizeVariant") == "compact"
+        assert widget.styleSheet() == ""
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_reapplying_variant_skips_repolish(self, mock_load_icon, qapp):
+        """Switching a grid to the variant it already has does no style work."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.menu_icon import MenuIcon
+        icons = [MenuIcon(f"App {i}", "fa5s.cog") for i in range(4)]
+        for icon in icons:
+            icon.ensurePolished()
+            icon.set_material_style("secondary")
+
+        with patch.object(MenuIcon, "style") as style:
+            for icon in icons:
+                icon.set_material_style("secondary")
+                icon.set_material_size("standard")
+
+        style.assert_not_called()
+
+
+class TestMenuIconBackgroundIcon:
+    @pytest.mark.parametrize("module, class_name", [
+        ("menu_icon", "MenuIcon"),
+        ("painted_menu_icon", "PaintedMenuIcon"),
+    ])
+    def test_size_variant_switch_rerenders_icon(self, module, class_name, qapp):
+        """A larger size variant gets a pixmap rendered at its icon size, not an upscale."""
+        import importlib
+        from src.shell.ui import icon_loader
+        from src.shell.ui.material.menu_icon import SIZE_VARIANTS
+        icon_class = getattr(importlib.import_module(f"src.shell.ui.material.{module}"), class_name)
+        icon_loader.clear_icon_cache()
+
+        widget = icon_class("Test App", "fa5s.cog")
+        icon_loader.wait_for_pending_icons(5000)
+        widget.set_material_size("large")
+        icon_loader.wait_for_pending_icons(5000)
+
+        edge = SIZE_VARIANTS["large"].icon_size
+        assert widget.iconSize() == QSize(edge, edge)
+        assert QSize(edge, edge) in widget.icon().availableSizes()
+        assert widget.icon().pixmap(edge).size() == QSize(edge, edge)
+        icon_loader.clear_icon_cache()
+
+    def test_placeholder_until_icon_arrives(self, qapp, tmp_icon_file):
+        """Uncached icons show the fallback text, then swap in the rendered icon."""
+        from src.shell.ui import icon_loader
+        from src.shell.ui.material.menu_icon import MenuIcon
+        icon_loader.clear_icon_cache()
+
+        widget = MenuIcon("Test App", tmp_icon_file)
+        assert widget.text() == "TA"
+        assert widget.icon().isNull()
+
+        icon_loader.wait_for_pending_icons(5000)
+
+        assert widget.text() == ""
+        assert not widget.icon().isNull()
+        assert widget.property("state") == "icon"
+        icon_loader.clear_icon_cache()
+
+    def test_stale_render_is_ignored(self, qapp, tmp_icon_file):
+        """Changing icon_path while rendering keeps the newer content."""
+        from src.shell.ui import icon_loader
+        from src.shell.ui.material.menu_icon import MenuIcon
+        icon_loader.clear_icon_cache()
+
+        widget = MenuIcon("Test App", tmp_icon_file)
+        with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+            widget.set_icon_from_path("")
+        icon_loader.wait_for_pending_icons(5000)
+
+        assert widget.icon().isNull()
+        assert widget.text() == "TA"
+        icon_loader.clear_icon_cache()
+
+    def test_render_for_equal_path_is_applied(self, qapp, tmp_icon_file):
+        """Paths are compared by value: an equal but distinct string is not stale."""
+        from src.shell.ui.material.menu_icon import MenuIcon
+        with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+            widget = MenuIcon("Test App", tmp_icon_file)
+
+        widget.on_icon_ready("".join(list(tmp_icon_file)), _make_valid_qicon())
+
+        assert not widget.icon().isNull()
+        assert widget.text() == ""
+
+    def test_dpr_change_requests_crisp_icon(self, qapp, tmp_icon_file):
+        """Moving to a 2x screen re-renders in the background, keeping the 1x icon meanwhile."""
+        from PyQt6.QtCore import QCoreApplication, QEvent
+        from src.shell.ui import icon_loader
+        from src.shell.ui.material.menu_icon import MenuIcon
+        icon_loader.clear_icon_cache()
+
+        widget = MenuIcon("Test App", tmp_icon_file)
+        icon_loader.wait_for_pending_icons(5000)
+        low = widget.icon()
+
+        with patch.object(widget, "devicePixelRatioF", return_value=2.0):
+            QCoreApplication.sendEvent(widget, QEvent(QEvent.Type.DevicePixelRatioChange))
+            assert widget.icon().cacheKey() == low.cacheKey()
+            icon_loader.wait_for_pending_icons(5000)
+
+        assert QSize(112, 112) in widget.icon().availableSizes()
+        assert widget.text() == ""
+        icon_loader.clear_icon_cache()
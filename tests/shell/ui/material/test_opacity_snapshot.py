@@ -0,0 +1,254 @@
+"""Tests for src.shell.ui.material.opacity_snapshot — fading child widgets."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from PyQt6.QtCore import QPoint, QRect, Qt
+from PyQt6.QtGui import QColor, QImage, QPalette, QRegion
+from PyQt6.QtWidgets import QHBoxLayout, QPushButton, QWidget
+
+from src.shell.ui.material.animation import AnimationManager
+from src.shell.ui.material.animation_governor import animation_governor
+from src.shell.ui.material.opacity_snapshot import OpacitySnapshot
+
+
+@pytest.fixture(autouse=True)
+def full_tier():
+    animation_governor().set_performance_mode("full")
+    yield
+    animation_governor().set_performance_mode(None)
+
+
+@pytest.fixture
+def parent(qapp):
+    parent = QWidget()
+    parent.resize(600, 600)
+    parent.show()
+    yield parent
+    parent.deleteLater()
+
+
+@pytest.fixture
+def child(parent):
+    child = QWidget(parent)
+    child.setAutoFillBackground(True)
+    palette = child.palette()
+    palette.setColor(QPalette.ColorRole.Window, QColor("red"))
+    child.setPalette(palette)
+    child.setGeometry(100, 100, 200, 200)
+    child.show()
+    return child
+
+
+@pytest.fixture
+def manager(child):
+    manager = AnimationManager(child)
+    yield manager
+    manager.cleanup()
+
+
+def _finish(animation):
+    animation.setCurrentTime(animation.totalDuration())
+
+
+class TestOpacitySnapshot:
+    def test_paints_grab_with_opacity(self, child):
+        layer = OpacitySnapshot(child)
+        layer.begin(0.5)
+
+        assert child.isHidden() and layer.isVisible()
+        assert layer.geometry() == child.geometry()
+        image = QImage(layer.size(), QImage.Format.Format_ARGB32)
+        image.fill(Qt.GlobalColor.transparent)
+        layer.render(image, QPoint(), QRegion(), QWidget.RenderFlag(0))
+        pixel = image.pixelColor(100, 100)
+        assert pixel.red() == 255 and pixel.alpha() == pytest.approx(128, abs=2)
+
+        layer.end()
+        assert child.isVisible() and layer.isHidden()
+        assert not layer.active
+
+    def test_keeps_layout_space_while_hidden(self, parent):
+        layout = QHBoxLayout(parent)
+        button = QPushButton("Back")
+        layout.addWidget(button)
+        layout.activate()
+        layer = OpacitySnapshot(button)
+
+        layer.begin(0.0)
+        assert button.sizePolicy().retainSizeWhenHidden()
+        layer.end(show_target=False)
+
+        assert not button.sizePolicy().retainSizeWhenHidden()
+        assert button.isHidden()
+
+
+def _add_shadow(widget):
+    from PyQt6.QtWidgets import QGraphicsDropShadowEffect
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(16)
+    shadow.setOffset(0, 4)
+    shadow.setColor(QColor(0, 0, 0, 200))
+    widget.setGraphicsEffect(shadow)
+    return shadow
+
+
+class TestShadowedSnapshot:
+    def test_grab_includes_shadow_margins(self, child):
+        from PyQt6.QtCore import QMargins, QRectF
+        shadow = _add_shadow(child)
+        bounds = shadow.boundingRectFor(QRectF(child.rect())).toAlignedRect()
+
+        layer = OpacitySnapshot(child)
+        layer.begin(1.0)
+
+        assert layer._pixmap.size() == bounds.size()
+        assert layer._margins == QMargins(16, 12, 16, 20)
+        assert layer.content_geometry() == QRect(100, 100, 200, 200)
+        assert layer.geometry() == QRect(84, 88, 232, 232)
+
+        image = layer._pixmap.toImage()
+        below = image.pixelColor(bounds.width() // 2, bounds.height() - 12)
+        assert below.alpha() > 0 and below.red() < 128  # shadow, not background or content
+        assert image.pixelColor(0, 0).alpha() == 0  # nothing but the shadow is baked in
+
+        layer.end()
+        assert child.geometry() == QRect(100, 100, 200, 200)
+
+    def test_scaled_content_scales_shadow_margins(self, child):
+        _add_shadow(child)
+        layer = OpacitySnapshot(child)
+        layer.begin(1.0)
+
+        layer.set_content_geometry(QRect(150, 150, 100, 100))
+
+        assert layer.geometry() == QRect(142, 144, 116, 116)
+        layer.end()
+        assert child.geometry() == QRect(150, 150, 100, 100)
+
+    def test_combined_in_moves_content_geometry(self, manager, child):
+        _add_shadow(child)
+        group = manager.combined_fade_and_scale_in(QPoint(200, 200), scale_factor=0.5)
+
+        scale = group.animationAt(1)
+        assert bytes(scale.propertyName()) == b"contentGeometry"
+        assert scale.targetObject().content_geometry() == QRect(150, 150, 100, 100)
+
+        _finish(group)
+        assert child.geometry() == QRect(100, 100, 200, 200)
+        assert child.graphicsEffect() is not None
+
+
+class TestManagerSnapshots:
+    def test_window_targets_fade_window_opacity(self, qapp):
+        window = QWidget()
+        manager = AnimationManager(window)
+
+        animation = manager.fade_in()
+
+        assert bytes(animation.propertyName()) == b"windowOpacity"
+        assert animation.targetObject() is window
+        manager.cleanup()
+        window.deleteLater()
+
+    def test_child_fade_in_swaps_for_snapshot(self, manager, child):
+        callback = MagicMock()
+        animation = manager.fade_in(callback=callback)
+
+        layer = animation.targetObject()
+        assert isinstance(layer, OpacitySnapshot)
+        assert bytes(animation.propertyName()) == b"opacity"
+        assert child.isHidden() and layer.isVisible()
+
+        _finish(animation)
+        assert child.isVisible() and layer.isHidden()
+        assert layer.opacity == 1.0
+        callback.assert_called_once()
+
+    def test_child_fade_out_hides_target(self, manager, child):
+        _finish(manager.fade_out())
+
+        assert child.isHidden()
+        assert not manager._opacity_layer().active
+
+    def test_combined_in_scales_snapshot_to_final_geometry(self, manager, child):
+        group = manager.combined_fade_and_scale_in(QPoint(300, 300), scale_factor=0.5)
+
+        scale = group.animationAt(1)
+        assert isinstance(scale.targetObject(), OpacitySnapshot)
+        assert scale.startValue() == QRect(250, 250, 100, 100)
+
+        _finish(group)
+        assert child.geometry() == QRect(200, 200, 200, 200)
+        assert child.isVisible()
+
+    def test_stop_keeps_presented_frame(self, manager, child):
+        group = manager.combined_fade_and_scale_out()
+        group.setCurrentTime(150)
+        layer = manager._opacity_layer()
+        presented = (layer.opacity, layer.geometry())
+
+        manager.stop_all_animations()
+
+        assert layer.active and layer.isVisible() and child.isHidden()
+        assert (layer.opacity, layer.geometry()) == presented
+
+    def test_cleanup_hands_back_halted_layer(self, manager, child):
+        manager.combined_fade_and_scale_out().setCurrentTime(150)
+        manager.stop_all_animations()
+
+        manager.cleanup()
+
+        assert child.isVisible()
+
+    def test_repeated_fades_reuse_one_layer(self, manager, parent):
+        for _ in range(5):
+            _finish(manager.fade_in())
+            _finish(manager.fade_out())
+
+        assert len(parent.findChildren(OpacitySnapshot)) == 1
+
+
+class TestRetargeting:
+    def test_close_mid_open_continues_from_presented_state(self, manager, child):
+        opening = manager.combined_fade_and_scale_in(QPoint(200, 200))
+        opening.setCurrentTime(150)
+        layer = manager._opacity_layer()
+        opacity, rect = layer.opacity, layer.geometry()
+        callback = MagicMock()
+
+        closing = manager.combined_fade_and_scale_out(callback=callback)
+
+        fade, scale = closing.animationAt(0), closing.animationAt(1)
+        assert (fade.startValue(), scale.startValue()) == (opacity, rect)
+        assert (layer.opacity, layer.geometry()) == (opacity, rect)
+        assert 0 < closing.duration() < 300
+        assert not manager.is_animation_active("combined_in")
+
+        _finish(closing)
+        callback.assert_called_once()
+        assert child.isHidden() and not layer.active
+
+    def test_reopen_mid_close_returns_to_final_geometry(self, manager, child):
+        manager.combined_fade_and_scale_out().setCurrentTime(150)
+        layer = manager._opacity_layer()
+        opacity = layer.opacity
+
+        opening = manager.combined_fade_and_scale_in(QPoint(200, 200))
+
+        assert opening.animationAt(0).startValue() == opacity
+        assert child.isHidden() and layer.isVisible()
+        _finish(opening)
+        assert child.isVisible() and not layer.active
+        assert child.geometry() == QRect(100, 100, 200, 200)
+
+    def test_fade_already_at_target_finishes_at_once(self, manager, child):
+        manager.fade_in()
+        manager.stop_all_animations()
+        manager._opacity_layer().set_opacity(1.0)
+
+        animation = manager.fade_in()
+
+        assert animation.duration() == 0
+        assert not manager.has_active_animations()
+        assert child.isVisible()
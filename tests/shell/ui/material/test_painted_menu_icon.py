@@ -0,0 +1,159 @@
+"""Tests for src.shell.ui.material.painted_menu_icon and shadow_cache."""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon, QPixmap
+
+from src.shell.interfaces import IMenuIcon
+from src.shell.ui.styles import SHADOW_PRIMARY
+from src.shell.ui.material import shadow_cache
+from src.shell.ui.material.shadow_cache import get_shadow_patch
+
+
+def _make_valid_qicon():
+    pixmap = QPixmap(16, 16)
+    pixmap.fill()
+    return QIcon(pixmap)
+
+
+@pytest.fixture(autouse=True)
+def clear_shadows():
+    shadow_cache.clear_shadow_cache()
+    yield
+    shadow_cache.clear_shadow_cache()
+
+
+class TestPaintedMenuIcon:
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_no_stylesheet_or_graphics_effect(self, mock_load_icon, qapp):
+        """The painted variant carries no per-widget stylesheet or effect."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon
+        widget = PaintedMenuIcon("Test App", "fa5s.cog")
+
+        assert widget.styleSheet() == ""
+        assert widget.graphicsEffect() is None
+        assert isinstance(widget, IMenuIcon)
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_button_clicked_signal(self, mock_load_icon, qapp):
+        """button_clicked still emits the icon label."""
+        mock_load_icon.return_value = _make_valid_qicon()
+        callback = MagicMock()
+
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon
+        widget = PaintedMenuIcon("Test App", "fa5s.cog", callback=callback)
+        widget.button_clicked.emit(widget.icon_label)
+
+        callback.assert_called_once_with("Test App")
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_paints_fallback_text(self, mock_load_icon, qapp):
+        """Fallback text is kept and the widget renders without errors."""
+        mock_load_icon.return_value = QIcon()
+
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon
+        widget = PaintedMenuIcon("My App", "")
+
+        assert widget.text() == "MA"
+        assert not widget.grab().isNull()
+
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_icons_share_cached_shadow(self, mock_load_icon, qapp):
+        """Painting many icons renders the shadow pixmap only once."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon
+        widgets = [PaintedMenuIcon(f"App {i}", "fa5s.cog") for i in range(5)]
+        with patch.object(shadow_cache, "_blur_image", wraps=shadow_cache._blur_image) as blur:
+            for widget in widgets:
+                widget.grab()
+
+        assert blur.call_count == 1
+
+
+    def test_grid_draws_from_one_atlas_page(self, qapp, tmp_icon_file):
+        """Icons of a grid are blitted from one shared atlas page."""
+        from src.shell.ui import icon_loader
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon
+        icon_loader.clear_icon_cache()
+        icon_loader.load_icon(tmp_icon_file)
+
+        icons = [PaintedMenuIcon(f"App {i}", tmp_icon_file) for i in range(12)]
+        for icon in icons:
+            icon.grab()
+
+        handles = {id(icon.icon_atlas_handle()) for icon in icons}
+        assert len(handles) == 1
+        assert icon_loader.atlas_stats()[:3] == (1, 1, 1)
+        icon_loader.clear_icon_cache()
+
+
+class TestShadowCache:
+    def test_same_key_returns_same_patch(self, qapp):
+        assert get_shadow_patch(28, 12, SHADOW_PRIMARY) is get_shadow_patch(28, 12, SHADOW_PRIMARY)
+
+    def test_patch_geometry(self, qapp):
+        patch_ = get_shadow_patch(10, 4, SHADOW_PRIMARY)
+
+        assert patch_.margin == 4
+        assert patch_.corner == 14
+        assert patch_.pixmap.width() == 2 * 14 + 1
+
+
+class TestFactorySelection:
+    def test_factory_passes_menu_icon_class(self, qapp):
+        """MaterialUIFactory(menu_icon_class=...) reaches folders and expanded views."""
+        from src.shell.ui.material import MaterialUIFactory
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon
+
+        factory = MaterialUIFactory(menu_icon_class=PaintedMenuIcon)
+        with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+            folder = factory.create_folder_widget(1, "Work")
+            folder.add_app("Dashboard", "fa5s.cog")
+        manager = factory.create_expanded_view_manager(folder)
+
+        assert isinstance(folder.buttons[0], PaintedMenuIcon)
+        assert manager.icon_class is PaintedMenuIcon
+
+
+class TestPaintedVariants:
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_variants_use_shared_descriptors(self, mock_load_icon, qapp):
+        """Painted size/style switches read the precomputed descriptors."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material.menu_icon import SIZE_VARIANTS
+        from src.shell.ui.material.painted_menu_icon import PaintedMenuIcon, _STYLE_COLORS
+        widget = PaintedMenuIcon("Test App", "fa5s.cog")
+        widget.set_material_size("large")
+        widget.set_material_style("tertiary")
+
+        assert widget._radius == SIZE_VARIANTS["large"].radius
+        assert widget.iconSize() == QSize(72, 72)
+        assert widget._colors is _STYLE_COLORS["tertiary"]
+
+
+class TestShadowFit:
+    @pytest.mark.parametrize("size_variant", ["compact", "standard", "large"])
+    @patch("src.shell.ui.material.menu_icon.load_icon")
+    def test_every_elevation_shadow_fits_inside_widget(self, mock_load_icon, size_variant, qapp):
+        """The blurred, offset shadow of each elevation level is never clipped."""
+        mock_load_icon.return_value = _make_valid_qicon()
+
+        from src.shell.ui.material import painted_menu_icon
+        from src.shell.ui.material.menu_icon import ELEVATION_LEVELS
+        widget = painted_menu_icon.PaintedMenuIcon("Test App", "fa5s.cog")
+        widget.set_material_size(size_variant)
+
+        for level in range(len(ELEVATION_LEVELS)):
+            widget.set_elevation_level(level)
+            with patch.object(painted_menu_icon, "draw_shadow") as draw:
+                widget.grab()
+            _, surface, patch_, offset_y = draw.call_args.args
+            spill = surface.adjusted(-patch_.margin, -patch_.margin, patch_.margin, patch_.margin)
+
+            assert widget.rect().contains(spill.translated(0, offset_y))
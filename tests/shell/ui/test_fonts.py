@@ -0,0 +1,56 @@
+"""Tests for src.shell.ui.fonts — family resolution and font cache."""
+
+import pytest
+from unittest.mock import patch
+
+from src.shell.ui import fonts
+from src.shell.ui.fonts import get_font, resolve_family, clear_font_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_fonts():
+    """Reset resolved family and cached fonts around every test."""
+    clear_font_cache()
+    yield
+    clear_font_cache()
+
+
+class TestResolveFamily:
+    @patch("src.shell.ui.fonts.QFontDatabase.families", return_value=["Segoe UI", "Arial"])
+    def test_falls_back_to_next_installed_family(self, mock_families, qapp):
+        """Roboto missing → Segoe UI."""
+        assert resolve_family() == "Segoe UI"
+
+    @patch("src.shell.ui.fonts.QFontDatabase.families", return_value=["Arial"])
+    def test_uses_last_fallback_when_none_installed(self, mock_families, qapp):
+        """Nothing installed → last entry of the chain."""
+        assert resolve_family() == fonts.FONT_FAMILY_FALLBACKS[-1]
+
+    @patch("src.shell.ui.fonts.QFontDatabase.families", return_value=["Roboto"])
+    def test_queries_font_database_once(self, mock_families, qapp):
+        """Repeated lookups never touch the font database again."""
+        for size in range(18, 29):
+            get_font("folder_title", size)
+        get_font("expanded_title")
+
+        mock_families.assert_called_once()
+
+
+class TestGetFont:
+    def test_role_defaults(self, qapp):
+        """Role default point size and weight are applied."""
+        size, weight = fonts.TYPOGRAPHY_ROLES["expanded_title"]
+        font = get_font("expanded_title")
+
+        assert font.pointSize() == size
+        assert font.weight() == weight
+        assert font.family() == resolve_family()
+
+    def test_cache_hit_returns_same_object(self, qapp):
+        """Same (role, size, weight) → same QFont instance."""
+        assert get_font("folder_title", 20) is get_font("folder_title", 20)
+        assert get_font("folder_title", 20) is not get_font("folder_title", 22)
+
+    def test_unknown_role_raises(self, qapp):
+        with pytest.raises(KeyError):
+            get_font("no_such_role")
@@ -0,0 +1,86 @@
+"""Tests for src.shell.ui.icon_atlas and icon_loader.atlas_handle()."""
+
+import pytest
+
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from src.shell.ui import icon_loader
+from src.shell.ui.icon_atlas import IconAtlas
+
+SIZE = QSize(16, 16)
+
+
+def _image(color, edge=16):
+    image = QImage(edge, edge, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(color))
+    return image
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    icon_loader.clear_icon_cache()
+    yield
+    icon_loader.clear_icon_cache()
+
+
+class TestIconAtlas:
+    def test_icons_share_one_page(self, qapp):
+        atlas = IconAtlas(SIZE, 1.0, page_edge=64)
+
+        handles = [atlas.add(i, _image("#FF0000")) for i in range(16)]
+
+        assert len(atlas.pages) == 1
+        assert len({(h.rect.x(), h.rect.y()) for h in handles}) == 16
+
+    def test_full_page_starts_a_new_one(self, qapp):
+        atlas = IconAtlas(SIZE, 1.0, page_edge=32)
+
+        handle = [atlas.add(i, _image("#FF0000")) for i in range(5)][-1]
+
+        assert len(atlas.pages) == 2
+        assert (handle.page, handle.rect) == (1, QRect(0, 0, 16, 16))
+
+    def test_growing_a_page_keeps_packed_icons(self, qapp):
+        atlas = IconAtlas(SIZE, 1.0, page_edge=64)
+        first = atlas.add("red", _image("#FF0000"))
+        for i in range(12):
+            atlas.add(i, _image("#0000FF"))
+
+        page = atlas.pages[first.page].toImage()
+        assert page.height() == 64
+        assert QColor(page.pixel(first.rect.center())) == QColor("#FF0000")
+
+    def test_cells_are_device_pixels(self, qapp):
+        atlas = IconAtlas(SIZE, 2.0)
+
+        handle = atlas.add("x", _image("#FF0000", edge=32))
+
+        assert handle.rect.size() == QSize(32, 32)
+
+    def test_draw_blits_sub_rect(self, qapp):
+        atlas = IconAtlas(SIZE, 1.0)
+        atlas.add("red", _image("#FF0000"))
+        green = atlas.add("green", _image("#00FF00"))
+
+        target = QImage(16, 16, QImage.Format.Format_ARGB32_Premultiplied)
+        target.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(target)
+        green.draw(painter, QRect(0, 0, 16, 16))
+        painter.end()
+
+        assert QColor(target.pixel(8, 8)) == QColor("#00FF00")
+
+
+class TestAtlasHandle:
+    def test_unloaded_icon_has_no_handle(self, qapp, tmp_icon_file):
+        assert icon_loader.atlas_handle(tmp_icon_file, None, SIZE, 1.0) is None
+        assert len(icon_loader._icon_cache) == 0
+
+    def test_loaded_icons_are_packed_once(self, qapp, tmp_icon_file):
+        icon_loader.load_icon(tmp_icon_file)
+
+        handle = icon_loader.atlas_handle(tmp_icon_file, None, SIZE, 1.0)
+
+        assert handle is icon_loader.atlas_handle(tmp_icon_file, None, SIZE, 1.0)
+        assert icon_loader.atlas_stats() == (1, 1, 1, handle.atlas.total_bytes)
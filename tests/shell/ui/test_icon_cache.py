@@ -0,0 +1,88 @@
+"""Tests for src.shell.ui.icon_cache — bounded LRU cache."""
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon, QPixmap
+
+from src.shell.ui.icon_cache import IconCache, estimate_bytes
+
+
+class TestIconCacheEviction:
+    def test_evicts_least_recently_used_entry(self):
+        cache = IconCache(max_entries=2)
+        cache.put("a", 1, cost=0)
+        cache.put("b", 2, cost=0)
+        cache.get("a")
+        cache.put("c", 3, cost=0)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget_evicts(self):
+        cache = IconCache(max_entries=10, max_bytes=100)
+        cache.put("a", 1, cost=60)
+        cache.put("b", 2, cost=60)
+
+        assert list(cache._entries) == ["b"]
+        assert cache.total_bytes == 60
+
+    def test_oversized_entry_is_kept_alone(self):
+        """A single entry larger than the budget still caches the latest value."""
+        cache = IconCache(max_entries=10, max_bytes=10)
+        cache.put("big", 1, cost=50)
+
+        assert "big" in cache
+
+    def test_replacing_entry_updates_bytes(self):
+        cache = IconCache()
+        cache.put("a", 1, cost=40)
+        cache.put("a", 2, cost=10)
+
+        assert len(cache) == 1
+        assert cache.total_bytes == 10
+
+
+class TestIconCacheApi:
+    def test_hit_and_miss_counters(self):
+        cache = IconCache()
+        cache["a"] = QIcon()
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_trim_to_smaller_limits(self):
+        cache = IconCache()
+        for i in range(10):
+            cache.put(i, i, cost=10)
+
+        assert cache.trim(max_entries=3) == 7
+        assert list(cache._entries) == [7, 8, 9]
+
+    def test_configure_shrinks_immediately(self):
+        cache = IconCache()
+        for i in range(5):
+            cache.put(i, i, cost=10)
+        cache.configure(max_bytes=20)
+
+        assert len(cache) == 2
+        assert cache.max_bytes == 20
+
+    def test_clear_keeps_counters(self):
+        cache = IconCache()
+        cache.put("a", 1, cost=5)
+        cache.get("a")
+        cache.clear()
+
+        assert len(cache) == 0 and cache.total_bytes == 0
+        assert cache.stats().hits == 1
+
+
+class TestEstimateBytes:
+    def test_pixmap_bytes(self, qapp):
+        assert estimate_bytes(QPixmap(10, 10)) == 400
+
+    def test_icon_uses_render_size_and_dpr(self, qapp):
+        assert estimate_bytes(QIcon(), QSize(16, 16), dpr=2.0) == 32 * 32 * 4
@@ -0,0 +1,169 @@
+"""Tests for src.shell.ui.icon_disk_cache and the icon_loader disk cache hooks."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QIcon, QImage, QPixmap
+
+from src.shell.ui import icon_loader
+from src.shell.ui.icon_disk_cache import IconDiskCache, rasterize
+
+SIZE = QSize(16, 16)
+
+
+def _image(color="#FF0000", edge=16):
+    image = QImage(edge, edge, QImage.Format.Format_ARGB32)
+    image.fill(QColor(color))
+    return image
+
+
+@pytest.fixture(autouse=True)
+def reset_loader():
+    icon_loader.clear_icon_cache()
+    yield
+    icon_loader.disable_disk_cache()
+    icon_loader.clear_icon_cache()
+
+
+class TestIconDiskCache:
+    def test_round_trip_after_restart(self, qapp, tmp_path):
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        assert cache.store("fa5s.cog", "#FFFFFF", SIZE, 1.0, _image())
+        cache.flush()
+
+        reopened = IconDiskCache(str(tmp_path), "1.0")
+        pixmap = reopened.load("fa5s.cog", "#FFFFFF", SIZE, 1.0)
+
+        assert pixmap is not None
+        assert QColor(pixmap.toImage().pixel(8, 8)) == QColor("#FF0000")
+
+    def test_qtawesome_upgrade_invalidates(self, qapp, tmp_path):
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        cache.store("fa5s.cog", None, SIZE, 1.0, _image())
+        cache.flush()
+
+        assert IconDiskCache(str(tmp_path), "2.0").load("fa5s.cog", None, SIZE, 1.0) is None
+
+    def test_modified_file_invalidates(self, qapp, tmp_path, tmp_icon_file):
+        cache = IconDiskCache(str(tmp_path / "cache"))
+        cache.store(tmp_icon_file, None, SIZE, 1.0, _image())
+        stat = os.stat(tmp_icon_file)
+        os.utime(tmp_icon_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.load(tmp_icon_file, None, SIZE, 1.0) is None
+
+    def test_wrong_dimensions_rejected(self, qapp, tmp_path):
+        """A PNG that does not match size x dpr is treated as a miss."""
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        cache.store("fa5s.cog", None, SIZE, 2.0, _image(edge=16))
+
+        assert cache.load("fa5s.cog", None, SIZE, 2.0) is None
+
+    def test_corrupt_index_is_ignored(self, qapp, tmp_path):
+        (tmp_path / "index.json").write_text("{not json")
+
+        assert len(IconDiskCache(str(tmp_path), "1.0")) == 0
+
+    def test_malformed_entries_are_dropped(self, qapp, tmp_path):
+        """Entries without a file, or that are not dicts, never reach load()."""
+        import json
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        cache.store("fa5s.cog", None, SIZE, 1.0, _image())
+        cache.flush()
+        index_path = tmp_path / "index.json"
+        data = json.loads(index_path.read_text())
+        (good_key, good), = data["entries"].items()
+        missing_file = dict(good)
+        del missing_file["file"]
+        data["entries"] = {
+            good_key: good,
+            '["fa5s.home", null, 16, 16, 1.0]': missing_file,
+            '["fa5s.star", null, 16, 16, 1.0]': "not an entry",
+        }
+        index_path.write_text(json.dumps(data))
+
+        cache = IconDiskCache(str(tmp_path), "1.0")
+
+        assert len(cache) == 1
+        assert cache.load("fa5s.home", None, SIZE, 1.0) is None
+        assert cache.load("fa5s.star", None, SIZE, 1.0) is None
+        assert cache.load("fa5s.cog", None, SIZE, 1.0) is not None
+
+    def test_load_survives_corrupt_entry(self, qapp, tmp_path):
+        """An entry corrupted after the index was read is a miss, not an exception."""
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        cache.store("fa5s.cog", None, SIZE, 1.0, _image())
+        for entry in cache._index.values():
+            del entry["file"]
+
+        assert cache.load("fa5s.cog", None, SIZE, 1.0) is None
+
+    def test_hydrate_groups_sizes_per_source(self, qapp, tmp_path):
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        cache.store("fa5s.cog", None, SIZE, 1.0, _image(edge=16))
+        cache.store("fa5s.cog", None, QSize(32, 32), 1.0, _image(edge=32))
+
+        icons = cache.hydrate()
+
+        assert list(icons) == [("fa5s.cog", None, 1.0)]
+        assert len(icons[("fa5s.cog", None, 1.0)].availableSizes()) == 2
+
+    def test_hydrate_keeps_pixel_ratios_apart(self, qapp, tmp_path):
+        cache = IconDiskCache(str(tmp_path), "1.0")
+        cache.store("fa5s.cog", None, SIZE, 1.0, _image(edge=16))
+        cache.store("fa5s.cog", None, SIZE, 2.0, _image(edge=32))
+
+        icons = cache.hydrate()
+
+        assert set(icons) == {("fa5s.cog", None, 1.0), ("fa5s.cog", None, 2.0)}
+
+
+class TestLoaderDiskCache:
+    def test_restart_is_served_from_disk(self, qapp, tmp_path, tmp_icon_file):
+        """Second start populates the cache from disk before any load_icon call."""
+        cache_dir = str(tmp_path / "icons")
+        icon_loader.enable_disk_cache(cache_dir)
+        assert not icon_loader.load_icon(tmp_icon_file, size=SIZE).isNull()
+        icon_loader.disable_disk_cache()
+        icon_loader.clear_icon_cache()
+
+        assert icon_loader.enable_disk_cache(cache_dir) == 1
+        misses = icon_loader.icon_cache_stats().misses
+        with patch("src.shell.ui.icon_loader.os.path.exists") as exists:
+            icon = icon_loader.load_icon(tmp_icon_file, size=SIZE)
+
+        assert not icon.isNull()
+        assert icon_loader.icon_cache_stats().misses == misses
+        exists.assert_not_called()
+
+    def test_miss_falls_back_to_live_rendering(self, qapp, tmp_path, tmp_icon_file):
+        icon_loader.enable_disk_cache(str(tmp_path / "empty"))
+
+        icon = icon_loader.load_icon(tmp_icon_file, size=SIZE)
+
+        assert not icon.isNull()
+
+    def test_rasterize_matches_device_pixels(self, qapp):
+        pixmap = QPixmap(8, 8)
+        pixmap.fill(QColor("#00FF00"))
+
+        image = rasterize(QIcon(pixmap), SIZE, 2.0)
+
+        assert (image.width(), image.height()) == (32, 32)
+
+    def test_preload_reads_from_disk(self, qapp, tmp_path, tmp_icon_file):
+        cache_dir = str(tmp_path / "icons")
+        icon_loader.enable_disk_cache(cache_dir)
+        icon_loader.preload([tmp_icon_file], sizes=(SIZE,))
+        icon_loader.disable_disk_cache()
+        icon_loader.clear_icon_cache()
+
+        # Keep the disk entries out of memory to exercise the preload disk path
+        with patch.object(IconDiskCache, "hydrate", return_value={}):
+            icon_loader.enable_disk_cache(cache_dir)
+        report = icon_loader.preload([tmp_icon_file], sizes=(SIZE,))
+
+        assert (report.from_disk, report.rendered) == (1, 0)
@@ -7,15 +7,15 @@ from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtCore import QSize
 
 from src.shell.ui import icon_loader
-from src.shell.ui.icon_loader import load_icon, _tint_icon, _icon_cache
+from src.shell.ui.icon_loader import load_icon, _tint_icon, _icon_cache, _tint_cache
 
 
 @pytest.fixture(autouse=True)
 def clear_icon_cache():
-    """Reset the icon cache before every test."""
-    _icon_cache.clear()
+    """Reset the icon, tint, atlas and negative caches before every test."""
+    icon_loader.clear_icon_cache()
     yield
-    _icon_cache.clear()
+    icon_loader.clear_icon_cache()
 
 
 # ── load_icon: QIcon input ────────────────────────────────────────────
@@ -157,6 +157,47 @@ class TestLoadIconCache:
         assert mock_qta.icon.call_count == 2
 
 
+
+class TestNegativeCache:
+    @patch("src.shell.ui.icon_loader.os.path.exists", return_value=False)
+    @patch("src.shell.ui.icon_loader.qta")
+    def test_failure_is_looked_up_once(self, mock_qta, mock_exists, qapp, capsys):
+        """Repeated loads of a bad icon skip the stat and qtawesome lookup."""
+        mock_qta.icon.side_effect = Exception("not found")
+
+        for _ in range(5):
+            assert load_icon("fa5s.nonexistent").isNull()
+
+        mock_qta.icon.assert_called_once()
+        mock_exists.assert_called_once()
+        assert icon_loader.failed_icons() == {("fa5s.nonexistent", None): 4}
+        assert capsys.readouterr().out.count("fa5s.nonexistent") == 1
+
+    @patch("src.shell.ui.icon_loader.os.path.exists", return_value=False)
+    @patch("src.shell.ui.icon_loader.qta")
+    def test_failure_expires_after_ttl(self, mock_qta, mock_exists, qapp):
+        mock_qta.icon.side_effect = Exception("not found")
+        load_icon("fa5s.nonexistent")
+
+        with patch("src.shell.ui.icon_loader.time.monotonic",
+                   return_value=icon_loader.time.monotonic() + icon_loader.NEGATIVE_CACHE_TTL_S):
+            load_icon("fa5s.nonexistent")
+
+        assert mock_qta.icon.call_count == 2
+
+    def test_undecodable_file_is_cached_after_background_render(self, qapp, tmp_path):
+        bad = tmp_path / "broken.png"
+        bad.write_bytes(b"not a png")
+        callback = MagicMock()
+
+        load_icon(str(bad), size=QSize(16, 16), on_ready=callback)
+        icon_loader.wait_for_pending_icons(5000)
+
+        assert load_icon(str(bad), size=QSize(16, 16), on_ready=callback).isNull()
+        assert not icon_loader._pending
+        callback.assert_not_called()
+
+
 # ── _tint_icon ────────────────────────────────────────────────────────
 
 class TestTintIcon:
@@ -196,3 +237,258 @@ class TestTintIcon:
         result = _tint_icon(icon, "#FF0000", size)
 
         assert result is icon
+
+
+class TestTintCache:
+    def _icon(self):
+        pixmap = QPixmap(16, 16)
+        pixmap.fill()
+        return QIcon(pixmap)
+
+    def test_retint_is_cache_hit(self, qapp):
+        """Same icon, color and size → same QIcon, no second composite."""
+        icon = self._icon()
+        first = _tint_icon(icon, "#FF0000", QSize(16, 16))
+
+        with patch("src.shell.ui.icon_loader.QPainter") as MockPainter:
+            second = load_icon(icon, color="#FF0000", size=QSize(16, 16))
+
+        assert second is first
+        MockPainter.assert_not_called()
+
+    def test_color_and_size_are_part_of_key(self, qapp):
+        icon = self._icon()
+        red = _tint_icon(icon, "#FF0000", QSize(16, 16))
+
+        assert _tint_icon(icon, "#00FF00", QSize(16, 16)) is not red
+        assert _tint_icon(icon, "#FF0000", QSize(8, 8)) is not red
+        assert len(_tint_cache) == 3
+
+    @patch("src.shell.ui.icon_loader.QPainter")
+    def test_failures_are_not_cached(self, MockPainter, qapp):
+        MockPainter.side_effect = Exception("paint error")
+        icon = self._icon()
+
+        _tint_icon(icon, "#FF0000", QSize(16, 16))
+
+        assert len(_tint_cache) == 0
+
+
+def _filled_pixmap():
+    pixmap = QPixmap(16, 16)
+    pixmap.fill()
+    return pixmap
+
+
+class TestBatchTint:
+    def test_batch_is_memoized_and_deduplicated(self, qapp):
+        icon = QIcon(_filled_pixmap())
+        size = QSize(16, 16)
+
+        first = icon_loader.tint_icons([icon, icon], "#FF0000", size)
+        second = icon_loader.tint_icons([icon], "#FF0000", size)
+
+        assert first[0] is first[1] is second[0]
+        assert icon_loader.tint_cache_stats().entries == 1
+
+    def test_shares_cache_with_single_tint(self, qapp):
+        icon = QIcon(_filled_pixmap())
+        size = QSize(16, 16)
+
+        batch = icon_loader.tint_icons([icon], "#00FF00", size)[0]
+
+        assert _tint_icon(icon, "#00FF00", size) is batch
+
+    def test_desaturated_results_are_cached_separately(self, qapp):
+        icon = QIcon(_filled_pixmap())
+        size = QSize(16, 16)
+
+        normal = icon_loader.tint_icons([icon], "#FF0000", size)[0]
+        disabled = icon_loader.tint_icons([icon], "#FF0000", size, desaturate=True)[0]
+
+        assert normal is not disabled
+        assert icon_loader.tint_cache_stats().entries == 2
+
+    def test_empty_icons_pass_through(self, qapp):
+        icon = QIcon()
+
+        assert icon_loader.tint_icons([icon], "#FF0000", QSize(16, 16))[0] is icon
+
+
+# ── icon cache API ────────────────────────────────────────────────────
+
+class TestIconCacheApi:
+    @patch("src.shell.ui.icon_loader.os.path.exists", return_value=False)
+    @patch("src.shell.ui.icon_loader.qta")
+    def test_stats_count_hits_and_misses(self, mock_qta, mock_exists, qapp):
+        """Loads through the cache are reflected in icon_cache_stats()."""
+        fake_icon = MagicMock(spec=QIcon)
+        fake_icon.isNull.return_value = False
+        mock_qta.icon.return_value = fake_icon
+        before = icon_loader.icon_cache_stats()
+
+        load_icon("fa5s.cog")
+        load_icon("fa5s.cog")
+
+        after = icon_loader.icon_cache_stats()
+        assert after.misses - before.misses == 1
+        assert after.hits - before.hits == 1
+        assert after.entries == 1
+
+    @patch("src.shell.ui.icon_loader.os.path.exists", return_value=False)
+    @patch("src.shell.ui.icon_loader.qta")
+    def test_trim_icon_cache(self, mock_qta, mock_exists, qapp):
+        """trim_icon_cache evicts least-recently-used icons."""
+        fake_icon = MagicMock(spec=QIcon)
+        fake_icon.isNull.return_value = False
+        mock_qta.icon.return_value = fake_icon
+        for name in ("fa5s.cog", "fa5s.home", "fa5s.user"):
+            load_icon(name)
+
+        assert icon_loader.trim_icon_cache(max_entries=1) == 2
+        assert ("fa5s.user", None) in _icon_cache
+
+
+# ── background rasterization ──────────────────────────────────────────
+
+class TestAsyncLoad:
+    def test_miss_returns_placeholder_then_delivers(self, qapp, tmp_icon_file):
+        """on_ready + size → empty icon now, rendered icon on the GUI thread later."""
+        ready = []
+
+        placeholder = load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=ready.append)
+
+        assert placeholder.isNull()
+        assert icon_loader.wait_for_pending_icons(5000)
+        assert len(ready) == 1 and not ready[0].isNull()
+        assert load_icon(tmp_icon_file, size=QSize(16, 16)) is ready[0]
+
+    def test_concurrent_requests_share_one_render(self, qapp, tmp_icon_file):
+        ready = []
+        rasterizer = icon_loader._get_rasterizer()
+        with patch.object(rasterizer, "submit", wraps=rasterizer.submit) as submit:
+            for _ in range(3):
+                load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=ready.append)
+            icon_loader.wait_for_pending_icons(5000)
+
+        submit.assert_called_once()
+        assert len(ready) == 3 and ready[0] is ready[1] is ready[2]
+
+    def test_cache_hit_is_synchronous(self, qapp, tmp_icon_file):
+        icon = load_icon(tmp_icon_file)
+        callback = MagicMock()
+
+        assert load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=callback) is icon
+        callback.assert_not_called()
+
+    def test_workers_get_glyph_description_not_icon(self, qapp):
+        """qtawesome QIcons never cross to the worker threads."""
+        from src.shell.ui.icon_rasterizer import Glyph
+        ready = []
+        rasterizer = icon_loader._get_rasterizer()
+        with patch.object(rasterizer, "submit", wraps=rasterizer.submit) as submit:
+            load_icon("fa5s.cog", color="#FFFFFF", size=QSize(16, 16), on_ready=ready.append)
+            assert icon_loader.wait_for_pending_icons(5000)
+
+        assert isinstance(submit.call_args.args[2], Glyph)
+        assert len(ready) == 1 and not ready[0].isNull()
+
+    def test_glyph_render_matches_qtawesome(self, qapp):
+        from src.shell.ui.icon_disk_cache import rasterize
+        from src.shell.ui.icon_rasterizer import render_glyph
+
+        for color in ("#FFFFFF", None):
+            icon = icon_loader._create_icon("fa5s.cog", color)
+            glyph = icon_loader._glyph("fa5s.cog", color)
+            assert render_glyph(glyph, QSize(24, 24), 2.0) == rasterize(icon, QSize(24, 24), 2.0)
+
+    @patch("src.shell.ui.icon_loader.os.path.exists", return_value=False)
+    @patch("src.shell.ui.icon_loader.qta")
+    def test_unknown_glyph_is_not_queued(self, mock_qta, mock_exists, qapp):
+        mock_qta.icon.side_effect = Exception("not found")
+        callback = MagicMock()
+
+        assert load_icon("fa5s.nonexistent", size=QSize(16, 16), on_ready=callback).isNull()
+        assert icon_loader.wait_for_pending_icons(5000)
+        callback.assert_not_called()
+
+
+
+class TestPixelRatios:
+    def test_renders_are_keyed_per_dpr(self, qapp, tmp_icon_file):
+        ready = []
+        load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=ready.append, dpr=1.0)
+        load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=ready.append, dpr=2.0)
+        icon_loader.wait_for_pending_icons(5000)
+
+        low = _icon_cache.peek((tmp_icon_file, None, 1.0))
+        high = _icon_cache.peek((tmp_icon_file, None, 2.0))
+        assert low.availableSizes() == [QSize(16, 16)]
+        assert high.availableSizes() == [QSize(32, 32)]
+
+    def test_missing_size_keeps_current_icon_while_rendering(self, qapp, tmp_icon_file):
+        icon_loader.preload([tmp_icon_file], sizes=(QSize(16, 16),), parallel=False)
+        current = _icon_cache.peek((tmp_icon_file, None, 1.0))
+        ready = []
+
+        assert load_icon(tmp_icon_file, size=QSize(32, 32), on_ready=ready.append, dpr=1.0) is current
+        icon_loader.wait_for_pending_icons(5000)
+
+        assert len(ready) == 1
+        assert len(ready[0].availableSizes()) == 2
+
+    def test_unused_dprs_are_evicted(self, qapp, tmp_icon_file):
+        for dpr in (1.0, 3.0):
+            load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=MagicMock(), dpr=dpr)
+        icon_loader.wait_for_pending_icons(5000)
+
+        with patch("src.shell.ui.icon_loader._screen_dprs", return_value={1.0}):
+            assert icon_loader.evict_unused_dprs() == 1
+
+        assert (tmp_icon_file, None, 3.0) not in _icon_cache
+        assert (tmp_icon_file, None, 1.0) in _icon_cache
+
+
+# ── preload ───────────────────────────────────────────────────────────
+
+class TestPreload:
+    def test_deduplicates_and_warms_cache(self, qapp, tmp_icon_file):
+        """Duplicates collapse; later sized loads are cache hits."""
+        report = icon_loader.preload([tmp_icon_file, tmp_icon_file, "", None],
+                                     colors=(None,), sizes=(QSize(16, 16), QSize(16, 16)))
+
+        assert (report.requested, report.rendered, report.failed) == (1, 1, 0)
+        hits = icon_loader.icon_cache_stats().hits
+        assert not load_icon(tmp_icon_file, size=QSize(16, 16), on_ready=MagicMock()).isNull()
+        assert icon_loader.icon_cache_stats().hits == hits + 1
+
+    def test_sizeless_load_after_preload_is_scalable(self, qapp, tmp_icon_file):
+        """A preloaded raster only holds its sizes; a sizeless load gets the scalable icon."""
+        icon_loader.preload([tmp_icon_file], sizes=(QSize(16, 16),), parallel=False)
+        raster = _icon_cache.peek((tmp_icon_file, None, 1.0))
+
+        icon = load_icon(tmp_icon_file, dpr=1.0)
+
+        assert icon is not raster and not icon.isNull()
+        assert _icon_cache.peek((tmp_icon_file, None)) is icon
+        assert load_icon(tmp_icon_file, size=QSize(16, 16), dpr=1.0) is raster
+
+    def test_second_preload_is_all_cached(self, qapp, tmp_icon_file):
+        sizes = (QSize(16, 16), QSize(32, 32))
+        icon_loader.preload([tmp_icon_file], sizes=sizes, parallel=False)
+
+        report = icon_loader.preload([tmp_icon_file], sizes=sizes)
+
+        assert (report.requested, report.cached, report.rendered) == (2, 2, 0)
+        assert len(_icon_cache.peek((tmp_icon_file, None, 1.0)).availableSizes()) == 2
+
+    @patch("src.shell.ui.icon_loader.os.path.exists", return_value=False)
+    @patch("src.shell.ui.icon_loader.qta")
+    def test_failures_are_reported(self, mock_qta, mock_exists, qapp):
+        mock_qta.icon.side_effect = Exception("not found")
+
+        report = icon_loader.preload(["fa5s.nonexistent"], colors=(None, "#FFFFFF"),
+                                     sizes=(QSize(16, 16),))
+
+        assert (report.requested, report.failed) == (2, 2)
+        assert report.elapsed_ms >= 0
@@ -0,0 +1,85 @@
+"""Tests for src.shell.ui.icon_tint — painter and NumPy recolor paths."""
+
+import pytest
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage
+
+from src.shell.ui import icon_tint
+from src.shell.ui.icon_tint import tint_image, tint_images
+
+
+def _image(color="#FF8000", alpha=255):
+    """8x8 image: left half opaque-ish color, right half transparent"""
+    image = QImage(8, 8, QImage.Format.Format_ARGB32)
+    image.fill(Qt.GlobalColor.transparent)
+    fill = QColor(color)
+    fill.setAlpha(alpha)
+    for x in range(4):
+        for y in range(8):
+            image.setPixelColor(x, y, fill)
+    return image
+
+
+@pytest.fixture(params=["painter", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(icon_tint, "_np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(icon_tint, "_np", None)
+    return request.param
+
+
+class TestTintImages:
+    def test_recolor_keeps_alpha(self, qapp, backend):
+        result = tint_images([_image(alpha=128)], "#0000FF")[0]
+
+        inside = result.pixelColor(1, 1)
+        assert (inside.red(), inside.green(), inside.blue()) == (0, 0, 255)
+        assert abs(inside.alpha() - 128) <= 1
+        assert result.pixelColor(6, 6).alpha() == 0
+
+    def test_desaturate_color(self, qapp, backend):
+        result = tint_images([_image()], "#FF0000", desaturate=True)[0]
+
+        inside = result.pixelColor(1, 1)
+        # sRGB luminance of pure red, as QImage's grayscale conversion computes it
+        assert inside.red() == inside.green() == inside.blue() == 127
+
+    def test_desaturate_keeps_own_colors_gray(self, qapp, backend):
+        result = tint_images([_image("#00FF00")], None, desaturate=True)[0]
+
+        inside = result.pixelColor(1, 1)
+        assert inside.red() == inside.green() == inside.blue()
+        assert abs(inside.red() - 220) <= 1
+        assert result.pixelColor(6, 6).alpha() == 0
+
+    def test_per_image_colors(self, qapp, backend):
+        red, blue = tint_images([_image(), _image()], ["#FF0000", "#0000FF"])
+
+        assert red.pixelColor(1, 1) == QColor("#FF0000")
+        assert blue.pixelColor(1, 1) == QColor("#0000FF")
+
+    def test_keeps_device_pixel_ratio(self, qapp, backend):
+        image = _image()
+        image.setDevicePixelRatio(2.0)
+
+        assert tint_images([image], "#FFFFFF")[0].devicePixelRatio() == 2.0
+
+
+def test_backends_agree(qapp):
+    np = pytest.importorskip("numpy")
+    image = _image("#3366CC", alpha=200)
+
+    cases = (("#FF8800", False), ("#FF8800", True), (None, True))
+    painted = [tint_image(image, color, desaturate) for color, desaturate in cases]
+    icon_tint._np = np
+    try:
+        vectorized = [tint_images([image], color, desaturate)[0] for color, desaturate in cases]
+    finally:
+        icon_tint._np = False
+
+    for p_image, v_image in zip(painted, vectorized):
+        for x, y in ((1, 1), (6, 6)):
+            a, b = p_image.pixelColor(x, y), v_image.pixelColor(x, y)
+            assert all(abs(p - q) <= 2 for p, q in zip(a.getRgb(), b.getRgb()))
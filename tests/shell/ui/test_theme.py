@@ -0,0 +1,146 @@
+"""Tests for src.shell.ui.theme — compiled application stylesheet."""
+
+import pytest
+from unittest.mock import patch
+
+from PyQt6.QtGui import QColor, QIcon
+
+from src.shell.ui import styles
+from src.shell.ui.fonts import get_font
+from src.shell.ui.theme import compile_theme, ensure_theme, install_theme, set_style_property
+
+
+@pytest.fixture
+def default_theme(qapp):
+    """Restore the default theme and host stylesheet after each test."""
+    host_sheet = qapp.styleSheet()
+    install_theme()
+    yield qapp
+    qapp.setStyleSheet(host_sheet)
+    install_theme()
+
+
+def _menu_icon(label="Test App"):
+    from src.shell.ui.material.menu_icon import MenuIcon
+    with patch("src.shell.ui.material.menu_icon.load_icon", return_value=QIcon()):
+        return MenuIcon(label, "")
+
+
+def _surface_color(widget):
+    return QColor(widget.grab().toImage().pixel(widget.width() // 2, 10))
+
+
+class TestCompileTheme:
+    def test_tokens_are_interpolated(self):
+        sheet = compile_theme({"primary": "#123456"})
+
+        assert "#123456" in sheet
+        assert styles.PRIMARY not in sheet
+
+    def test_size_radii_follow_size_variants(self):
+        from src.shell.ui.material.menu_icon import SIZE_VARIANTS
+        sheet = compile_theme()
+
+        for variant in SIZE_VARIANTS.values():
+            assert f"border-radius: {variant.radius}px;" in sheet
+        assert f'[sizeVariant="large"] {{\n    border-radius: {SIZE_VARIANTS["large"].radius}px;' in sheet
+
+    def test_shell_background_rule_comes_first(self):
+        """Widget rules tie with the shell rule on specificity, so order matters."""
+        sheet = compile_theme()
+
+        assert sheet.index("#AppShell QWidget") < sheet.index("QPushButton#MenuIcon")
+
+
+class TestInstallTheme:
+    def test_keeps_host_stylesheet(self, default_theme):
+        app = default_theme
+        app.setStyleSheet("QToolTip { color: red; }")
+        install_theme()
+        install_theme({"primary": "#FF0000"})
+
+        assert app.styleSheet().startswith("QToolTip { color: red; }")
+        assert app.styleSheet().count("QPushButton#MenuIcon {") == 1
+
+    def test_ensure_theme_reinstalls_after_host_replaces_sheet(self, default_theme):
+        app = default_theme
+        app.setStyleSheet("QToolTip { color: red; }")
+
+        ensure_theme()
+
+        assert app.styleSheet().startswith("QToolTip { color: red; }")
+        assert "QPushButton#MenuIcon {" in app.styleSheet()
+
+    def test_ensure_theme_keeps_installed_theme(self, default_theme):
+        app = default_theme
+        install_theme({"primary": "#FF0000"})
+        sheet = app.styleSheet()
+
+        ensure_theme()
+
+        assert app.styleSheet() == sheet
+
+    def test_widget_construction_leaves_app_stylesheet_alone(self, default_theme):
+        app = default_theme
+        app.setStyleSheet("QToolTip { color: red; }")
+
+        _menu_icon()
+
+        assert app.styleSheet() == "QToolTip { color: red; }"
+
+    def test_widgets_carry_no_stylesheet(self, default_theme):
+        icon = _menu_icon()
+
+        assert icon.styleSheet() == ""
+        assert icon.objectName() == "MenuIcon"
+        assert icon.property("state") == "abbreviation"
+
+    def test_runtime_switch_restyles_existing_widgets(self, default_theme):
+        icon = _menu_icon()
+        assert _surface_color(icon) == QColor(styles.PRIMARY)
+
+        install_theme({"primary": "#FF0000"})
+
+        assert _surface_color(icon) == QColor("#FF0000")
+
+
+class TestProperties:
+    def test_variant_property_selects_colors(self, default_theme):
+        icon = _menu_icon()
+        icon.ensurePolished()
+        icon.set_material_style("tertiary")
+
+        assert icon.property("variant") == "tertiary"
+        assert _surface_color(icon) == QColor(styles.TERTIARY_BG)
+
+    def test_size_property_selects_radius(self, default_theme):
+        """``size`` is QWidget's QSize property, so the theme uses ``sizeVariant``"""
+        icon = _menu_icon()
+        icon.ensurePolished()
+        icon.set_material_size("large")
+
+        # (10, 10) lies inside the standard 28px corner but outside the large 36px one
+        corner = QColor(icon.grab().toImage().pixel(10, 10))
+        assert icon.property("sizeVariant") == "large"
+        assert corner != QColor(styles.PRIMARY)
+
+    def test_set_style_property_skips_unchanged_value(self, default_theme):
+        icon = _menu_icon()
+        icon.ensurePolished()
+        with patch.object(icon, "style") as style:
+            set_style_property(icon, "variant", "primary")
+
+        style.assert_not_called()
+
+
+class TestTypography:
+    def test_family_and_weight_come_from_typography_role(self, default_theme):
+        """The theme only sizes the text; family and weight follow get_font"""
+        icon = _menu_icon()
+        icon.ensurePolished()
+
+        role_font = get_font("icon_label")
+        assert "font-family" not in compile_theme()
+        assert icon.font().family() == role_font.family()
+        assert icon.font().weight() == role_font.weight()
+        assert icon.font().pixelSize() == 18  # abbreviation state